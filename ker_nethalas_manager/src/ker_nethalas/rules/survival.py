@@ -0,0 +1,229 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ker_nethalas.content.repository import load_content_json
+from ker_nethalas.rules.checks import resolve_check
+from ker_nethalas.rules.combat import CombatantState, choose_creature_action_for_creature, resolve_attack_check
+
+
+DEFAULT_TAIL_TOLERANCE = 1e-12
+DEFAULT_MAX_ROUNDS = 5000
+
+
+@dataclass(frozen=True)
+class CombatantTemplate:
+    """Hashable snapshot of the combatant fields the survival model reads."""
+
+    side: str
+    creature_id: str | None
+    health: int
+    toughness: int
+    combat_skill: int
+    dodge_skill: int
+    spellward: int
+
+
+@dataclass(frozen=True)
+class TurnOutcomeOdds:
+    health_damage: float
+    toughness_then_health_damage: float
+    toughness_recovery: float
+    health_recovery: float
+
+    @property
+    def no_change(self) -> float:
+        return max(
+            0.0,
+            1.0 - self.health_damage - self.toughness_then_health_damage - self.toughness_recovery - self.health_recovery,
+        )
+
+
+@dataclass(frozen=True)
+class DefeatDistribution:
+    """Rounds until the target reaches 0 Health.
+
+    round_probabilities[k] is the probability the target is defeated in round k + 1.
+    truncated_mass is the probability left undecided when the chain was cut off.
+    """
+
+    round_probabilities: tuple[float, ...]
+    expected_rounds: float
+    truncated_mass: float
+
+    def probability_defeated_by(self, round_number: int) -> float:
+        if round_number < 1:
+            return 0.0
+        return sum(self.round_probabilities[:round_number])
+
+
+def combatant_template(combatant: CombatantState) -> CombatantTemplate:
+    return CombatantTemplate(
+        side=combatant.side,
+        creature_id=combatant.creature_id,
+        health=combatant.health_current,
+        toughness=combatant.toughness_current,
+        combat_skill=combatant.combat_skill,
+        dodge_skill=combatant.dodge_skill,
+        spellward=combatant.spellward,
+    )
+
+
+@lru_cache(maxsize=None)
+def attack_outcome_odds(attacker_skill: int, defender_skill: int, attacker_bonus: int = 10) -> tuple[float, float, float]:
+    """Exact (hit, unavoidable damage, defensive move) odds over every d100 pair.
+
+    Tie rerolls resolve to no effect, matching resolve_enemy_turn.
+    """
+
+    hits = 0
+    unavoidable = 0
+    defensive_moves = 0
+    for attacker_roll in range(1, 101):
+        for defender_roll in range(1, 101):
+            resolution = resolve_attack_check(
+                attacker_skill=attacker_skill,
+                defender_skill=defender_skill,
+                attacker_roll=attacker_roll,
+                defender_roll=defender_roll,
+                attacker_bonus=attacker_bonus,
+            )
+            if resolution.attacker_hits:
+                hits += 1
+            if resolution.unavoidable_damage_to_defender > 0:
+                unavoidable += 1
+            if resolution.defender_makes_defensive_move:
+                defensive_moves += 1
+
+    total = 100 * 100
+    return hits / total, unavoidable / total, defensive_moves / total
+
+
+@lru_cache(maxsize=None)
+def spellward_failure_odds(spellward: int) -> float:
+    failures = sum(1 for roll in range(1, 101) if not resolve_check(spellward, roll).is_success)
+    return failures / 100
+
+
+def _defensive_move_recovery_odds(defender_side: str) -> tuple[float, float]:
+    """Return (toughness, health) recovery odds of a d10 Defensive Move.
+
+    Only effects that change the defender's own Health/Toughness feed the chain.
+    """
+
+    table_name = "player" if defender_side in {"pc", "minion"} else "npc"
+    table = load_content_json("defensive_moves.json")[table_name]
+    toughness = sum(1 for entry in table.values() if entry["effect_id"] == "recover_2_toughness") / 10
+    health = sum(1 for entry in table.values() if entry["effect_id"] == "recover_d4_health") / 10
+    return toughness, health
+
+
+@lru_cache(maxsize=None)
+def enemy_turn_odds(enemy: CombatantTemplate, target: CombatantTemplate) -> TurnOutcomeOdds:
+    """Per-round transition odds for one enemy turn against its locked target."""
+
+    if not enemy.creature_id:
+        raise ValueError("Enemy template is missing creature_id for action lookup.")
+
+    toughness_recovery_rate, health_recovery_rate = _defensive_move_recovery_odds(target.side)
+    health_damage = 0.0
+    toughness_then_health_damage = 0.0
+    toughness_recovery = 0.0
+    health_recovery = 0.0
+
+    for action_roll in range(1, 7):
+        action = choose_creature_action_for_creature(enemy.creature_id, action_roll)
+        weight = 1 / 6
+        if action.action_type == "physical":
+            hit, unavoidable, defensive_move = attack_outcome_odds(enemy.combat_skill, target.dodge_skill)
+            toughness_then_health_damage += weight * hit
+            health_damage += weight * unavoidable
+            toughness_recovery += weight * defensive_move * toughness_recovery_rate
+            health_recovery += weight * defensive_move * health_recovery_rate
+        else:
+            toughness_then_health_damage += weight * spellward_failure_odds(target.spellward)
+
+    return TurnOutcomeOdds(
+        health_damage=health_damage,
+        toughness_then_health_damage=toughness_then_health_damage,
+        toughness_recovery=toughness_recovery,
+        health_recovery=health_recovery,
+    )
+
+
+def _step(
+    distribution: dict[tuple[int, int], float],
+    odds: TurnOutcomeOdds,
+    max_health: int,
+    max_toughness: int,
+) -> tuple[dict[tuple[int, int], float], float]:
+    following: dict[tuple[int, int], float] = {}
+    defeated = 0.0
+    stay = odds.no_change
+
+    def add(health: int, toughness: int, mass: float) -> None:
+        nonlocal defeated
+        if mass <= 0.0:
+            return
+        if health <= 0:
+            defeated += mass
+            return
+        key = (health, toughness)
+        following[key] = following.get(key, 0.0) + mass
+
+    for (health, toughness), mass in distribution.items():
+        add(health, toughness, mass * stay)
+        add(health - 1, toughness, mass * odds.health_damage)
+        if toughness > 0:
+            add(health, toughness - 1, mass * odds.toughness_then_health_damage)
+        else:
+            add(health - 1, toughness, mass * odds.toughness_then_health_damage)
+        # Recovery is capped at the template values, which act as the maximums.
+        add(health, min(max_toughness, toughness + 2), mass * odds.toughness_recovery)
+        for heal in range(1, 5):
+            add(min(max_health, health + heal), toughness, mass * odds.health_recovery / 4)
+
+    return following, defeated
+
+
+@lru_cache(maxsize=None)
+def defeat_distribution(
+    enemy: CombatantTemplate,
+    target: CombatantTemplate,
+    tail_tolerance: float = DEFAULT_TAIL_TOLERANCE,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+) -> DefeatDistribution:
+    """Exact distribution of rounds until the enemy reduces the target to 0 Health.
+
+    The target's Health/Toughness is a Markov chain driven by one enemy turn per
+    round, using the same placeholder damage as resolve_enemy_turn. The chain is
+    propagated until the undecided mass drops below tail_tolerance.
+    """
+
+    if target.health <= 0:
+        return DefeatDistribution(round_probabilities=(), expected_rounds=0.0, truncated_mass=0.0)
+
+    odds = enemy_turn_odds(enemy, target)
+    distribution = {(target.health, max(0, target.toughness)): 1.0}
+    alive = 1.0
+    expected = 0.0
+    round_probabilities: list[float] = []
+
+    while alive > tail_tolerance and len(round_probabilities) < max_rounds:
+        # E[T] = sum over k >= 0 of P(T > k).
+        expected += alive
+        distribution, defeated = _step(distribution, odds, target.health, max(0, target.toughness))
+        round_probabilities.append(defeated)
+        alive = sum(distribution.values())
+
+    if alive > tail_tolerance:
+        expected = float("inf")
+
+    return DefeatDistribution(
+        round_probabilities=tuple(round_probabilities),
+        expected_rounds=expected,
+        truncated_mass=alive,
+    )
+
+
+def expected_rounds_to_defeat(enemy: CombatantState, target: CombatantState) -> float:
+    return defeat_distribution(combatant_template(enemy), combatant_template(target)).expected_rounds
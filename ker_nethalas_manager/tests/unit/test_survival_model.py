@@ -0,0 +1,97 @@
+import math
+
+from ker_nethalas.rules.combat import CombatantState
+from ker_nethalas.rules.survival import (
+    CombatantTemplate,
+    attack_outcome_odds,
+    combatant_template,
+    defeat_distribution,
+    enemy_turn_odds,
+    expected_rounds_to_defeat,
+)
+
+
+HORROR = CombatantTemplate(
+    side="enemy",
+    creature_id="skeletal_horror",
+    health=8,
+    toughness=0,
+    combat_skill=40,
+    dodge_skill=0,
+    spellward=0,
+)
+
+
+def _pc(health: int, toughness: int) -> CombatantTemplate:
+    return CombatantTemplate(
+        side="pc",
+        creature_id=None,
+        health=health,
+        toughness=toughness,
+        combat_skill=60,
+        dodge_skill=40,
+        spellward=20,
+    )
+
+
+def test_attack_outcome_odds_cover_known_rolls() -> None:
+    hit, unavoidable, defensive_move = attack_outcome_odds(attacker_skill=40, defender_skill=40)
+    assert 0.0 < hit < 1.0
+    assert 0.0 < unavoidable < 1.0
+    assert 0.0 < defensive_move < 1.0
+    assert hit + unavoidable + defensive_move <= 1.0
+
+
+def test_single_health_target_defeat_odds_match_turn_odds() -> None:
+    target = _pc(health=1, toughness=0)
+    odds = enemy_turn_odds(HORROR, target)
+    distribution = defeat_distribution(HORROR, target)
+
+    per_round = odds.health_damage + odds.toughness_then_health_damage
+    assert math.isclose(distribution.round_probabilities[0], per_round)
+    assert math.isclose(distribution.expected_rounds, 1 / per_round, rel_tol=1e-9)
+
+
+def test_distribution_sums_to_one() -> None:
+    distribution = defeat_distribution(HORROR, _pc(health=15, toughness=3))
+    total = sum(distribution.round_probabilities) + distribution.truncated_mass
+    assert math.isclose(total, 1.0, rel_tol=1e-9)
+    assert math.isclose(distribution.probability_defeated_by(len(distribution.round_probabilities)), 1.0, rel_tol=1e-9)
+
+
+def test_more_toughness_survives_longer() -> None:
+    fragile = defeat_distribution(HORROR, _pc(health=15, toughness=0))
+    sturdy = defeat_distribution(HORROR, _pc(health=15, toughness=10))
+    assert sturdy.expected_rounds > fragile.expected_rounds
+
+
+def test_defeat_distribution_is_cached_per_matchup() -> None:
+    target = _pc(health=10, toughness=2)
+    assert defeat_distribution(HORROR, target) is defeat_distribution(HORROR, target)
+
+
+def test_expected_rounds_accepts_combatant_state() -> None:
+    enemy = CombatantState(
+        combatant_id="horror_a",
+        side="enemy",
+        creature_id="skeletal_horror",
+        health_current=8,
+        toughness_current=0,
+        combat_skill=40,
+        dodge_skill=0,
+        spellward=0,
+    )
+    target = CombatantState(
+        combatant_id="seraphine",
+        side="pc",
+        creature_id=None,
+        health_current=15,
+        toughness_current=3,
+        combat_skill=60,
+        dodge_skill=40,
+        spellward=20,
+    )
+
+    expected = expected_rounds_to_defeat(enemy, target)
+    assert expected == defeat_distribution(combatant_template(enemy), combatant_template(target)).expected_rounds
+    assert expected > 15
@@ -8,4 +8,8 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
-runpy.run_module("starforged_app", run_name="__main__")
+
+# Guarded so worker processes spawned by the data loader (which re-import
+# this file as __mp_main__) don't launch a second window.
+if __name__ == "__main__":
+    runpy.run_module("starforged_app", run_name="__main__")
@@ -0,0 +1,327 @@
+"""campaign_generator.py – Campaign-launch sectors in bulk, as JSON lines.
+
+Builds starting sectors the way the campaign-launch chapters do, entirely
+from the bundles in bundles.yaml:
+
+* Starforged: a Sector (name, trouble, inciting incident), its settlements
+  (four in the Terminus, three in the Outlands, two in the Expanse), a Planet
+  for every planetside or orbital settlement, then starships and factions.
+* Sundered Isles: a Starting Region (notable location), its islands (four,
+  three or two by region) with a Settlement on every inhabited one, then
+  sailing ships and factions.
+
+Every sector rolls on its own Random seeded from (seed, sector number), so
+the output for a seed is the same however many worker processes share the
+work.  Workers load the data once, generate sectors in chunks and send back
+ready-made JSON lines, which are written in sector order.
+
+Output is one JSON object per line: a "sector" record followed by its
+settlement / planet / island / ship / faction records.  Each has an id, the
+sector number, a name and the bundle results as "details" (label -> result,
+or a list of results for repeated rolls); links between records are by id.
+
+Command line:
+    python src/campaign_generator.py -n 1000 --seed 7 -o sectors.jsonl
+    python src/campaign_generator.py -n 200 --game "Sundered Isles" --region Reaches --cursed-die 10
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Iterator
+
+from oracle_engine import BundlePlan, compile_bundles, run_plan
+
+# Settlements (Starforged) or islands (Sundered Isles) per sector, by region.
+SITES_BY_REGION: dict[str, int] = {
+    "Terminus": 4, "Outlands": 3, "Expanse": 2,
+    "Myriads": 4, "Margins": 3, "Reaches": 2,
+}
+
+# Sectors per task sent to a worker process.
+CHUNK_SECTORS = 50
+
+# Starforged settlement locations that sit on or above a planet.
+_PLANET_LOCATIONS = ("Planetside", "Orbital")
+# Sundered Isles "Visible Habitation" results that leave an island empty.
+_UNINHABITED_PREFIX = "No signs"
+
+# Bundles each game's sectors are built from, by role.
+GAME_BUNDLES: dict[str, dict[str, str]] = {
+    "Starforged": {
+        "sector": "sf_sector", "settlement": "sf_settlement", "planet": "sf_planet",
+        "ship": "sf_starship", "faction": "sf_faction",
+    },
+    "Sundered Isles": {
+        "sector": "si_starting_region", "island": "si_island", "settlement": "si_settlement",
+        "ship": "si_sailing_ship", "faction": "si_faction",
+    },
+}
+
+GAMES = tuple(GAME_BUNDLES)
+
+
+# ---------------------------------------------------------------------------
+# Records
+# ---------------------------------------------------------------------------
+
+
+def _details(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    """label -> result (or list of results) for every item of a run_plan() result that rolled."""
+    details: dict[str, Any] = {}
+    for entry in entries:
+        if entry["fixed"] is not None:
+            details[entry["label"]] = entry["fixed"]
+            continue
+        results = [roll["result"] for roll in entry["rolls"]]
+        if results:
+            details[entry["label"]] = results[0] if len(results) == 1 else results
+    return details
+
+
+def _head(text: str) -> str:
+    """The name before the colon, e.g. "Kyrody Dominion" from "Kyrody Dominion: Expansive empire..."."""
+    return text.split(":", 1)[0].strip()
+
+
+def _faction_name(details: dict[str, Any]) -> str:
+    """Fill the Starforged faction name template, e.g. "Identity of the Legacy Affiliation"."""
+    template = details.get("Name Template", "Legacy Affiliation").replace("null the*", "of the")
+    words = [details.get(word, word) if word in ("Legacy", "Affiliation", "Identity") else word
+             for word in template.split()]
+    return " ".join(words)
+
+
+# ---------------------------------------------------------------------------
+# Generator
+# ---------------------------------------------------------------------------
+
+
+class CampaignGenerator:
+    """Rolls whole sectors from load_all_data() output, independent of Tk."""
+
+    def __init__(self, data: dict[str, Any] | None = None, cursed_die: int = 0) -> None:
+        if data is None:
+            from loader import load_all_data
+            data = load_all_data(parallel=False)
+        self.oracle_by_id: dict[str, dict[str, Any]] = data["oracle_by_id"]
+        self.game_regions: dict[str, list[str]] = data.get("game_regions", {})
+        self.cursed_die = cursed_die
+        self.plans: dict[str, BundlePlan] = compile_bundles(data.get("bundles", []), self.oracle_by_id)
+
+    def regions(self, game: str) -> list[str]:
+        """Regions of *game* that have a sector layout."""
+        return [region for region in self.game_regions.get(game, []) if region in SITES_BY_REGION]
+
+    def problems(self, game: str) -> list[str]:
+        """Missing bundles or content errors that would spoil *game*'s sectors."""
+        problems: list[str] = []
+        for bundle_id in GAME_BUNDLES[game].values():
+            plan = self.plans.get(bundle_id)
+            if plan is None:
+                problems.append(f"bundle not found: {bundle_id}")
+            else:
+                problems.extend(f"{bundle_id}: {message}" for message in plan.problems)
+        if not self.regions(game):
+            problems.append(f"no regions for {game}")
+        return problems
+
+    def sector(
+        self, number: int, game: str, region: str = "", seed: int = 0, ships: int = 2, factions: int = 2
+    ) -> list[dict[str, Any]]:
+        """The records of sector *number*, sector record first.  An empty *region* picks one at random."""
+        rng = random.Random(f"{seed}/{number}")
+        roller = _SectorRoller(self, number, game, region or rng.choice(self.regions(game)), rng)
+        if game == "Starforged":
+            _starforged_sites(roller)
+            ship_label, faction_name = "Starship Name", _faction_name
+        else:
+            _sundered_isles_sites(roller)
+            ship_label, faction_name = "Ship Name", lambda details: _head(details.get("Faction Name", ""))
+        for _ in range(ships):
+            ship = roller.roll("ship")
+            roller.add("ship", ship.get(ship_label), ship)
+        for _ in range(factions):
+            faction = roller.roll("faction")
+            roller.add("faction", faction_name(faction), faction)
+        roller.records[0]["seed"] = seed
+        return roller.records
+
+    def iter_lines(
+        self, numbers: range, game: str, region: str = "", seed: int = 0, ships: int = 2, factions: int = 2
+    ) -> Iterator[str]:
+        """JSON lines (without newlines) for the sectors in *numbers*."""
+        for number in numbers:
+            for record in self.sector(number, game, region, seed, ships, factions):
+                yield json.dumps(record, ensure_ascii=False)
+
+
+class _SectorRoller:
+    """Rolls one sector's bundles on its own rng and collects the records."""
+
+    def __init__(self, generator: CampaignGenerator, number: int, game: str, region: str, rng: random.Random) -> None:
+        self.plans = generator.plans
+        self.bundles = GAME_BUNDLES[game]
+        self.cursed_die = generator.cursed_die
+        self.number = number
+        self.game = game
+        self.region = region
+        self.rng = rng
+        self.records: list[dict[str, Any]] = []
+        self._counts: dict[str, int] = {}
+
+    def roll(self, role: str) -> dict[str, Any]:
+        plan = self.plans[self.bundles[role]]
+        return _details(run_plan(plan, self.region, None, self.cursed_die, self.rng))
+
+    def add(self, kind: str, name: str | None, details: dict[str, Any], **links: str) -> str:
+        """Append a record; returns its id."""
+        count = self._counts[kind] = self._counts.get(kind, 0) + 1
+        record_id = str(self.number) if kind == "sector" else f"{self.number}/{kind}/{count}"
+        self.records.append({
+            "kind": kind, "id": record_id, "sector": self.number, "game": self.game, "region": self.region,
+            "name": name, **links, "details": details,
+        })
+        return record_id
+
+
+def _starforged_sites(roller: _SectorRoller) -> None:
+    sector = roller.roll("sector")
+    roller.add("sector", f"{sector.get('Sector Prefix', '')} {sector.get('Sector Suffix', '')}".strip(), sector)
+    for _ in range(SITES_BY_REGION[roller.region]):
+        settlement = roller.roll("settlement")
+        links: dict[str, str] = {}
+        if settlement.get("Location") in _PLANET_LOCATIONS:
+            planet = roller.roll("planet")
+            links["planet"] = roller.add("planet", planet.get("Planet Name"), planet)
+        roller.add("settlement", settlement.get("Settlement Name"), settlement, **links)
+
+
+def _sundered_isles_sites(roller: _SectorRoller) -> None:
+    roller.add("sector", None, roller.roll("sector"))
+    for _ in range(SITES_BY_REGION[roller.region]):
+        island = roller.roll("island")
+        island_id = roller.add("island", island.get("Island Name"), island)
+        if not str(island.get("Visible Habitation", "")).startswith(_UNINHABITED_PREFIX):
+            settlement = roller.roll("settlement")
+            roller.add("settlement", settlement.get("Settlement Name"), settlement, island=island_id)
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+# ---------------------------------------------------------------------------
+
+_WORKER: CampaignGenerator | None = None
+
+
+def _init_worker(cursed_die: int) -> None:
+    global _WORKER
+    _WORKER = CampaignGenerator(cursed_die=cursed_die)
+
+
+def _generate_chunk(job: tuple[int, int, str, str, int, int, int]) -> tuple[str, int]:
+    """Sectors start..stop-1 as one block of JSON lines, with its line count."""
+    assert _WORKER is not None
+    start, stop, game, region, seed, ships, factions = job
+    lines = list(_WORKER.iter_lines(range(start, stop), game, region, seed, ships, factions))
+    return "".join(line + "\n" for line in lines), len(lines)
+
+
+def generate(
+    out: Any,
+    count: int,
+    game: str = "Starforged",
+    region: str = "",
+    seed: int = 0,
+    ships: int = 2,
+    factions: int = 2,
+    cursed_die: int = 0,
+    workers: int | None = None,
+    generator: CampaignGenerator | None = None,
+) -> int:
+    """Write sectors 1..count to the text stream *out*; returns the number of records.
+
+    Chunks of CHUNK_SECTORS sectors go to *workers* processes (default: one
+    per CPU); with one worker, or where processes can't be started, the
+    sectors are generated here.  The output is the same either way.
+    """
+    jobs = [
+        (start, min(start + CHUNK_SECTORS, count + 1), game, region, seed, ships, factions)
+        for start in range(1, count + 1, CHUNK_SECTORS)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    written = 0
+    done = 0
+    if workers >= 2:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cursed_die,)) as pool:
+                for text, lines in pool.map(_generate_chunk, jobs):
+                    out.write(text)
+                    written += lines
+                    done += 1
+        except (OSError, BrokenProcessPool):
+            # Sandboxed or frozen environments may refuse to spawn workers;
+            # carry on here from the first chunk not yet written.
+            pass
+
+    if done < len(jobs):
+        generator = generator or CampaignGenerator(cursed_die=cursed_die)
+        for start, stop, *_ in jobs[done:]:
+            for line in generator.iter_lines(range(start, stop), game, region, seed, ships, factions):
+                out.write(line + "\n")
+                written += 1
+    return written
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate campaign-launch sectors as JSON lines.")
+    parser.add_argument("-n", type=int, default=1, help="Number of sectors (default: 1)")
+    parser.add_argument("--game", choices=GAMES, default="Starforged", help="Game (default: Starforged)")
+    parser.add_argument("--region", default="", help="Region for every sector (default: random per sector)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output (default: random)")
+    parser.add_argument("--ships", type=int, default=2, help="Ships per sector (default: 2)")
+    parser.add_argument("--factions", type=int, default=2, help="Factions per sector (default: 2)")
+    parser.add_argument("--cursed-die", type=int, default=0, metavar="SIDES",
+                        help="Also roll a cursed die with this many sides (e.g. 10)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("-o", "--output", default="", help="Write to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    generator = CampaignGenerator(cursed_die=args.cursed_die)
+    regions = generator.regions(args.game)
+    if args.region and args.region not in regions:
+        raise SystemExit(f"Unknown region for {args.game}: {args.region!r} (choose from {', '.join(regions)})")
+    problems = generator.problems(args.game)
+    if problems:
+        raise SystemExit("Cannot build sectors: " + "; ".join(problems))
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+
+    started = time.perf_counter()
+    try:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="\n") as out:
+                records = generate(out, max(0, args.n), args.game, args.region, seed, max(0, args.ships),
+                                   max(0, args.factions), args.cursed_die, args.workers, generator)
+        else:
+            records = generate(sys.stdout, max(0, args.n), args.game, args.region, seed, max(0, args.ships),
+                               max(0, args.factions), args.cursed_die, args.workers, generator)
+    except BrokenPipeError:
+        return 0
+    elapsed = time.perf_counter() - started
+    print(f"{max(0, args.n)} sectors, {records} records in {elapsed:.2f}s (seed {seed})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""character_store.py – Background persistence for the character roster.
+
+Saving a character used to rewrite all of user_characters.json on the Tk
+thread.  CharacterStore instead records which characters changed, and its
+DebouncedWriter thread appends one compact line per changed character to
+user_characters.journal.  Every COMPACT_AFTER journal lines (and on close)
+the roster is written back to user_characters.json through a temp file and
+rename, and the journal is removed.  loader.load_characters() replays any
+journal left behind by a crash.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import os
+from typing import Any
+
+from debounced_writer import DebouncedWriter
+from loader import CHARACTERS_JOURNAL, apply_character_journal_entry, save_characters
+
+COMPACT_AFTER = 200
+
+
+class CharacterStore(DebouncedWriter):
+    """Owns the persisted copy of the roster; call put()/delete() from the Tk thread."""
+
+    def __init__(self, characters: list[dict[str, Any]]) -> None:
+        self._characters = copy.deepcopy(characters)
+        self._dirty: set[str] = set()
+        self._journal_lines = 0
+        super().__init__("character-store")
+
+    def put(self, character: dict[str, Any]) -> None:
+        """Queue *character* (matched by id) to be saved."""
+        snapshot = copy.deepcopy(character)
+        with self._cond:
+            apply_character_journal_entry(self._characters, {"op": "put", "character": snapshot})
+            self._dirty.add(str(snapshot.get("id", "")))
+            self._cond.notify()
+
+    def delete(self, char_id: str) -> None:
+        with self._cond:
+            apply_character_journal_entry(self._characters, {"op": "delete", "id": char_id})
+            self._dirty.add(char_id)
+            self._cond.notify()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _writer_started(self) -> None:
+        if CHARACTERS_JOURNAL.exists():
+            # A journal left by a crash was already replayed by load_characters();
+            # fold it into the snapshot so a torn last line can't swallow new entries.
+            self._compact()
+
+    def _pending(self) -> bool:
+        return bool(self._dirty)
+
+    def _written(self, closing: bool) -> None:
+        # close() also compacts, so the journal doesn't outlive the session.
+        if self._journal_lines and (closing or self._journal_lines >= COMPACT_AFTER):
+            self._compact()
+
+    def _write_pending(self) -> None:
+        with self._cond:
+            dirty, self._dirty = self._dirty, set()
+            by_id = {str(c.get("id", "")): c for c in self._characters}
+        if not dirty:
+            return
+        entries = [
+            {"op": "put", "character": by_id[char_id]} if char_id in by_id else {"op": "delete", "id": char_id}
+            for char_id in sorted(dirty)
+        ]
+        try:
+            with CHARACTERS_JOURNAL.open("a", encoding="utf-8") as fh:
+                for entry in entries:
+                    fh.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+        except OSError:
+            # Keep the changes queued; the next write or compaction retries them.
+            with self._cond:
+                self._dirty |= dirty
+            return
+        self._journal_lines += len(entries)
+
+    def _compact(self) -> None:
+        with self._cond:
+            characters = list(self._characters)
+        try:
+            save_characters(characters)
+        except OSError:
+            return
+        self._journal_lines = 0
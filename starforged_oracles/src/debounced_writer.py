@@ -0,0 +1,73 @@
+"""debounced_writer.py – Writer thread shared by the background-saving stores.
+
+SettingsStore and CharacterStore keep their data in memory and save it from a
+writer thread.  DebouncedWriter owns that thread: a change wakes it, it waits
+WRITE_DELAY seconds so a burst of changes becomes one write, then calls the
+store's _write_pending().  close() flushes whatever is pending and stops it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+# Seconds to wait after a change before writing, so bursts of changes coalesce.
+WRITE_DELAY = 0.5
+
+
+class DebouncedWriter:
+    """Base class for a store saved from a writer thread.
+
+    Subclasses set up their own state and then call ``super().__init__()``,
+    which starts the thread.  They change that state while holding ``_cond``
+    and call ``_cond.notify()``; the thread runs ``_write_pending()`` once
+    ``_pending()`` says there is something to write.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._closing = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write outstanding changes and stop the writer."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Hooks
+    # ------------------------------------------------------------------
+
+    def _pending(self) -> bool:
+        """Whether a change is waiting to be written; called with ``_cond`` held."""
+        raise NotImplementedError
+
+    def _write_pending(self) -> None:
+        """Save the pending changes; on failure, leave them pending for a retry."""
+        raise NotImplementedError
+
+    def _writer_started(self) -> None:
+        """Runs on the writer thread before it waits for the first change."""
+
+    def _written(self, closing: bool) -> None:
+        """Runs on the writer thread after each _write_pending()."""
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        self._writer_started()
+        while True:
+            with self._cond:
+                while not self._pending() and not self._closing:
+                    self._cond.wait()
+                closing = self._closing
+            if not closing:
+                time.sleep(WRITE_DELAY)
+            self._write_pending()
+            self._written(closing)
+            if closing:
+                return
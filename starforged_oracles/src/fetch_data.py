@@ -5,17 +5,30 @@ Run once before launching starforged_app.py:
 
 Files are saved to the data/ directory relative to the project root.
 Requires an internet connection.
+
+Downloads run concurrently (see --connections).  The ETag / Last-Modified
+of every file is kept in data/.fetch_manifest.json, so later runs send
+conditional requests and leave unchanged files alone (--force re-downloads
+everything).  --base-url, or the STARFORGED_DATA_URL environment variable,
+points the fetcher at a mirror, e.g. a local ``python -m http.server``.
 """
 from __future__ import annotations
 
+import argparse
+import json
+import os
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-BASE_RAW = "https://raw.githubusercontent.com/rsek/datasworn/main/source_data"
-BASE_SF = f"{BASE_RAW}/starforged"
-BASE_SI = f"{BASE_RAW}/sundered_isles"
-BASE_IS = f"{BASE_RAW}/classic"
+BASE_RAW = os.environ.get(
+    "STARFORGED_DATA_URL", "https://raw.githubusercontent.com/rsek/datasworn/main/source_data"
+).rstrip("/")
+SF_DIR = "starforged"
+SI_DIR = "sundered_isles"
+IS_DIR = "classic"
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 SF_ORACLES_DIR = DATA_DIR / "sf_oracles"
@@ -24,13 +37,20 @@ IS_ORACLES_DIR = DATA_DIR / "is_oracles"
 SF_ASSETS_DIR = DATA_DIR / "sf_assets"
 SI_ASSETS_DIR = DATA_DIR / "si_assets"
 IS_ASSETS_DIR = DATA_DIR / "is_assets"
+MANIFEST_JSON = DATA_DIR / ".fetch_manifest.json"
+
+DEFAULT_CONNECTIONS = 6
+TIMEOUT = 20
+RETRIES = 3
+BACKOFF = 0.5  # seconds, doubled after each failed attempt
 
 # ---------------------------------------------------------------------------
 # Files to download
 # ---------------------------------------------------------------------------
 
+# Move files are (path under the base URL, local file name in data/).
 SF_FILES: list[tuple[str, str]] = [
-    (f"{BASE_SF}/moves.yaml", "starforged_moves.yaml"),
+    (f"{SF_DIR}/moves.yaml", "starforged_moves.yaml"),
 ]
 
 SF_ORACLE_FILES: list[str] = [
@@ -53,7 +73,7 @@ SF_ORACLE_FILES: list[str] = [
 ]
 
 SI_MOVE_FILES: list[tuple[str, str]] = [
-    (f"{BASE_SI}/moves/session.yaml", "si_session_moves.yaml"),
+    (f"{SI_DIR}/moves/session.yaml", "si_session_moves.yaml"),
 ]
 
 SF_ASSET_FILES: list[str] = [
@@ -117,16 +137,92 @@ SI_ORACLE_FILES: list[str] = [
 # ---------------------------------------------------------------------------
 
 
-def _download(url: str, dest: Path) -> bool:
-    print(f"  {dest.name:<40} ", end="", flush=True)
+def _jobs(base_url: str) -> list[tuple[str, str, Path]]:
+    """Return (section, url, destination) for every file, in display order."""
+    jobs: list[tuple[str, str, Path]] = []
+    for path, filename in SF_FILES:
+        jobs.append(("Starforged moves", f"{base_url}/{path}", DATA_DIR / filename))
+    for path, filename in SI_MOVE_FILES:
+        jobs.append(("Sundered Isles session moves", f"{base_url}/{path}", DATA_DIR / filename))
+    for section, remote_dir, names, dest_dir in (
+        ("Starforged assets", f"{SF_DIR}/assets", SF_ASSET_FILES, SF_ASSETS_DIR),
+        ("Sundered Isles assets", f"{SI_DIR}/assets", SI_ASSET_FILES, SI_ASSETS_DIR),
+        ("Starforged oracles", f"{SF_DIR}/oracles", SF_ORACLE_FILES, SF_ORACLES_DIR),
+        ("Ironsworn oracles", f"{IS_DIR}/oracles", IS_ORACLE_FILES, IS_ORACLES_DIR),
+        ("Ironsworn assets", f"{IS_DIR}/assets", IS_ASSET_FILES, IS_ASSETS_DIR),
+        ("Sundered Isles oracles", f"{SI_DIR}/oracles", SI_ORACLE_FILES, SI_ORACLES_DIR),
+    ):
+        for fname in names:
+            jobs.append((section, f"{base_url}/{remote_dir}/{fname}", dest_dir / fname))
+    return jobs
+
+
+def _manifest_key(dest: Path) -> str:
+    return dest.relative_to(DATA_DIR).as_posix()
+
+
+def _load_manifest() -> dict[str, dict[str, str]]:
     try:
-        with urllib.request.urlopen(url, timeout=20) as resp:  # noqa: S310
-            dest.write_bytes(resp.read())
-        print("OK")
-        return True
-    except urllib.error.URLError as exc:
-        print(f"FAILED  ({exc})")
-        return False
+        data = json.loads(MANIFEST_JSON.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_manifest(manifest: dict[str, dict[str, str]]) -> None:
+    tmp = MANIFEST_JSON.with_name(MANIFEST_JSON.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, MANIFEST_JSON)
+
+
+def _write_atomic(dest: Path, payload: bytes) -> None:
+    tmp = dest.with_name(dest.name + ".part")
+    tmp.write_bytes(payload)
+    os.replace(tmp, dest)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, urllib.error.HTTPError):
+        return exc.code in (408, 429) or exc.code >= 500
+    return isinstance(exc, (urllib.error.URLError, TimeoutError, ConnectionError))
+
+
+def _download(url: str, dest: Path, validators: dict[str, str] | None) -> tuple[str, dict[str, str] | None]:
+    """Fetch *url* into *dest*; return (status, validators to remember).
+
+    status is "updated", "unchanged" or "failed (<reason>)".  *validators* is
+    the manifest entry from the last successful download of this file.
+    """
+    headers: dict[str, str] = {}
+    if validators and dest.exists() and validators.get("url") == url:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    delay = BACKOFF
+    for attempt in range(1, RETRIES + 1):
+        try:
+            request = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(request, timeout=TIMEOUT) as resp:  # noqa: S310
+                payload = resp.read()
+                etag = resp.headers.get("ETag", "")
+                last_modified = resp.headers.get("Last-Modified", "")
+            _write_atomic(dest, payload)
+            return "updated", {"url": url, "etag": etag, "last_modified": last_modified}
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304:
+                return "unchanged", validators
+            if attempt == RETRIES or not _is_retryable(exc):
+                return f"failed ({exc})", None
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as exc:
+            if attempt == RETRIES:
+                return f"failed ({exc})", None
+        except OSError as exc:
+            return f"failed ({exc})", None
+        time.sleep(delay)
+        delay *= 2
+    return "failed", None
 
 
 # ---------------------------------------------------------------------------
@@ -134,62 +230,61 @@ def _download(url: str, dest: Path) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    SF_ORACLES_DIR.mkdir(parents=True, exist_ok=True)
-    SI_ORACLES_DIR.mkdir(parents=True, exist_ok=True)
-    IS_ORACLES_DIR.mkdir(parents=True, exist_ok=True)
-    SF_ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-    SI_ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-    IS_ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+def fetch_all(
+    base_url: str = BASE_RAW,
+    connections: int = DEFAULT_CONNECTIONS,
+    force: bool = False,
+) -> list[str]:
+    """Download every data file; return the names of those that failed."""
+    for d in (DATA_DIR, SF_ORACLES_DIR, SI_ORACLES_DIR, IS_ORACLES_DIR, SF_ASSETS_DIR, SI_ASSETS_DIR, IS_ASSETS_DIR):
+        d.mkdir(parents=True, exist_ok=True)
 
+    jobs = _jobs(base_url.rstrip("/"))
+    manifest = {} if force else _load_manifest()
     failed: list[str] = []
+    counts = {"updated": 0, "unchanged": 0}
+
+    print(f"Fetching {len(jobs)} files from {base_url} ({connections} connections)…")
+    with ThreadPoolExecutor(max_workers=max(1, connections)) as pool:
+        futures = [
+            pool.submit(_download, url, dest, manifest.get(_manifest_key(dest)))
+            for _section, url, dest in jobs
+        ]
+        current_section = ""
+        # Results are reported in job order so sections stay grouped.
+        for (section, _url, dest), future in zip(jobs, futures):
+            status, validators = future.result()
+            if section != current_section:
+                print(f"\n{section}")
+                current_section = section
+            label = {"updated": "OK", "unchanged": "unchanged"}.get(status, status.replace("failed", "FAILED ", 1))
+            print(f"  {dest.name:<40} {label}")
+            if status in counts:
+                counts[status] += 1
+                manifest[_manifest_key(dest)] = validators or {}
+            else:
+                failed.append(dest.name)
+
+    try:
+        _save_manifest(manifest)
+    except OSError as exc:
+        print(f"\nCould not save {MANIFEST_JSON.name}: {exc}")
+
+    print(f"\n{counts['updated']} updated, {counts['unchanged']} unchanged, {len(failed)} failed.")
+    return failed
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Download the oracle, move and asset data files.")
+    parser.add_argument("--base-url", default=BASE_RAW,
+                        help="Root URL of the datasworn source_data tree (default: %(default)s)")
+    parser.add_argument("--connections", type=int, default=DEFAULT_CONNECTIONS,
+                        help="Maximum simultaneous downloads (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore the manifest and re-download every file")
+    args = parser.parse_args(argv)
 
-    print("Downloading Starforged move data…")
-    for url, filename in SF_FILES:
-        if not _download(url, DATA_DIR / filename):
-            failed.append(filename)
-
-    print("\nDownloading Sundered Isles session moves…")
-    for url, filename in SI_MOVE_FILES:
-        if not _download(url, DATA_DIR / filename):
-            failed.append(filename)
-
-    print("\nDownloading Starforged asset data…")
-    for fname in SF_ASSET_FILES:
-        url = f"{BASE_SF}/assets/{fname}"
-        if not _download(url, SF_ASSETS_DIR / fname):
-            failed.append(fname)
-
-    print("\nDownloading Sundered Isles asset data…")
-    for fname in SI_ASSET_FILES:
-        url = f"{BASE_SI}/assets/{fname}"
-        if not _download(url, SI_ASSETS_DIR / fname):
-            failed.append(fname)
-
-    print("\nDownloading Starforged oracle tables…")
-    for fname in SF_ORACLE_FILES:
-        url = f"{BASE_SF}/oracles/{fname}"
-        if not _download(url, SF_ORACLES_DIR / fname):
-            failed.append(fname)
-
-    print("\nDownloading Ironsworn oracle tables…")
-    for fname in IS_ORACLE_FILES:
-        url = f"{BASE_IS}/oracles/{fname}"
-        if not _download(url, IS_ORACLES_DIR / fname):
-            failed.append(fname)
-
-    print("\nDownloading Ironsworn asset data…")
-    for fname in IS_ASSET_FILES:
-        url = f"{BASE_IS}/assets/{fname}"
-        if not _download(url, IS_ASSETS_DIR / fname):
-            failed.append(fname)
-
-    print("\nDownloading Sundered Isles oracle tables…")
-    for fname in SI_ORACLE_FILES:
-        url = f"{BASE_SI}/oracles/{fname}"
-        if not _download(url, SI_ORACLES_DIR / fname):
-            failed.append(fname)
+    failed = fetch_all(args.base_url, args.connections, args.force)
 
     print()
     if failed:
@@ -198,7 +293,7 @@ def main() -> None:
             print(f"  • {f}")
         print("Re-run fetch_data.py when connectivity is restored.")
     else:
-        print("All files downloaded successfully.")
+        print("All files are up to date.")
 
     print("\nTo launch the app:")
     print("  python src/starforged_app.py")
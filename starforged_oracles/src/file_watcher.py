@@ -0,0 +1,49 @@
+"""file_watcher.py – Poll a directory for changed files.
+
+Used to hot-reload custom oracle packs while they are being written.  Polling
+one small directory costs a single scandir() per interval and works the same
+on Windows, macOS and Linux without extra dependencies.
+"""
+from __future__ import annotations
+
+import fnmatch
+import os
+from pathlib import Path
+
+
+class DirectoryWatcher:
+    """Report files under *directory* matching *pattern* that were added, changed or removed."""
+
+    def __init__(self, directory: Path, pattern: str = "*.yaml") -> None:
+        self.directory = directory
+        self.pattern = pattern
+        self._seen = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        """path -> (mtime_ns, size) for every matching file."""
+        found: dict[Path, tuple[int, int]] = {}
+        try:
+            entries = os.scandir(self.directory)
+        except OSError:
+            return found
+        with entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, self.pattern):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if entry.is_file():
+                    found[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        return found
+
+    def poll(self) -> list[Path]:
+        """Paths whose state differs from the previous poll, sorted."""
+        current = self._snapshot()
+        changed = [
+            path for path in current.keys() | self._seen.keys()
+            if current.get(path) != self._seen.get(path)
+        ]
+        self._seen = current
+        return sorted(changed)
@@ -8,10 +8,18 @@ Data format (simple YAML):
 """
 from __future__ import annotations
 
+import argparse
 import copy
+import hashlib
 import json
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import sys
 
@@ -20,6 +28,10 @@ try:
 except ModuleNotFoundError:
     raise SystemExit("PyYAML is not installed.  Run:  pip install pyyaml")
 
+from oracle_index import compile_move_tables, compile_tables
+from oracle_store import compact_oracles
+from startup_profile import PROFILE
+
 # ---------------------------------------------------------------------------
 # Paths  –  work both in development and when frozen by PyInstaller
 # ---------------------------------------------------------------------------
@@ -35,6 +47,9 @@ SI_MOVES_YAML = DATA_DIR / "sundered_isles_moves.yaml"
 SF_ORACLES_DIR = DATA_DIR / "sf_oracles"
 SI_ORACLES_DIR = DATA_DIR / "si_oracles"
 CUSTOM_ORACLES_DIR = DATA_DIR / "custom_oracles"
+# Custom packs are Sundered Isles oracles, loaded after the built-in ones.
+CUSTOM_ORACLES_LABEL = "Sundered Isles"
+CUSTOM_ORACLES_SLOT = "si_oracles"
 IS_ORACLES_DIR = DATA_DIR / "is_oracles"
 SF_ASSETS_YAML = DATA_DIR / "sf_assets.yaml"
 SI_ASSETS_YAML = DATA_DIR / "si_assets.yaml"
@@ -42,17 +57,36 @@ IS_ASSETS_YAML = DATA_DIR / "is_assets.yaml"
 BUNDLES_YAML = DATA_DIR / "bundles.yaml"
 SETTINGS_JSON = DATA_DIR / "user_settings.json"
 CHARACTERS_JSON = DATA_DIR / "user_characters.json"
+CHARACTERS_JOURNAL = DATA_DIR / "user_characters.journal"
+CACHE_PICKLE = DATA_DIR / ".compiled_cache.pickle"
 
 # ---------------------------------------------------------------------------
 # YAML loading
 # ---------------------------------------------------------------------------
 
-def load_yaml(path: Path) -> dict[str, Any]:
+# Prefer the libyaml-backed loader when PyYAML was built with it; it parses
+# the same documents several times faster than the pure-Python SafeLoader.
+try:
+    _YAML_LOADER: type = yaml.CSafeLoader
+    YAML_BACKEND = "libyaml"
+except AttributeError:
+    _YAML_LOADER = yaml.SafeLoader
+    YAML_BACKEND = "pure-python"
+
+
+def _read_bytes(path: Path) -> bytes:
     try:
-        raw = path.read_text(encoding="utf-8")
+        return path.read_bytes()
     except OSError as exc:
         raise SystemExit(f"Cannot open data file {path.name}.") from exc
-    return yaml.safe_load(raw) or {}
+
+
+def _parse_yaml(raw: bytes, loader: type | None = None) -> dict[str, Any]:
+    return yaml.load(raw.decode("utf-8"), Loader=loader or _YAML_LOADER) or {}  # noqa: S506
+
+
+def load_yaml(path: Path) -> dict[str, Any]:
+    return _parse_yaml(_read_bytes(path))
 
 
 # ---------------------------------------------------------------------------
@@ -130,6 +164,172 @@ def extract_moves(data: dict[str, Any], fallback_label: str) -> list[dict[str, A
     return out
 
 
+# ---------------------------------------------------------------------------
+# Compiled cache  (extracted lists pickled to data/.compiled_cache.pickle)
+# ---------------------------------------------------------------------------
+#
+# Each entry is keyed by the file path relative to DATA_DIR and stores the
+# file's mtime, size and SHA-1 alongside the extracted value.  A matching
+# mtime/size is trusted as-is; otherwise the file is hashed and only re-parsed
+# when its contents actually changed.  Bump _CACHE_VERSION whenever an
+# extractor's output shape changes.
+
+_CACHE_VERSION = 1
+
+# Per-game loads may run on a background thread; serialise cache rewrites.
+_CACHE_LOCK = threading.Lock()
+
+_EXTRACTORS: dict[str, Callable[[dict[str, Any], str], Any]] = {
+    "oracles": extract_oracles,
+    "assets": extract_assets,
+    "moves": extract_moves,
+    "raw": lambda data, _label: data,
+}
+
+
+def _load_cache() -> dict[str, Any]:
+    try:
+        with CACHE_PICKLE.open("rb") as fh:
+            cache = pickle.load(fh)
+    except Exception:
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+        return {}
+    return cache.get("files") or {}
+
+
+def _save_cache(entries: dict[str, Any]) -> None:
+    tmp = CACHE_PICKLE.with_suffix(".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            pickle.dump({"version": _CACHE_VERSION, "files": entries}, fh, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, CACHE_PICKLE)
+    except OSError:
+        # Read-only installs (e.g. a frozen build) simply run uncached.
+        pass
+
+
+def _cache_key(path: Path) -> str:
+    try:
+        return path.relative_to(DATA_DIR).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _extract_raw(raw: bytes, kind: str, fallback_label: str) -> Any:
+    """Parse and extract one file's bytes.  Top-level so worker processes can run it."""
+    return _EXTRACTORS[kind](_parse_yaml(raw), fallback_label)
+
+
+def _extract_timed(raw: bytes, kind: str, fallback_label: str) -> tuple[Any, float]:
+    """_extract_raw() plus the seconds it took where it ran (for --profile-startup)."""
+    start = time.perf_counter()
+    return _extract_raw(raw, kind, fallback_label), time.perf_counter() - start
+
+
+class _CompiledCache:
+    """Per-load view of the compiled cache; tracks hits and rewrites."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        with PROFILE.span("data", _cache_key(CACHE_PICKLE)):
+            self._old: dict[str, Any] = _load_cache() if enabled else {}
+        self._new: dict[str, Any] = {}
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+
+    def lookup(self, path: Path, kind: str, fallback_label: str) -> tuple[bool, Any]:
+        """Return (True, value) on a cache hit, else (False, raw_bytes) to be extracted."""
+        key = _cache_key(path)
+        try:
+            st = path.stat()
+        except OSError as exc:
+            raise SystemExit(f"Cannot open data file {path.name}.") from exc
+        entry = self._old.get(key)
+        if entry and (entry["kind"], entry["label"]) != (kind, fallback_label):
+            entry = None
+
+        if entry and (entry["mtime_ns"], entry["size"]) == (st.st_mtime_ns, st.st_size):
+            self._new[key] = entry
+            return True, entry["value"]
+
+        raw = _read_bytes(path)
+        new_entry = {
+            "kind": kind,
+            "label": fallback_label,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha1": hashlib.sha1(raw).hexdigest(),
+        }
+        self._dirty = True
+        if entry and entry["sha1"] == new_entry["sha1"]:
+            new_entry["value"] = entry["value"]
+            self._new[key] = new_entry
+            return True, entry["value"]
+
+        self._pending[key] = new_entry
+        return False, raw
+
+    def store(self, path: Path, value: Any) -> None:
+        key = _cache_key(path)
+        entry = self._pending.pop(key)
+        entry["value"] = value
+        self._new[key] = entry
+
+    def load(self, path: Path, kind: str, fallback_label: str) -> Any:
+        hit, value = self.lookup(path, kind, fallback_label)
+        if not hit:
+            value = _extract_raw(value, kind, fallback_label)
+            self.store(path, value)
+        return value
+
+    def save(self, scanned: list[Path]) -> None:
+        """Merge this load's entries into the on-disk cache.
+
+        Entries for other files (e.g. another game's tables) are kept unless
+        the file no longer exists; scanned is the full file list of this load.
+        """
+        if not self.enabled:
+            return
+        scanned_keys = {_cache_key(path) for path in scanned}
+        dropped = (self._old.keys() - self._new.keys()) & scanned_keys
+        if not self._dirty and not dropped:
+            return
+        with _CACHE_LOCK:
+            merged = _load_cache()
+            merged.update(self._new)
+            for key in list(merged):
+                if key not in self._new and not (DATA_DIR / key).exists():
+                    del merged[key]
+            _save_cache(merged)
+
+
+# ---------------------------------------------------------------------------
+# Parallel extraction
+# ---------------------------------------------------------------------------
+
+# Below this many cache misses a worker pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 4
+
+
+def _extract_many(jobs: list[tuple[bytes, str, str]], parallel: bool) -> list[tuple[Any, float]]:
+    """Extract every (raw, kind, label) job into (value, seconds); results keep the order of jobs."""
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if not parallel or workers < 2 or len(jobs) < _PARALLEL_MIN_FILES:
+        return [_extract_timed(*job) for job in jobs]
+
+    # Submit the largest files first so one big table doesn't finish last,
+    # but collect results in the original (deterministic) order.
+    order = sorted(range(len(jobs)), key=lambda i: len(jobs[i][0]), reverse=True)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {i: pool.submit(_extract_timed, *jobs[i]) for i in order}
+            return [futures[i].result() for i in range(len(jobs))]
+    except (OSError, BrokenProcessPool):
+        # Sandboxed or frozen environments may refuse to spawn workers.
+        return [_extract_timed(*job) for job in jobs]
+
+
 # ---------------------------------------------------------------------------
 # User settings  (persisted to data/user_settings.json)
 # ---------------------------------------------------------------------------
@@ -165,12 +365,21 @@ def load_settings() -> dict[str, Any]:
 
 
 def save_settings(settings: dict[str, Any]) -> None:
-    """Persist settings to user_settings.json."""
-    SETTINGS_JSON.write_text(json.dumps(settings, indent=2), encoding="utf-8")
+    """Persist settings to user_settings.json (temp file, then rename)."""
+    _write_json_atomic(SETTINGS_JSON, settings)
 
 
-def load_characters() -> list[dict[str, Any]]:
-    """Load user_characters.json and return the character list."""
+def _write_json_atomic(path: Path, payload: Any) -> None:
+    """Write JSON next to *path* and rename it into place."""
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def _load_character_snapshot() -> list[dict[str, Any]]:
     defaults = copy.deepcopy(_DEFAULT_CHARACTERS)
     if not CHARACTERS_JSON.exists():
         return defaults["characters"]
@@ -184,68 +393,311 @@ def load_characters() -> list[dict[str, Any]]:
         return defaults["characters"]
 
 
+def apply_character_journal_entry(characters: list[dict[str, Any]], entry: dict[str, Any]) -> None:
+    """Apply one journal entry ({"op": "put"|"delete", ...}) to *characters* in place."""
+    op = entry.get("op")
+    if op == "put":
+        character = entry.get("character")
+        if not isinstance(character, dict):
+            return
+        for idx, existing in enumerate(characters):
+            if existing.get("id") == character.get("id"):
+                characters[idx] = character
+                return
+        characters.append(character)
+    elif op == "delete":
+        characters[:] = [c for c in characters if c.get("id") != entry.get("id")]
+
+
+def read_character_journal() -> list[dict[str, Any]]:
+    """Entries appended since the last compaction; a torn final line is skipped."""
+    try:
+        lines = CHARACTERS_JOURNAL.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    entries = []
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+def load_characters() -> list[dict[str, Any]]:
+    """Load user_characters.json, replay the change journal and return the character list."""
+    characters = _load_character_snapshot()
+    for entry in read_character_journal():
+        apply_character_journal_entry(characters, entry)
+    return characters
+
+
 def save_characters(characters: list[dict[str, Any]]) -> None:
-    """Persist character data to user_characters.json."""
-    payload = {"characters": characters}
-    CHARACTERS_JSON.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    """Persist character data to user_characters.json (atomically) and reset the journal."""
+    _write_json_atomic(CHARACTERS_JSON, {"characters": characters})
+    try:
+        CHARACTERS_JOURNAL.unlink()
+    except FileNotFoundError:
+        pass
 
 
 # ---------------------------------------------------------------------------
 # Top-level load function used by App._load_data
 # ---------------------------------------------------------------------------
 
-def load_all_data() -> dict[str, Any]:
-    """Load every data file and return a dict of all game data."""
-    sf_moves = extract_moves(load_yaml(SF_MOVES_YAML), "Starforged")
-    si_moves = extract_moves(load_yaml(SI_MOVES_YAML), "Sundered Isles")
+GAMES = ("Starforged", "Sundered Isles", "Ironsworn")
 
-    si_oracles: list[dict[str, Any]] = []
-    for d in (SI_ORACLES_DIR, CUSTOM_ORACLES_DIR):
-        if d.is_dir():
-            for f in sorted(d.glob("*.yaml")):
-                si_oracles.extend(extract_oracles(load_yaml(f), "Sundered Isles"))
-
-    sf_oracles: list[dict[str, Any]] = []
-    if SF_ORACLES_DIR.is_dir():
-        for f in sorted(SF_ORACLES_DIR.glob("*.yaml")):
-            sf_oracles.extend(extract_oracles(load_yaml(f), "Starforged"))
-
-    is_oracles: list[dict[str, Any]] = []
-    if IS_ORACLES_DIR.is_dir():
-        for f in sorted(IS_ORACLES_DIR.glob("*.yaml")):
-            is_oracles.extend(extract_oracles(load_yaml(f), "Ironsworn"))
-
-    sf_assets = extract_assets(load_yaml(SF_ASSETS_YAML), "Starforged") if SF_ASSETS_YAML.exists() else []
-    si_assets = extract_assets(load_yaml(SI_ASSETS_YAML), "Sundered Isles") if SI_ASSETS_YAML.exists() else []
-    is_assets = extract_assets(load_yaml(IS_ASSETS_YAML), "Ironsworn") if IS_ASSETS_YAML.exists() else []
-
-    all_oracles = sf_oracles + si_oracles + is_oracles
-    oracle_by_id: dict[str, dict[str, Any]] = {
-        o["oracle_id"]: o for o in all_oracles if o.get("oracle_id")
-    }
+# load_all_data keys owned by each game, in the order App merges them.
+# Order the app loads datasets in the background: what users reach for first.
+DATASET_ORDER = ("oracles", "moves", "assets")
 
-    bundles: list[dict[str, Any]] = []
-    game_regions: dict[str, list[str]] = {}
-    if BUNDLES_YAML.exists():
-        bundles_data = load_yaml(BUNDLES_YAML)
-        bundles = bundles_data.get("bundles") or []
-        game_regions = bundles_data.get("game_regions") or {}
+GAME_SLOTS: dict[str, tuple[str, ...]] = {
+    "Starforged": ("sf_moves", "sf_oracles", "sf_assets"),
+    "Sundered Isles": ("si_moves", "si_oracles", "si_assets"),
+    "Ironsworn": ("is_oracles", "is_assets"),
+}
 
-    settings = load_settings()
-    characters = load_characters()
 
+def _data_files() -> list[tuple[Path, str, str, str]]:
+    """Return (path, kind, fallback_label, slot) for every YAML file in load order.
+
+    slot is the load_all_data key the extracted list is merged into.
+    """
+    files: list[tuple[Path, str, str, str]] = [
+        (SF_MOVES_YAML, "moves", "Starforged", "sf_moves"),
+        (SI_MOVES_YAML, "moves", "Sundered Isles", "si_moves"),
+    ]
+    for d, label, slot in (
+        (SI_ORACLES_DIR, "Sundered Isles", "si_oracles"),
+        (CUSTOM_ORACLES_DIR, CUSTOM_ORACLES_LABEL, CUSTOM_ORACLES_SLOT),
+        (SF_ORACLES_DIR, "Starforged", "sf_oracles"),
+        (IS_ORACLES_DIR, "Ironsworn", "is_oracles"),
+    ):
+        if d.is_dir():
+            files.extend((f, "oracles", label, slot) for f in sorted(d.glob("*.yaml")))
+    for path, label, slot in (
+        (SF_ASSETS_YAML, "Starforged", "sf_assets"),
+        (SI_ASSETS_YAML, "Sundered Isles", "si_assets"),
+        (IS_ASSETS_YAML, "Ironsworn", "is_assets"),
+    ):
+        if path.exists():
+            files.append((path, "assets", label, slot))
+    if BUNDLES_YAML.exists():
+        files.append((BUNDLES_YAML, "raw", "", "bundles"))
+    return files
+
+
+def _load_files(
+    files: list[tuple[Path, str, str, str]],
+    use_cache: bool,
+    parallel: bool,
+    origins: dict[Path, list[dict[str, Any]]] | None = None,
+) -> dict[str, Any]:
+    """Load files (cache first, then a worker pool) and merge them by slot.
+
+    If *origins* is given it is filled with path -> the (compiled) records
+    that file contributed, for patching a slot when one file changes.
+    """
+    cache = _CompiledCache(enabled=use_cache)
+
+    values: list[Any] = []
+    misses: list[int] = []
+    seconds: list[float] = []
+    for path, kind, label, _slot in files:
+        start = time.perf_counter()
+        hit, value = cache.lookup(path, kind, label)
+        seconds.append(time.perf_counter() - start)
+        if not hit:
+            misses.append(len(values))
+        values.append(value)
+
+    extracted = _extract_many([(values[i], files[i][1], files[i][2]) for i in misses], parallel)
+    for i, (value, took) in zip(misses, extracted):
+        values[i] = value
+        seconds[i] += took
+        cache.store(files[i][0], value)
+    cache.save([path for path, *_ in files])
+    if PROFILE.enabled:
+        parsed = set(misses)
+        for i, (path, *_rest) in enumerate(files):
+            PROFILE.record("data", _cache_key(path), seconds[i], "parsed" if i in parsed else "cached")
+
+    slots: dict[str, Any] = {}
+    spans: list[tuple[Path, str, int, int]] = []
+    for (path, _kind, _label, slot), value in zip(files, values):
+        if slot == "bundles":
+            slots[slot] = value
+        else:
+            start = len(slots.setdefault(slot, []))
+            slots[slot].extend(value)
+            spans.append((path, slot, start, len(slots[slot])))
+
+    # Roll indexes are rebuilt on every load rather than cached; it's cheap.
+    for slot, records in slots.items():
+        if slot.endswith("_oracles"):
+            with PROFILE.span("data", f"compile {slot}"):
+                slots[slot] = records = compact_oracles(records)
+                compile_tables(records)
+        elif slot.endswith("_moves"):
+            with PROFILE.span("data", f"compile {slot}"):
+                compile_move_tables(records)
+    if origins is not None:
+        for path, slot, start, end in spans:
+            origins[path] = slots[slot][start:end]
+    return slots
+
+
+def build_oracle_index(
+    sf_oracles: list[dict[str, Any]],
+    si_oracles: list[dict[str, Any]],
+    is_oracles: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Map oracle_id -> oracle; later games win on duplicate ids."""
+    return {o["oracle_id"]: o for o in sf_oracles + si_oracles + is_oracles if o.get("oracle_id")}
+
+
+def load_slots(
+    slots: tuple[str, ...] | list[str],
+    use_cache: bool = True,
+    parallel: bool = True,
+    origins: dict[Path, list[dict[str, Any]]] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Load only the named GAME_SLOTS entries (e.g. "si_oracles"); see _load_files for *origins*."""
+    files = [f for f in _data_files() if f[3] in slots]
+    loaded = _load_files(files, use_cache, parallel, origins)
+    return {slot: loaded.get(slot, []) for slot in slots}
+
+
+def extract_uncached(slots: tuple[str, ...] | list[str], parallel: bool = True) -> None:
+    """Extract every file of *slots* missing from the compiled cache, through one worker pool.
+
+    The background loader calls this once per dataset kind before streaming
+    that kind slot by slot with parallel=False, so a cold start forks one pool
+    per kind rather than one per slot.
+    """
+    files = [f for f in _data_files() if f[3] in slots]
+    cache = _CompiledCache()
+    misses: list[tuple[Path, bytes, str, str]] = []
+    for path, kind, label, _slot in files:
+        hit, value = cache.lookup(path, kind, label)
+        if not hit:
+            misses.append((path, value, kind, label))
+    extracted = _extract_many([(raw, kind, label) for _path, raw, kind, label in misses], parallel)
+    for (path, *_rest), (value, took) in zip(misses, extracted):
+        cache.store(path, value)
+        PROFILE.record("data", _cache_key(path), took, "parsed")
+    cache.save([path for path, *_ in files])
+
+
+def custom_oracle_files() -> list[Path]:
+    """The custom oracle packs, in load order."""
+    if not CUSTOM_ORACLES_DIR.is_dir():
+        return []
+    return sorted(CUSTOM_ORACLES_DIR.glob("*.yaml"))
+
+
+def load_custom_oracle_file(path: Path) -> list[dict[str, Any]]:
+    """Re-extract one custom pack (through the compiled cache); [] if it is gone.
+
+    Raises ValueError with a readable message when the file can't be read,
+    parsed or extracted, e.g. while an editor is still writing or holding it,
+    or when valid YAML doesn't have the shape of an oracle pack.
+    """
+    if not path.exists():
+        return []
+    try:
+        loaded = _load_files([(path, "oracles", CUSTOM_ORACLES_LABEL, CUSTOM_ORACLES_SLOT)], True, False)
+    except (SystemExit, OSError, yaml.YAMLError, UnicodeDecodeError) as exc:
+        raise ValueError(f"{path.name}: {' '.join(str(exc).split())}") from exc
+    except (AttributeError, TypeError, KeyError, ValueError) as exc:
+        raise ValueError(f"{path.name}: not an oracle pack (expected a mapping with an 'oracles' list)") from exc
+    return loaded.get(CUSTOM_ORACLES_SLOT, [])
+
+
+def load_game_data(game: str, use_cache: bool = True, parallel: bool = True) -> dict[str, list[dict[str, Any]]]:
+    """Load one game's moves, oracles and assets, keyed by their GAME_SLOTS names."""
+    if game not in GAME_SLOTS:
+        raise ValueError(f"Unknown game: {game}")
+    return load_slots(GAME_SLOTS[game], use_cache, parallel)
+
+
+def load_core_data(use_cache: bool = True) -> dict[str, Any]:
+    """Load the game-independent data: bundles, regions, settings and characters."""
+    files = [f for f in _data_files() if f[3] == "bundles"]
+    bundles_data = _load_files(files, use_cache, parallel=False).get("bundles") or {}
+    with PROFILE.span("data", SETTINGS_JSON.name):
+        settings = load_settings()
+    with PROFILE.span("data", CHARACTERS_JSON.name):
+        characters = load_characters()
     return {
-        "sf_moves": sf_moves,
-        "si_moves": si_moves,
-        "sf_oracles": sf_oracles,
-        "si_oracles": si_oracles,
-        "is_oracles": is_oracles,
-        "sf_assets": sf_assets,
-        "si_assets": si_assets,
-        "is_assets": is_assets,
-        "oracle_by_id": oracle_by_id,
-        "bundles": bundles,
-        "game_regions": game_regions,
+        "bundles": bundles_data.get("bundles") or [],
+        "game_regions": bundles_data.get("game_regions") or {},
         "settings": settings,
         "characters": characters,
     }
+
+
+def load_all_data(use_cache: bool = True, parallel: bool = True) -> dict[str, Any]:
+    """Load every data file and return a dict of all game data.
+
+    Extracted lists are served from the compiled cache when the underlying
+    YAML is unchanged; pass use_cache=False to force a full re-parse.  Files
+    that do need parsing are spread over a process pool unless parallel=False.
+    """
+    slots = _load_files(_data_files(), use_cache, parallel)
+    bundles_data: dict[str, Any] = slots.pop("bundles", None) or {}
+    for game_slots in GAME_SLOTS.values():
+        for slot in game_slots:
+            slots.setdefault(slot, [])
+
+    return {
+        **slots,
+        "oracle_by_id": build_oracle_index(slots["sf_oracles"], slots["si_oracles"], slots["is_oracles"]),
+        "bundles": bundles_data.get("bundles") or [],
+        "game_regions": bundles_data.get("game_regions") or {},
+        "settings": load_settings(),
+        "characters": load_characters(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Backend benchmark
+#     python src/loader.py --benchmark
+# (parity between the backends is checked by tests/unit/test_yaml_backends.py)
+# ---------------------------------------------------------------------------
+
+def benchmark_yaml_backends(repeat: int = 1) -> int:
+    """Time SafeLoader vs CSafeLoader parsing and extracting everything in data/."""
+    files = _data_files()
+    raws = [(path, kind, label, _read_bytes(path)) for path, kind, label, _slot in files]
+    total_kb = sum(len(raw) for *_, raw in raws) / 1024
+    print(f"{len(raws)} files, {total_kb:.0f} KB of YAML")
+
+    backends: list[tuple[str, type]] = [("pure-python", yaml.SafeLoader)]
+    if hasattr(yaml, "CSafeLoader"):
+        backends.append(("libyaml", yaml.CSafeLoader))
+    else:
+        print("PyYAML was built without libyaml; only the pure-Python loader is available.")
+
+    for name, loader in backends:
+        best = float("inf")
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            for _, kind, label, raw in raws:
+                _EXTRACTORS[kind](_parse_yaml(raw, loader), label)
+            best = min(best, time.perf_counter() - start)
+        print(f"  {name:<12} {best * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--benchmark", action="store_true",
+                        help="time the YAML backends on data/")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if args.benchmark:
+        raise SystemExit(benchmark_yaml_backends(args.repeat))
+    parser.print_help()
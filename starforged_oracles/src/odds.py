@@ -0,0 +1,117 @@
+"""odds.py – Exact outcome odds for action and progress rolls.
+
+An action roll is a d6 plus a bonus (capped at 10) against two d10 challenge
+dice; a progress roll uses the progress score in place of the action score.
+Both are tiny finite distributions, so every outcome table is counted once at
+import (all 100 challenge pairs per score, then the six action die faces per
+bonus and momentum) and lookups are a dict or tuple read.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+STRONG_MATCH = "Strong Hit with Match"
+STRONG = "Strong Hit"
+WEAK = "Weak Hit"
+MISS = "Miss"
+
+# Bonuses outside this range give the same odds as its ends.
+BONUS_MIN, BONUS_MAX = -6, 10
+MOMENTUM_MIN, MOMENTUM_MAX = -6, 10
+SCORE_MAX = 10
+
+
+def action_outcome(score: int, challenge_1: int, challenge_2: int) -> str:
+    """Outcome name for an action or progress *score* against two challenge dice."""
+    beats_1 = score > challenge_1
+    beats_2 = score > challenge_2
+    if beats_1 and beats_2:
+        return STRONG_MATCH if challenge_1 == challenge_2 else STRONG
+    if beats_1 or beats_2:
+        return WEAK
+    return MISS
+
+
+class Odds(NamedTuple):
+    """Outcome counts out of ``total`` equally likely rolls."""
+
+    strong_match: int
+    strong: int
+    weak: int
+    miss: int
+    total: int
+
+    def __add__(self, other: object) -> Odds:  # type: ignore[override]
+        if not isinstance(other, Odds):
+            return NotImplemented
+        return Odds(*(a + b for a, b in zip(self, other)))
+
+    @property
+    def p_strong(self) -> float:
+        """Chance of a strong hit, with or without a match."""
+        return (self.strong_match + self.strong) / self.total
+
+    @property
+    def p_weak(self) -> float:
+        return self.weak / self.total
+
+    @property
+    def p_miss(self) -> float:
+        return self.miss / self.total
+
+    def probability(self, outcome: str) -> float:
+        counts = {STRONG_MATCH: self.strong_match, STRONG: self.strong, WEAK: self.weak, MISS: self.miss}
+        return counts[outcome] / self.total
+
+
+def _count_score(score: int) -> Odds:
+    counts = {STRONG_MATCH: 0, STRONG: 0, WEAK: 0, MISS: 0}
+    for challenge_1 in range(1, 11):
+        for challenge_2 in range(1, 11):
+            counts[action_outcome(score, challenge_1, challenge_2)] += 1
+    return Odds(counts[STRONG_MATCH], counts[STRONG], counts[WEAK], counts[MISS], 100)
+
+
+# Odds for a fixed score 0..10 against the challenge dice (progress rolls, and
+# the building block of the action tables).
+PROGRESS_ODDS: tuple[Odds, ...] = tuple(_count_score(score) for score in range(SCORE_MAX + 1))
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    return max(low, min(high, value))
+
+
+def _count_action(bonus: int, momentum: int | None) -> Odds:
+    odds = Odds(0, 0, 0, 0, 0)
+    for action_die in range(1, 7):
+        score = min(SCORE_MAX, action_die + bonus)
+        if momentum is not None:
+            # Burning momentum replaces the action score when that helps.
+            score = max(score, momentum)
+        odds += PROGRESS_ODDS[_clamp(score, 0, SCORE_MAX)]
+    return odds
+
+
+# (bonus, momentum to burn or None) -> Odds.
+ACTION_ODDS: dict[tuple[int, int | None], Odds] = {
+    (bonus, momentum): _count_action(bonus, momentum)
+    for bonus in range(BONUS_MIN, BONUS_MAX + 1)
+    for momentum in (None, *range(MOMENTUM_MIN, MOMENTUM_MAX + 1))
+}
+
+
+def action_odds(bonus: int, momentum: int | None = None) -> Odds:
+    """Odds of an action roll with *bonus*, burning *momentum* if it beats the score."""
+    if momentum is not None:
+        momentum = _clamp(momentum, MOMENTUM_MIN, MOMENTUM_MAX)
+    return ACTION_ODDS[_clamp(bonus, BONUS_MIN, BONUS_MAX), momentum]
+
+
+def progress_odds(score: int) -> Odds:
+    """Odds of a progress roll with *score* filled boxes."""
+    return PROGRESS_ODDS[_clamp(score, 0, SCORE_MAX)]
+
+
+def format_odds(odds: Odds) -> str:
+    """Compact percentages, e.g. "S 28% · W 44% · M 28%"."""
+    return f"S {odds.p_strong:.0%} · W {odds.p_weak:.0%} · M {odds.p_miss:.0%}"
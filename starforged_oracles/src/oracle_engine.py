@@ -0,0 +1,400 @@
+"""oracle_engine.py – Headless oracle and bundle rolling.
+
+The Oracles and Bundles tabs roll through the functions below, and
+OracleEngine exposes the same logic over load_all_data() output for scripts
+and batch generation.  Results are plain JSON-ready dicts.
+
+Bundles are compiled once into a BundlePlan: oracle references, region maps
+and cascade maps are resolved against oracle_by_id up front, so content
+errors surface at load and rolling a plan repeatedly is a plain loop.
+
+Command line (one JSON object per line on stdout):
+    python src/oracle_engine.py list
+    python src/oracle_engine.py check
+    python src/oracle_engine.py roll starforged/oracles/core/action -n 500 --seed 7
+    python src/oracle_engine.py bundle sf_settlement -n 100 --region Terminus
+    python src/oracle_engine.py bundle "Creature Creator" -n 20 --select environment=Space
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from typing import Any, Iterator
+
+from oracle_graph import OracleGraph, expand_roll
+
+# ---------------------------------------------------------------------------
+# Single rolls
+# ---------------------------------------------------------------------------
+
+
+def roll_table(
+    oracle: dict[str, Any],
+    cursed_table: dict[str, Any] | None = None,
+    cursed_die: int = 0,
+    rng: random.Random | None = None,
+    sides: int = 100,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Roll d100 (or d*sides*) on *oracle* once; return (result, table actually rolled on).
+
+    With a *cursed_die* (e.g. 10 for a d10) the cursed die is rolled too, and
+    its maximum switches the roll to *cursed_table* when one is given.
+    """
+    r = rng or random
+    roll = r.randint(1, sides)
+    cursed_roll: int | None = None
+    cursed = False
+    if cursed_die:
+        cursed_roll = r.randint(1, cursed_die)
+        cursed = cursed_roll == cursed_die
+
+    table = cursed_table if cursed and cursed_table is not None else oracle
+    text = expand_roll(table, roll, rng)
+    result = {
+        "oracle_id": table.get("oracle_id", ""),
+        "oracle": table.get("name", ""),
+        "roll": roll,
+        "result": text,
+        "cursed_roll": cursed_roll,
+        "cursed": cursed,
+    }
+    return result, table
+
+
+def row_span(oracle: dict[str, Any]) -> int:
+    """The die that reaches every row of *oracle*: its highest row bound.
+
+    Name lists such as the planets' "Sample Names" number their rows 1-20
+    instead of spreading them over the d100.
+    """
+    return max((row["max"] for row in oracle["rows"] if isinstance(row.get("max"), int)), default=100)
+
+
+# ---------------------------------------------------------------------------
+# Bundles
+# ---------------------------------------------------------------------------
+
+
+class PlanStep:
+    """One bundle roll with its oracle references resolved ahead of time."""
+
+    __slots__ = (
+        "label", "note", "count", "pick", "fixed_selector", "oracle_id", "oracle", "cursed_table",
+        "uses_cursed_die", "region_tables", "cascade_from", "cascade_exact", "cascade_prefixes",
+    )
+
+    def __init__(self, item: dict[str, Any], oracle_by_id: dict[str, dict[str, Any]], problems: list[str]) -> None:
+        self.label: str = item.get("label", "?")
+        self.note: str = item.get("note", "")
+        self.count: int = item.get("count", 1)
+        # "pick: true" rolls across the table's own rows (see row_span()) instead of a d100.
+        self.pick: bool = bool(item.get("pick"))
+        self.fixed_selector: str = item.get("fixed_value_from_selector", "")
+        self.oracle_id: str = item.get("oracle_id", "")
+        self.oracle: dict[str, Any] | None = None
+        # region -> (oracle id, table or None), and the same for cascade targets.
+        self.region_tables: dict[str, tuple[str, dict[str, Any] | None]] | None = None
+        self.cascade_from: str = ""
+        self.cascade_exact: dict[str, tuple[str, dict[str, Any] | None]] = {}
+        self.cascade_prefixes: tuple[tuple[str, str, dict[str, Any] | None], ...] = ()
+
+        def resolve(oracle_id: str) -> tuple[str, dict[str, Any] | None]:
+            table = oracle_by_id.get(oracle_id)
+            if table is None:
+                problems.append(f"{self.label}: oracle not found: {oracle_id}")
+            return oracle_id, table
+
+        if item.get("region_map"):
+            self.region_tables = {region: resolve(oid) for region, oid in item["region_map"].items() if oid}
+        elif item.get("cascade_from"):
+            self.cascade_from = item["cascade_from"]
+            self.cascade_exact = {key: resolve(oid) for key, oid in (item.get("cascade_map") or {}).items() if oid}
+            # Prefix fallbacks are tried in map order, as the map was written.
+            self.cascade_prefixes = tuple((key, *target) for key, target in self.cascade_exact.items())
+        else:
+            self.oracle = resolve(self.oracle_id)[1]
+
+        cursed_oracle_id = item.get("cursed_oracle_id", "")
+        self.cursed_table: dict[str, Any] | None = None
+        self.uses_cursed_die = bool(cursed_oracle_id)
+        if cursed_oracle_id:
+            self.cursed_table = oracle_by_id.get(cursed_oracle_id)
+            if self.cursed_table is None:
+                problems.append(f"{self.label}: cursed oracle not found: {cursed_oracle_id}")
+
+
+class BundlePlan:
+    """A bundle compiled by compile_bundle(); ``problems`` lists content errors."""
+
+    __slots__ = ("bundle", "steps", "problems")
+
+    def __init__(self, bundle: dict[str, Any], steps: tuple[PlanStep, ...], problems: list[str]) -> None:
+        self.bundle = bundle
+        self.steps = steps
+        self.problems = problems
+
+
+def compile_bundle(bundle: dict[str, Any], oracle_by_id: dict[str, dict[str, Any]]) -> BundlePlan:
+    """Resolve every oracle reference of *bundle* once.
+
+    Missing oracles are collected in the plan's ``problems`` rather than
+    raised; run_plan() reports them per item exactly as before.
+    """
+    problems: list[str] = []
+    steps = tuple(PlanStep(item, oracle_by_id, problems) for item in bundle.get("rolls", []))
+    labels: set[str] = set()
+    for step in steps:
+        if step.cascade_from and step.cascade_from not in labels:
+            problems.append(f"{step.label}: cascades from unknown or later item {step.cascade_from!r}")
+        labels.add(step.label)
+    return BundlePlan(bundle, steps, problems)
+
+
+def compile_bundles(
+    bundles: list[dict[str, Any]], oracle_by_id: dict[str, dict[str, Any]]
+) -> dict[str, BundlePlan]:
+    """Plans for *bundles*, keyed by bundle id."""
+    return {bundle.get("id", ""): compile_bundle(bundle, oracle_by_id) for bundle in bundles}
+
+
+def run_plan(
+    plan: BundlePlan,
+    region: str = "",
+    selectors: dict[str, str] | None = None,
+    cursed_die: int = 0,
+    rng: random.Random | None = None,
+) -> list[dict[str, Any]]:
+    """Roll every step of *plan* in order.
+
+    Returns one entry per item: label, region, note, and either "fixed" (a
+    selector value used as-is), "error" (the item could not be resolved) or
+    "rolls" (a list of roll_table results).  Later items can cascade from
+    the first result of earlier ones.
+    """
+    selectors = selectors or {}
+    label_results: dict[str, str] = {}
+    entries: list[dict[str, Any]] = []
+
+    for step in plan.steps:
+        label = step.label
+        entry: dict[str, Any] = {
+            "label": label, "region": "", "note": step.note,
+            "fixed": None, "error": None, "rolls": [],
+        }
+        entries.append(entry)
+
+        if step.fixed_selector:
+            selected_value = selectors.get(step.fixed_selector, "")
+            if selected_value and selected_value.lower() != "random":
+                label_results[label] = selected_value
+                entry["fixed"] = selected_value
+                continue
+
+        oracle_id, oracle = step.oracle_id, step.oracle
+        if step.region_tables is not None:
+            entry["region"] = region
+            target = step.region_tables.get(region)
+            if target is None:
+                entry["error"] = f"No region oracle for {region!r}"
+                continue
+            oracle_id, oracle = target
+        elif step.cascade_from:
+            source_text = label_results.get(step.cascade_from, "")
+            target = step.cascade_exact.get(source_text)
+            if target is None:
+                for key, target_id, target_table in step.cascade_prefixes:
+                    if source_text.startswith(key):
+                        target = target_id, target_table
+                        break
+                else:
+                    entry["error"] = f"No cascade match for {step.cascade_from}={source_text!r}"
+                    continue
+            oracle_id, oracle = target
+
+        if oracle is None:
+            entry["error"] = f"Oracle not found: {oracle_id}"
+            continue
+
+        step_die = cursed_die if step.uses_cursed_die else 0
+        sides = row_span(oracle) if step.pick else 100
+        rolls = entry["rolls"]
+        for _ in range(step.count):
+            rolls.append(roll_table(oracle, step.cursed_table, step_die, rng, sides)[0])
+        if rolls:
+            label_results[label] = rolls[0]["result"]
+
+    return entries
+
+
+def roll_bundle(
+    bundle: dict[str, Any],
+    oracle_by_id: dict[str, dict[str, Any]],
+    region: str = "",
+    selectors: dict[str, str] | None = None,
+    cursed_die: int = 0,
+    rng: random.Random | None = None,
+) -> list[dict[str, Any]]:
+    """Compile *bundle* and roll it once; see run_plan()."""
+    return run_plan(compile_bundle(bundle, oracle_by_id), region, selectors, cursed_die, rng)
+
+
+def default_region(bundle: dict[str, Any], game_regions: dict[str, list[str]], settings: dict[str, Any]) -> str:
+    """The region the Bundles tab would preselect for *bundle*."""
+    game = bundle.get("game", "")
+    regions = game_regions.get(game, [])
+    if not regions:
+        return ""
+    current = settings.get("regions", {}).get(game, regions[0])
+    return current if current in regions else regions[0]
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class OracleEngine:
+    """Batch rolling over load_all_data() output, independent of Tk."""
+
+    def __init__(self, data: dict[str, Any] | None = None, seed: int | None = None) -> None:
+        if data is None:
+            from loader import load_all_data
+            data = load_all_data()
+        self.oracle_by_id: dict[str, dict[str, Any]] = data["oracle_by_id"]
+        self.bundles: list[dict[str, Any]] = data.get("bundles", [])
+        self.game_regions: dict[str, list[str]] = data.get("game_regions", {})
+        self.settings: dict[str, Any] = data.get("settings", {})
+        self.rng = random.Random(seed)
+        self.graph = OracleGraph(self.oracle_by_id, self.bundles)
+        self.plans: dict[str, BundlePlan] = compile_bundles(self.bundles, self.oracle_by_id)
+
+    @property
+    def problems(self) -> dict[str, list[str]]:
+        """Content errors found while compiling the bundles, by bundle id."""
+        return {bundle_id: plan.problems for bundle_id, plan in self.plans.items() if plan.problems}
+
+    def oracle(self, oracle_id: str) -> dict[str, Any]:
+        try:
+            return self.oracle_by_id[oracle_id]
+        except KeyError:
+            raise KeyError(f"Unknown oracle: {oracle_id}") from None
+
+    def bundle(self, name: str) -> dict[str, Any]:
+        """The bundle with id *name*, or else the only bundle called *name*."""
+        for bundle in self.bundles:
+            if bundle.get("id") == name:
+                return bundle
+        named = [bundle for bundle in self.bundles if bundle.get("name") == name]
+        if len(named) > 1:
+            # Games share names such as "Settlement"; only the id says which one.
+            ids = ", ".join(bundle.get("id", "") for bundle in named)
+            raise KeyError(f"Ambiguous bundle: {name} (use one of the ids {ids})")
+        if not named:
+            raise KeyError(f"Unknown bundle: {name}")
+        return named[0]
+
+    def iter_rolls(self, oracle_id: str, n: int = 1, cursed_die: int = 0) -> Iterator[dict[str, Any]]:
+        oracle = self.oracle(oracle_id)
+        cursed_table = self.oracle_by_id.get(oracle.get("cursed_version", "")) if cursed_die else None
+        for _ in range(n):
+            yield roll_table(oracle, cursed_table, cursed_die if cursed_table else 0, self.rng)[0]
+
+    def roll(self, oracle_id: str, n: int = 1, cursed_die: int = 0) -> list[dict[str, Any]]:
+        """Roll *oracle_id* n times; cursed_die > 0 also rolls the cursed die."""
+        return list(self.iter_rolls(oracle_id, n, cursed_die))
+
+    def iter_bundle_rolls(
+        self,
+        name: str,
+        n: int = 1,
+        region: str = "",
+        selectors: dict[str, str] | None = None,
+        cursed_die: int = 0,
+    ) -> Iterator[list[dict[str, Any]]]:
+        bundle = self.bundle(name)
+        plan = self.plans[bundle.get("id", "")]
+        region = region or default_region(bundle, self.game_regions, self.settings)
+        rng = self.rng
+        for _ in range(n):
+            yield run_plan(plan, region, selectors, cursed_die, rng)
+
+    def roll_bundle(
+        self,
+        name: str,
+        n: int = 1,
+        region: str = "",
+        selectors: dict[str, str] | None = None,
+        cursed_die: int = 0,
+    ) -> list[list[dict[str, Any]]]:
+        """Roll the bundle called (or with id) *name* n times."""
+        return list(self.iter_bundle_rolls(name, n, region, selectors, cursed_die))
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _parse_selectors(pairs: list[str]) -> dict[str, str]:
+    selectors: dict[str, str] = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise SystemExit(f"--select expects KEY=VALUE, got {pair!r}")
+        selectors[key] = value
+    return selectors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Roll oracles and bundles without the GUI (JSON lines on stdout).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List oracle ids")
+    sub.add_parser("check", help="Report bundle content errors (exit status 1 if any)")
+    for name, help_text in (("roll", "Roll one oracle"), ("bundle", "Roll one bundle")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("target", help="Oracle id" if name == "roll" else "Bundle name or id")
+        cmd.add_argument("-n", type=int, default=1, help="Number of rolls (default: 1)")
+        cmd.add_argument("--seed", type=int, default=None, help="Seed for reproducible output")
+        cmd.add_argument("--cursed-die", type=int, default=0, metavar="SIDES",
+                         help="Also roll a cursed die with this many sides (e.g. 10)")
+    bundle_cmd = sub.choices["bundle"]
+    bundle_cmd.add_argument("--region", default="", help="Region for region-mapped rolls")
+    bundle_cmd.add_argument("--select", action="append", default=[], metavar="KEY=VALUE",
+                            help="Fix a bundle selector (repeatable)")
+    args = parser.parse_args(argv)
+
+    engine = OracleEngine(seed=getattr(args, "seed", None))
+    write = sys.stdout.write
+    try:
+        if args.command == "list":
+            for oracle_id, oracle in engine.oracle_by_id.items():
+                write(json.dumps({"oracle_id": oracle_id, "oracle": oracle["name"], "source": oracle["source"],
+                                  "category": oracle["category"]}, ensure_ascii=False) + "\n")
+        elif args.command == "check":
+            problems = engine.problems
+            for bundle_id, messages in problems.items():
+                write(json.dumps({"bundle": bundle_id, "problems": messages}, ensure_ascii=False) + "\n")
+            for cycle in engine.graph.unbounded:
+                write(json.dumps({"cycle": cycle, "problems": ["expansion might not finish; links dropped"]},
+                                 ensure_ascii=False) + "\n")
+            return 1 if problems or engine.graph.unbounded else 0
+        elif args.command == "roll":
+            for result in engine.iter_rolls(args.target, args.n, args.cursed_die):
+                write(json.dumps(result, ensure_ascii=False) + "\n")
+        else:
+            selectors = _parse_selectors(args.select)
+            for idx, entries in enumerate(
+                engine.iter_bundle_rolls(args.target, args.n, args.region, selectors, args.cursed_die)
+            ):
+                write(json.dumps({"bundle": args.target, "index": idx, "items": entries}, ensure_ascii=False) + "\n")
+    except KeyError as exc:
+        raise SystemExit(exc.args[0]) from None
+    except BrokenPipeError:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""oracle_graph.py – Cross-references between oracle tables.
+
+Some rows point at other tables instead of being a result: "Roll twice" and
+"Roll three times" re-roll their own table, and "Action + Theme" or
+"Descriptor + Focus" combine rolls on the game's core oracles.  link_oracles()
+parses those rows once and stores the resolved target tables on each table
+under "row_links" (next to the roll index from oracle_index), so rolling
+never parses text again.
+
+OracleGraph adds the cursed_version and bundle cascade edges and finds the
+strongly connected components (cycles).  A cycle in which a roll is expected
+to spawn at least one further roll on the cycle might never finish expanding;
+its links are dropped and reported instead, so expand_roll() can walk every
+remaining chain to the end with an explicit stack and no depth limit.
+"""
+from __future__ import annotations
+
+import random
+import re
+from typing import Any, Iterable
+
+from oracle_index import ROLL_INDEX_KEY, ROLL_TWICE_KEY, compile_table
+
+ROW_LINKS_KEY = "row_links"
+
+_REPEATS = (("roll twice", 2), ("roll three times", 3))
+_PART_SPLIT = re.compile(r"\s*\+\s*")
+_PART_STRIP = re.compile(r"^\[|\]$")
+
+# ---------------------------------------------------------------------------
+# Row links
+# ---------------------------------------------------------------------------
+
+
+def _core_tables_by_name(oracle_by_id: dict[str, dict[str, Any]]) -> dict[tuple[str, str], dict[str, Any]]:
+    """(source, lowercased name) -> table, preferring each game's core oracles."""
+    by_name: dict[tuple[str, str], dict[str, Any]] = {}
+    for table in oracle_by_id.values():
+        key = (table.get("source", ""), table.get("name", "").lower())
+        current = by_name.get(key)
+        if current is None or ("core" in table.get("category", "").lower() and "core" not in current.get("category", "").lower()):
+            by_name[key] = table
+    return by_name
+
+
+def _row_targets(
+    table: dict[str, Any], text: str, by_name: dict[tuple[str, str], dict[str, Any]]
+) -> tuple[dict[str, Any], ...] | None:
+    line = text.strip()
+    if "\n" in line:
+        return None
+    lowered = line.lower()
+    for prefix, count in _REPEATS:
+        if lowered.startswith(prefix):
+            return (table,) * count
+    # "Action + Theme", "[Descriptor + Focus]", "Action + Theme; pg 118–119"
+    line = line.split(";", 1)[0].strip()
+    parts = [_PART_STRIP.sub("", part).strip() for part in _PART_SPLIT.split(_PART_STRIP.sub("", line))]
+    if len(parts) < 2:
+        return None
+    source = table.get("source", "")
+    targets = tuple(by_name.get((source, part.lower())) for part in parts)
+    if any(target is None for target in targets):
+        return None
+    return targets  # type: ignore[return-value]
+
+
+def link_oracles(oracle_by_id: dict[str, dict[str, Any]]) -> None:
+    """Attach resolved row links to every table in *oracle_by_id*."""
+    by_name = _core_tables_by_name(oracle_by_id)
+    for table in oracle_by_id.values():
+        table[ROW_LINKS_KEY] = tuple(
+            _row_targets(table, row.get("text", ""), by_name) for row in table.get("rows", [])
+        )
+
+
+# ---------------------------------------------------------------------------
+# Expansion
+# ---------------------------------------------------------------------------
+
+
+def _roll_row(table: dict[str, Any], roll: int) -> tuple[str, tuple[dict[str, Any], ...] | None]:
+    index = table.get(ROLL_INDEX_KEY)
+    if index is None:
+        index = compile_table(table)
+    row_idx = index[roll] if 0 < roll <= 100 else -1
+    if row_idx < 0:
+        return "", None
+    links = table.get(ROW_LINKS_KEY)
+    if links is None:
+        # Not linked (e.g. a move table): only exact "Roll twice" rows re-roll.
+        return table["rows"][row_idx]["text"], (table, table) if table[ROLL_TWICE_KEY][row_idx] else None
+    return table["rows"][row_idx]["text"], links[row_idx]
+
+
+def expand_roll(table: dict[str, Any], roll: int, rng: random.Random | None = None) -> str:
+    """Text for *roll* on *table*, following row links to the end.
+
+    A linked row reads "Roll twice -> A + B"; nested re-rolls are flattened
+    into the same list and nested combinations are parenthesised.
+    """
+    text, targets = _roll_row(table, roll)
+    if not targets:
+        return text
+    randint = (rng or random).randint
+    # Frames: [row text, target tables, next target, finished parts, is a re-roll].
+    stack: list[list[Any]] = [[text, targets, 0, [], targets[0] is table]]
+    while True:
+        frame = stack[-1]
+        label, targets, pos, parts, repeat = frame
+        if pos < len(targets):
+            frame[2] += 1
+            child = targets[pos]
+            child_text, child_targets = _roll_row(child, randint(1, 100))
+            if child_targets:
+                stack.append([child_text, child_targets, 0, [], child_targets[0] is child])
+            else:
+                parts.append(child_text)
+            continue
+        stack.pop()
+        joined = " + ".join(parts)
+        if not stack:
+            return f"{label} -> {joined}"
+        stack[-1][3].append(joined if repeat else f"({joined})")
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+class OracleGraph:
+    """Directed reference graph over oracle ids.
+
+    ``edges`` maps an oracle id to the ids it can lead to (row links,
+    cursed versions, bundle cascades); ``cycles`` lists the strongly connected
+    components that contain a cycle, and ``unbounded`` the cycles whose row
+    links were dropped because expanding them might never finish.
+    """
+
+    def __init__(self, oracle_by_id: dict[str, dict[str, Any]], bundles: Iterable[dict[str, Any]] = ()) -> None:
+        self.oracle_by_id = oracle_by_id
+        link_oracles(oracle_by_id)
+        self.edges: dict[str, set[str]] = {oracle_id: set() for oracle_id in oracle_by_id}
+        for oracle_id, table in oracle_by_id.items():
+            for targets in table[ROW_LINKS_KEY]:
+                for target in targets or ():
+                    self.edges[oracle_id].add(target["oracle_id"])
+            cursed = table.get("cursed_version")
+            if cursed in oracle_by_id:
+                self.edges[oracle_id].add(cursed)
+        for bundle in bundles:
+            self._add_bundle_edges(bundle)
+
+        self.cycles: list[list[str]] = [
+            component for component in self._components()
+            if len(component) > 1 or component[0] in self.edges[component[0]]
+        ]
+        self.unbounded: list[list[str]] = []
+        for component in self.cycles:
+            if self._runaway(component):
+                self._drop_links_within(component)
+                self.unbounded.append(component)
+
+    def _add_bundle_edges(self, bundle: dict[str, Any]) -> None:
+        first_ids: dict[str, list[str]] = {}
+        for item in bundle.get("rolls", []):
+            label = item.get("label", "?")
+            if item.get("region_map"):
+                ids = list((item.get("region_map") or {}).values())
+            elif item.get("cascade_from"):
+                ids = list((item.get("cascade_map") or {}).values())
+                for source_id in first_ids.get(item["cascade_from"], []):
+                    if source_id in self.edges:
+                        self.edges[source_id].update(i for i in ids if i in self.oracle_by_id)
+            else:
+                ids = [item.get("oracle_id", "")]
+            first_ids[label] = ids
+
+    def _components(self) -> list[list[str]]:
+        """Strongly connected components (Tarjan's algorithm, iterative)."""
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[list[str]] = []
+        counter = 0
+        for root in self.edges:
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self.edges[root])))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.edges[child]))))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component: list[str] = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component))
+        return components
+
+    def _runaway(self, component: list[str]) -> bool:
+        """True unless every table spawns on average fewer than one roll back into *component*.
+
+        The largest row sum bounds the spectral radius of the expected-offspring
+        matrix, so staying below one guarantees expansion finishes.
+        """
+        members = set(component)
+        for oracle_id in component:
+            table = self.oracle_by_id[oracle_id]
+            index = table.get(ROLL_INDEX_KEY) or compile_table(table)
+            links = table[ROW_LINKS_KEY]
+            spawned = 0
+            for roll in range(1, 101):
+                row_idx = index[roll]
+                if row_idx >= 0 and links[row_idx]:
+                    spawned += sum(1 for target in links[row_idx] if target["oracle_id"] in members)
+            if spawned >= 100:
+                return True
+        return False
+
+    def _drop_links_within(self, component: list[str]) -> None:
+        members = set(component)
+        for oracle_id in component:
+            table = self.oracle_by_id[oracle_id]
+            table[ROW_LINKS_KEY] = tuple(
+                None if targets and any(t["oracle_id"] in members for t in targets) else targets
+                for targets in table[ROW_LINKS_KEY]
+            )
+
+    def reachable(self, oracle_id: str) -> set[str]:
+        """Every oracle id reachable from *oracle_id*, excluding itself unless on a cycle."""
+        seen: set[str] = set()
+        pending = list(self.edges.get(oracle_id, ()))
+        while pending:
+            node = pending.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            pending.extend(self.edges.get(node, ()))
+        return seen
@@ -0,0 +1,60 @@
+"""oracle_index.py – Compiled d100 lookups for oracle and move tables.
+
+Each table's rows are compiled once into a 101-entry ``array('h')`` mapping
+a d100 roll to the index of the row that covers it (slot 0 is unused, -1
+means no row covers the roll).  Rolling is then a single array read instead
+of a scan over the rows.  The compiled data is stored on the table itself,
+so the oracle, move and bundle tabs all share it.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Sequence
+
+ROLL_INDEX_KEY = "roll_index"
+ROLL_TWICE_KEY = "roll_twice_rows"
+
+
+def is_roll_twice(text: str) -> bool:
+    return text.strip().lower() == "roll twice"
+
+
+def compile_table(table: dict[str, Any]) -> Sequence[int]:
+    """Attach the roll index and roll-twice row flags to *table*; return the index."""
+    rows = table.get("rows", [])
+    index = [-1] * 101
+    roll_twice: list[bool] = []
+    for row_idx, row in enumerate(rows):
+        roll_twice.append(is_roll_twice(row.get("text", "")))
+        rmin, rmax = row.get("min"), row.get("max")
+        if rmin is None or rmax is None:
+            continue
+        for roll in range(max(1, rmin), min(100, rmax) + 1):
+            # The first matching row wins, as with the old linear scan.
+            if index[roll] == -1:
+                index[roll] = row_idx
+    compiled = array("h", index)
+    table[ROLL_INDEX_KEY] = compiled
+    table[ROLL_TWICE_KEY] = tuple(roll_twice)
+    return compiled
+
+
+def compile_tables(tables: list[dict[str, Any]]) -> None:
+    for table in tables:
+        compile_table(table)
+
+
+def compile_move_tables(moves: list[dict[str, Any]]) -> None:
+    for move in moves:
+        compile_tables(move.get("tables", []))
+
+
+def lookup_roll(table: dict[str, Any], roll: int) -> tuple[str, bool]:
+    """Return (row text, is roll twice) for a d100 *roll*; ("", False) if uncovered."""
+    index = table.get(ROLL_INDEX_KEY)
+    if index is None:
+        index = compile_table(table)
+    row_idx = index[roll] if 0 < roll <= 100 else -1
+    if row_idx < 0:
+        return "", False
+    return table["rows"][row_idx]["text"], table[ROLL_TWICE_KEY][row_idx]
@@ -0,0 +1,282 @@
+"""oracle_report.py – Content checks and exact odds for the oracle tables.
+
+One pass over every game's oracles reports
+    * rolls in 1..100 that no row covers (gaps) or that several rows cover
+      (overlaps; the first row wins),
+    * tables without rows and rows without text,
+    * oracle_ids defined more than once (build_oracle_index keeps the last),
+    * reference cycles whose expansion might never finish,
+and, in the same pass, computes each table's exact result odds with
+"Roll twice" and "Action + Theme" style rows expanded through the oracle graph.
+
+    python src/oracle_report.py                  # content problems; exit 1 if any
+    python src/oracle_report.py --json           # problems and every table's odds as one JSON object
+    python src/oracle_report.py --odds starforged/oracles/characters/role
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from fractions import Fraction
+from typing import Any
+
+from oracle_graph import ROW_LINKS_KEY, OracleGraph
+
+# ---------------------------------------------------------------------------
+# Coverage
+# ---------------------------------------------------------------------------
+
+
+def _runs(rolls: list[int]) -> list[tuple[int, int]]:
+    """Collapse sorted rolls into inclusive (first, last) runs."""
+    runs: list[tuple[int, int]] = []
+    for roll in rolls:
+        if runs and runs[-1][1] == roll - 1:
+            runs[-1] = (runs[-1][0], roll)
+        else:
+            runs.append((roll, roll))
+    return runs
+
+
+def table_coverage(table: dict[str, Any]) -> dict[str, list[tuple[int, int]]]:
+    """Gaps and overlaps of *table*'s min/max ranges over 1..100.
+
+    Tables whose rows have no ranges at all (weighted lists) are not rolled
+    on and report neither.
+    """
+    rows = table.get("rows", [])
+    ranged = [row for row in rows if row.get("min") is not None and row.get("max") is not None]
+    if not ranged:
+        return {"gaps": [], "overlaps": []}
+    hits = [0] * 101
+    for row in ranged:
+        for roll in range(max(1, row["min"]), min(100, row["max"]) + 1):
+            hits[roll] += 1
+    return {
+        "gaps": _runs([roll for roll in range(1, 101) if hits[roll] == 0]),
+        "overlaps": _runs([roll for roll in range(1, 101) if hits[roll] > 1]),
+    }
+
+
+def duplicate_ids(*oracle_lists: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """oracle_id -> every oracle defining it, in build_oracle_index order (last wins)."""
+    seen: dict[str, list[dict[str, Any]]] = {}
+    for oracles in oracle_lists:
+        for oracle in oracles:
+            if oracle.get("oracle_id"):
+                seen.setdefault(oracle["oracle_id"], []).append(oracle)
+    return {oracle_id: found for oracle_id, found in seen.items() if len(found) > 1}
+
+
+# ---------------------------------------------------------------------------
+# Exact odds
+# ---------------------------------------------------------------------------
+
+
+def _row_odds(table: dict[str, Any]) -> list[tuple[int, Fraction]]:
+    """(row index, chance of rolling it) for every row a d100 can land on."""
+    index = table.get("roll_index") or ()
+    counts: dict[int, int] = {}
+    for roll in range(1, 101):
+        row_idx = index[roll] if index else -1
+        if row_idx >= 0:
+            counts[row_idx] = counts.get(row_idx, 0) + 1
+    return [(row_idx, Fraction(count, 100)) for row_idx, count in sorted(counts.items())]
+
+
+def _solve(matrix: list[list[Fraction]], rhs: list[Fraction]) -> list[Fraction] | None:
+    """Gauss-Jordan elimination over fractions; None if singular."""
+    size = len(rhs)
+    aug = [row[:] + [value] for row, value in zip(matrix, rhs)]
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if aug[r][col] != 0), None)
+        if pivot is None:
+            return None
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        lead = aug[col][col]
+        aug[col] = [value / lead for value in aug[col]]
+        for r in range(size):
+            if r != col and aug[r][col] != 0:
+                factor = aug[r][col]
+                aug[r] = [a - factor * b for a, b in zip(aug[r], aug[col])]
+    return [aug[r][size] for r in range(size)]
+
+
+def expected_rolls(table: dict[str, Any]) -> list[tuple[dict[str, Any], Fraction]] | None:
+    """Expected number of rolls on every table reached from one roll on *table*.
+
+    Solves x = e + Mᵀx over the tables reachable through row links, where
+    M[t][u] is the expected number of rolls on u a roll on t spawns.  None if
+    the expansion has no finite expectation.
+    """
+    order: list[dict[str, Any]] = []
+    positions: dict[int, int] = {}
+    pending = [table]
+    while pending:
+        current = pending.pop()
+        if id(current) in positions:
+            continue
+        positions[id(current)] = len(order)
+        order.append(current)
+        for targets in current.get(ROW_LINKS_KEY) or ():
+            pending.extend(targets or ())
+
+    size = len(order)
+    matrix = [[Fraction(int(r == c)) for c in range(size)] for r in range(size)]
+    for src_pos, src in enumerate(order):
+        links = src.get(ROW_LINKS_KEY) or ()
+        for row_idx, chance in _row_odds(src):
+            for target in (links[row_idx] if row_idx < len(links) else None) or ():
+                matrix[positions[id(target)]][src_pos] -= chance
+    rhs = [Fraction(int(pos == 0)) for pos in range(size)]
+    solution = _solve(matrix, rhs)
+    if solution is None or any(value < 0 for value in solution):
+        return None
+    return list(zip(order, solution))
+
+
+def result_odds(table: dict[str, Any]) -> list[dict[str, Any]]:
+    """Every final result one roll on *table* can produce, with exact odds.
+
+    ``expected`` is the expected number of times the result appears once
+    linked rows are expanded; for a table without links it is simply the
+    chance of rolling that row.
+    """
+    rolls = expected_rolls(table)
+    if rolls is None:
+        return []
+    results: list[dict[str, Any]] = []
+    for target, times in rolls:
+        links = target.get(ROW_LINKS_KEY) or ()
+        for row_idx, chance in _row_odds(target):
+            if row_idx < len(links) and links[row_idx]:
+                continue
+            results.append({
+                "oracle_id": target.get("oracle_id", ""),
+                "text": target["rows"][row_idx].get("text", ""),
+                "expected": chance * times,
+            })
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+def build_report(data: dict[str, Any]) -> dict[str, Any]:
+    """Content problems over load_all_data() output, keyed by kind."""
+    oracle_by_id = data["oracle_by_id"]
+    graph = OracleGraph(oracle_by_id, data.get("bundles", []))
+
+    coverage: dict[str, dict[str, list[tuple[int, int]]]] = {}
+    empty_tables: list[str] = []
+    blank_rows: dict[str, list[int]] = {}
+    odds: dict[str, list[dict[str, Any]]] = {}
+    for oracle_id, table in oracle_by_id.items():
+        rows = table.get("rows", [])
+        if not rows:
+            empty_tables.append(oracle_id)
+            continue
+        odds[oracle_id] = [
+            {"oracle_id": result["oracle_id"], "text": result["text"],
+             "exact": str(result["expected"]), "expected": float(result["expected"])}
+            for result in result_odds(table)
+        ]
+        found = table_coverage(table)
+        if found["gaps"] or found["overlaps"]:
+            coverage[oracle_id] = found
+        blanks = [idx for idx, row in enumerate(rows) if not str(row.get("text", "")).strip()]
+        if blanks:
+            blank_rows[oracle_id] = blanks
+
+    duplicates = duplicate_ids(data.get("sf_oracles", []), data.get("si_oracles", []), data.get("is_oracles", []))
+    return {
+        "tables": len(oracle_by_id),
+        "coverage": coverage,
+        "empty_tables": empty_tables,
+        "blank_rows": blank_rows,
+        "duplicate_ids": {
+            oracle_id: [f"{o['source']} · {o['category']} · {o['name']}" for o in found]
+            for oracle_id, found in duplicates.items()
+        },
+        "unbounded_cycles": graph.unbounded,
+        # oracle_id -> final results with exact ("3/100") and float odds; see result_odds().
+        "result_odds": odds,
+    }
+
+
+def _problem_count(report: dict[str, Any]) -> int:
+    return sum(len(report[key]) for key in ("coverage", "empty_tables", "blank_rows", "duplicate_ids", "unbounded_cycles"))
+
+
+def _format_runs(runs: list[tuple[int, int]]) -> str:
+    return ", ".join(str(a) if a == b else f"{a}–{b}" for a, b in runs)
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(f"{report['tables']} oracle tables, {_problem_count(report)} with problems")
+    for oracle_id, found in report["coverage"].items():
+        if found["gaps"]:
+            print(f"  gap       {oracle_id}: {_format_runs(found['gaps'])} roll(s) give no result")
+        if found["overlaps"]:
+            print(f"  overlap   {oracle_id}: {_format_runs(found['overlaps'])} covered by several rows")
+    for oracle_id in report["empty_tables"]:
+        print(f"  empty     {oracle_id}: no rows")
+    for oracle_id, rows in report["blank_rows"].items():
+        print(f"  blank     {oracle_id}: row(s) {', '.join(str(r + 1) for r in rows)} have no text")
+    for oracle_id, found in report["duplicate_ids"].items():
+        print(f"  duplicate {oracle_id}: defined {len(found)}× — only the last is used")
+        for where in found:
+            print(f"              {where}")
+    for cycle in report["unbounded_cycles"]:
+        print(f"  cycle     {' → '.join(cycle)}: expansion might not finish; links dropped")
+    odds = report["result_odds"]
+    unsolved = [oracle_id for oracle_id, results in odds.items() if not results]
+    print(f"exact odds for {len(odds) - len(unsolved)} tables "
+          f"({sum(len(results) for results in odds.values())} results; --json lists them, --odds ID shows one)")
+    for oracle_id in unsolved:
+        print(f"  no odds   {oracle_id}: no finite expansion")
+
+
+def print_odds(table: dict[str, Any]) -> None:
+    print(f"{table['name']}  ({table['oracle_id']})")
+    results = result_odds(table)
+    if not results:
+        print("  (no finite expansion)")
+    for result in results:
+        origin = "" if result["oracle_id"] == table["oracle_id"] else f"  via {result['oracle_id']}"
+        print(f"  {float(result['expected']):8.3%}  {result['text']}{origin}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check oracle tables for content problems and show exact odds.")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--odds", metavar="ORACLE_ID", action="append", default=[],
+                        help="Show exact result odds for a table (repeatable)")
+    args = parser.parse_args(argv)
+
+    from loader import load_all_data
+    data = load_all_data()
+    report = build_report(data)
+    try:
+        if args.odds:
+            for oracle_id in args.odds:
+                table = data["oracle_by_id"].get(oracle_id)
+                if table is None:
+                    raise SystemExit(f"Unknown oracle: {oracle_id}")
+                print_odds(table)
+            return 0
+        if args.json:
+            json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+            sys.stdout.write("\n")
+        else:
+            print_report(report)
+    except BrokenPipeError:
+        pass
+    return 1 if _problem_count(report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
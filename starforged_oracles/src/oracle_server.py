@@ -0,0 +1,390 @@
+"""oracle_server.py – Local HTTP/JSON service over the oracle data.
+
+Stream overlays, chat bots and other tools on the same machine can roll
+oracles and bundles, look up moves and search without importing the Tk app.
+Everything is loaded once at start-up (load_all_data(), the oracle graph,
+compiled bundle plans and the search indexes), so a request is a dict lookup
+and a roll; the server speaks HTTP/1.1 with keep-alive and handles each
+connection on its own thread.
+
+    python src/oracle_server.py                    # serve on 127.0.0.1:8765
+    python src/oracle_server.py --port 9000 --seed 7
+    python src/oracle_server.py --bench 2000       # start, hammer with the test client, report req/s
+
+Endpoints (GET, JSON responses; errors are {"error": ...} with 400/404):
+    /health
+    /oracles                                      ids, names, sources, categories
+    /oracle?id=ID                                 one table with its rows
+    /roll?id=ID&n=1&cursed_die=0                  {"results": [...]}
+    /bundles                                      ids and names
+    /bundle?name=NAME&n=1&region=&select=KEY=VALUE&cursed_die=0
+                                                  {"rolls": [[...], ...]}; NAME is a bundle id,
+                                                  or a name only one bundle has
+    /move?name=NAME&game=                         moves with that name
+    /search?q=TEXT&kind=oracles|moves|assets&game=&limit=50
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, quote, urlsplit
+
+from oracle_engine import OracleEngine
+from oracle_graph import ROW_LINKS_KEY
+from oracle_index import ROLL_INDEX_KEY, ROLL_TWICE_KEY
+from search_index import SearchIndex
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_ROLLS = 1000  # per request
+MAX_RESULTS = 500
+
+_DERIVED_KEYS = frozenset((ROLL_INDEX_KEY, ROLL_TWICE_KEY, ROW_LINKS_KEY))
+
+
+class RequestError(Exception):
+    """A request the service answers with an HTTP error status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# ---------------------------------------------------------------------------
+# Service (no HTTP; everything preloaded)
+# ---------------------------------------------------------------------------
+
+
+def _table_json(table: dict[str, Any]) -> dict[str, Any]:
+    """*table* without its compiled lookup data, rows as plain dicts."""
+    out = {key: value for key, value in table.items() if key not in _DERIVED_KEYS and key != "rows"}
+    out["rows"] = [dict(row) for row in table.get("rows", [])]
+    return out
+
+
+def _move_json(move: dict[str, Any]) -> dict[str, Any]:
+    return {**move, "tables": [_table_json(table) for table in move.get("tables", [])]}
+
+
+class OracleService:
+    """Answers service requests from data loaded once; safe to share between threads."""
+
+    def __init__(self, data: dict[str, Any] | None = None, seed: int | None = None) -> None:
+        if data is None:
+            from loader import load_all_data
+            data = load_all_data()
+        self.engine = OracleEngine(data, seed)
+        moves = data.get("sf_moves", []) + data.get("si_moves", [])
+        assets = data.get("sf_assets", []) + data.get("si_assets", []) + data.get("is_assets", [])
+        self.moves_by_name: dict[str, list[dict[str, Any]]] = {}
+        for move in moves:
+            self.moves_by_name.setdefault(move["name"].lower(), []).append(move)
+        self.indexes: dict[str, SearchIndex] = {
+            "oracles": SearchIndex(
+                self.engine.oracle_by_id.values(),
+                ("name", "category", "source"),
+                lambda o: (o["source"], o["category"], o["name"]),
+            ),
+            "moves": SearchIndex(moves, ("name", "category"), lambda m: (m["source"], m["category"], m["name"])),
+            "assets": SearchIndex(assets, ("name", "category"), lambda a: (a["source"], a["category"], a["name"])),
+        }
+        # SearchIndex remembers the previous query; keep concurrent searches apart.
+        self._search_lock = threading.Lock()
+        self._routes: dict[str, Callable[[dict[str, list[str]]], Any]] = {
+            "/health": self._health,
+            "/oracles": self._oracles,
+            "/oracle": self._oracle,
+            "/roll": self._roll,
+            "/bundles": self._bundles,
+            "/bundle": self._bundle,
+            "/move": self._move,
+            "/search": self._search,
+        }
+        # Listings never change while serving; encode them once.
+        self._static: dict[str, bytes] = {
+            path: _encode(self._routes[path]({})) for path in ("/oracles", "/bundles")
+        }
+
+    def handle(self, path: str, query: dict[str, list[str]]) -> Any:
+        """Result object for *path*; raises RequestError for bad requests."""
+        route = self._routes.get(path)
+        if route is None:
+            raise RequestError(404, f"Unknown endpoint: {path}")
+        return route(query)
+
+    def handle_bytes(self, path: str, query: dict[str, list[str]]) -> bytes:
+        static = self._static.get(path)
+        return static if static is not None else _encode(self.handle(path, query))
+
+    # -- endpoints ------------------------------------------------------------
+
+    def _health(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        return {"status": "ok", "oracles": len(self.engine.oracle_by_id), "bundles": len(self.engine.bundles)}
+
+    def _oracles(self, query: dict[str, list[str]]) -> list[dict[str, str]]:
+        return [
+            {"oracle_id": oracle_id, "oracle": table["name"], "source": table["source"], "category": table["category"]}
+            for oracle_id, table in self.engine.oracle_by_id.items()
+        ]
+
+    def _oracle(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        oracle_id = _required(query, "id")
+        table = self.engine.oracle_by_id.get(oracle_id)
+        if table is None:
+            raise RequestError(404, f"Unknown oracle: {oracle_id}")
+        return _table_json(table)
+
+    def _roll(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        oracle_id = _required(query, "id")
+        if oracle_id not in self.engine.oracle_by_id:
+            raise RequestError(404, f"Unknown oracle: {oracle_id}")
+        n = _int_param(query, "n", 1, 1, MAX_ROLLS)
+        cursed_die = _int_param(query, "cursed_die", 0, 0, 100)
+        return {"results": self.engine.roll(oracle_id, n, cursed_die)}
+
+    def _bundles(self, query: dict[str, list[str]]) -> list[dict[str, str]]:
+        return [
+            {"id": bundle.get("id", ""), "name": bundle.get("name", ""), "game": bundle.get("game", "")}
+            for bundle in self.engine.bundles
+        ]
+
+    def _bundle(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        name = _required(query, "name")
+        n = _int_param(query, "n", 1, 1, MAX_ROLLS)
+        cursed_die = _int_param(query, "cursed_die", 0, 0, 100)
+        selectors: dict[str, str] = {}
+        for pair in query.get("select", []):
+            key, sep, value = pair.partition("=")
+            if not sep:
+                raise RequestError(400, f"select expects KEY=VALUE, got {pair!r}")
+            selectors[key] = value
+        try:
+            rolls = self.engine.roll_bundle(name, n, _param(query, "region"), selectors, cursed_die)
+        except KeyError as exc:
+            raise RequestError(404, exc.args[0]) from None
+        return {"bundle": name, "rolls": rolls}
+
+    def _move(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        name = _required(query, "name")
+        game = _param(query, "game")
+        moves = [m for m in self.moves_by_name.get(name.lower(), []) if not game or m["source"] == game]
+        if not moves:
+            raise RequestError(404, f"Unknown move: {name}")
+        return {"moves": [_move_json(move) for move in moves]}
+
+    def _search(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        kind = _param(query, "kind") or "oracles"
+        index = self.indexes.get(kind)
+        if index is None:
+            raise RequestError(400, f"kind must be one of {', '.join(self.indexes)}")
+        game = _param(query, "game")
+        limit = _int_param(query, "limit", 50, 1, MAX_RESULTS)
+        with self._search_lock:
+            found = index.search(_param(query, "q"), (lambda r: r["source"] == game) if game else None)
+        return {
+            "kind": kind,
+            "total": len(found),
+            "results": [
+                {"source": r["source"], "category": r["category"], "name": r["name"],
+                 **({"oracle_id": r["oracle_id"]} if kind == "oracles" else {})}
+                for r in found[:limit]
+            ],
+        }
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _param(query: dict[str, list[str]], name: str) -> str:
+    values = query.get(name)
+    return values[-1] if values else ""
+
+
+def _required(query: dict[str, list[str]], name: str) -> str:
+    value = _param(query, name)
+    if not value:
+        raise RequestError(400, f"Missing parameter: {name}")
+    return value
+
+
+def _int_param(query: dict[str, list[str]], name: str, default: int, low: int, high: int) -> int:
+    raw = _param(query, name)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise RequestError(400, f"{name} must be an integer, got {raw!r}") from None
+    if not low <= value <= high:
+        raise RequestError(400, f"{name} must be between {low} and {high}")
+    return value
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive; every response sets Content-Length
+    # Headers and body go out in separate writes; without TCP_NODELAY each
+    # keep-alive response stalls on the client's delayed ACK (~40 ms).
+    disable_nagle_algorithm = True
+    server: OracleHTTPServer
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        try:
+            status, body = 200, self.server.service.handle_bytes(parts.path.rstrip("/") or "/", query)
+        except RequestError as exc:
+            status, body = exc.status, _encode({"error": str(exc)})
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class OracleHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: OracleService, verbose: bool = False) -> None:
+        super().__init__(address, _Handler)
+        self.service = service
+        self.verbose = verbose
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, seed: int | None = None, verbose: bool = False) -> None:
+    server = OracleHTTPServer((host, port), OracleService(seed=seed), verbose)
+    print(f"Serving oracles on http://{host}:{server.server_address[1]}/", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# ---------------------------------------------------------------------------
+# Test client
+# ---------------------------------------------------------------------------
+
+
+class OracleClient:
+    """Minimal keep-alive client for the service (one connection, reused)."""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, timeout: float = 10.0) -> None:
+        self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def get(self, path: str, **params: Any) -> Any:
+        """GET *path* with *params*; list values repeat the parameter."""
+        pairs = [
+            f"{quote(key)}={quote(str(item))}"
+            for key, value in params.items() if value is not None
+            for item in (value if isinstance(value, (list, tuple)) else [value])
+        ]
+        self._conn.request("GET", path + ("?" + "&".join(pairs) if pairs else ""))
+        response = self._conn.getresponse()
+        payload = json.loads(response.read())
+        if response.status != 200:
+            raise RequestError(response.status, payload.get("error", ""))
+        return payload
+
+    def roll(self, oracle_id: str, n: int = 1, cursed_die: int = 0) -> list[dict[str, Any]]:
+        return self.get("/roll", id=oracle_id, n=n, cursed_die=cursed_die)["results"]
+
+    def roll_bundle(self, name: str, n: int = 1, region: str = "") -> list[list[dict[str, Any]]]:
+        return self.get("/bundle", name=name, n=n, region=region or None)["rolls"]
+
+    def move(self, name: str, game: str = "") -> list[dict[str, Any]]:
+        return self.get("/move", name=name, game=game or None)["moves"]
+
+    def search(self, q: str, kind: str = "oracles", limit: int = 50) -> list[dict[str, Any]]:
+        return self.get("/search", q=q, kind=kind, limit=limit)["results"]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def bench(requests: int, clients: int = 4, seed: int | None = None) -> int:
+    """Start a server on a free port and drive it with *clients* keep-alive clients."""
+    server = OracleHTTPServer((DEFAULT_HOST, 0), OracleService(seed=seed))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    probe = OracleClient(port=port)
+    oracle_ids = [o["oracle_id"] for o in probe.get("/oracles")]
+    bundle_ids = [b["id"] for b in probe.get("/bundles")]
+    move_names = [m["name"] for m in probe.search("", kind="moves", limit=MAX_RESULTS)]
+    probe.close()
+    calls: list[Callable[[OracleClient, int], Any]] = [
+        lambda c, i: c.roll(oracle_ids[i % len(oracle_ids)]),
+        lambda c, i: c.roll_bundle(bundle_ids[i % len(bundle_ids)]),
+        lambda c, i: c.move(move_names[i % len(move_names)]),
+        lambda c, i: c.search(("sh", "ra", "ve")[i % 3], kind=("oracles", "moves", "assets")[i % 3]),
+    ]
+    errors: list[BaseException] = []
+
+    def worker(offset: int) -> None:
+        client = OracleClient(port=port)
+        try:
+            for i in range(offset, requests, clients):
+                calls[i % len(calls)](client, i)
+        except BaseException as exc:  # reported below
+            errors.append(exc)
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+    if errors:
+        print(f"failed: {errors[0]!r}", file=sys.stderr)
+        return 1
+    print(f"{requests} requests over {clients} keep-alive connections in {elapsed:.2f} s "
+          f"({requests / elapsed:.0f} req/s)")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve oracle rolls, bundles, moves and search as local HTTP/JSON.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--seed", type=int, default=None, help="Seed the roller for reproducible sessions")
+    parser.add_argument("--verbose", action="store_true", help="Log every request to stderr")
+    parser.add_argument("--bench", type=int, default=0, metavar="N",
+                        help="Instead of serving, run N requests through the test client and report throughput")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent clients for --bench (default: 4)")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        return bench(args.bench, max(1, args.clients), args.seed)
+    serve(args.host, args.port, args.seed, args.verbose)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""oracle_store.py – Compact resident storage for oracle tables.
+
+extract_oracles() produces one dict per table and one dict per row, with the
+source and category strings repeated per table.  compact_oracles() moves the
+rows of a whole slot into one OracleStore: ``min`` and ``max`` become two
+parallel ``array('i')`` columns and each row's text an index into a single,
+deduplicated text table.  Tables become __slots__ records with interned
+source and category strings.
+
+CompactOracle and the row views behave like the old dicts (``oracle["rows"]
+[i]["text"]``, ``.get()``, iteration, ``==`` against a dict), so none of the
+callers change.  Derived keys such as the roll index live in slots of their
+own; any other key set on a table falls back to a small per-table dict.
+"""
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import MutableMapping, Sequence
+from typing import Any, Iterable, Iterator
+
+_NO_BOUND = -(2 ** 31)  # a row without min/max (weighted lists)
+_FIELDS = ("source", "category", "name", "oracle_id", "cursed_version")
+_DERIVED = ("roll_index", "roll_twice_rows", "row_links")
+_ROW_KEYS = ("min", "max", "text")
+_SLOT_KEYS = frozenset(_FIELDS + _DERIVED)
+
+
+def _bound(value: Any) -> int:
+    """A row's min or max as stored in the int column.
+
+    Quoted numbers (e.g. from a custom pack) are coerced; anything else
+    unusable is stored as no bound, so the row still loads and oracle_report
+    shows the gap instead of the whole load failing.
+    """
+    if value is None:
+        return _NO_BOUND
+    try:
+        bound = int(value)
+    except (TypeError, ValueError):
+        return _NO_BOUND
+    return bound if _NO_BOUND < bound < 2 ** 31 else _NO_BOUND
+
+
+class OracleStore:
+    """Rows of many tables: parallel min/max columns and one text table."""
+
+    __slots__ = ("mins", "maxes", "text_ids", "texts", "_text_index")
+
+    def __init__(self) -> None:
+        self.mins = array("i")
+        self.maxes = array("i")
+        self.text_ids = array("I")
+        self.texts: list[str] = []
+        self._text_index: dict[str, int] = {}
+
+    def add_rows(self, rows: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """Append *rows*; return their (start, end) positions."""
+        start = len(self.mins)
+        for row in rows:
+            self.mins.append(_bound(row.get("min")))
+            self.maxes.append(_bound(row.get("max")))
+            text = row.get("text", "")
+            text_id = self._text_index.get(text)
+            if text_id is None:
+                text_id = self._text_index[text] = len(self.texts)
+                self.texts.append(text)
+            self.text_ids.append(text_id)
+        return start, len(self.mins)
+
+    def finish(self) -> None:
+        """Drop the build-time text lookup once no more rows will be added."""
+        self._text_index = {}
+
+    def row_value(self, pos: int, key: str) -> Any:
+        if key == "text":
+            return self.texts[self.text_ids[pos]]
+        if key == "min":
+            value = self.mins[pos]
+        elif key == "max":
+            value = self.maxes[pos]
+        else:
+            raise KeyError(key)
+        return None if value == _NO_BOUND else value
+
+
+class OracleRow(MutableMapping):
+    """Dict-shaped view of one stored row."""
+
+    __slots__ = ("_store", "_pos")
+
+    def __init__(self, store: OracleStore, pos: int) -> None:
+        self._store = store
+        self._pos = pos
+
+    def __getitem__(self, key: str) -> Any:
+        return self._store.row_value(self._pos, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        # Rare (editing a table in place); append the new text rather than reuse.
+        store = self._store
+        if key == "text":
+            store.text_ids[self._pos] = len(store.texts)
+            store.texts.append(value)
+        elif key in ("min", "max"):
+            column = store.mins if key == "min" else store.maxes
+            column[self._pos] = _NO_BOUND if value is None else value
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("oracle rows have a fixed set of keys")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ROW_KEYS)
+
+    def __len__(self) -> int:
+        return len(_ROW_KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class OracleRows(Sequence):
+    """List-shaped view of a table's rows."""
+
+    __slots__ = ("_store", "_start", "_end")
+
+    def __init__(self, store: OracleStore, start: int, end: int) -> None:
+        self._store = store
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [OracleRow(self._store, pos) for pos in range(self._start, self._end)[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return OracleRow(self._store, self._start + index)
+
+    def __iter__(self) -> Iterator[OracleRow]:
+        store = self._store
+        return (OracleRow(store, pos) for pos in range(self._start, self._end))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr([dict(row) for row in self])
+
+
+class CompactOracle(MutableMapping):
+    """An oracle table backed by an OracleStore, usable wherever the dict was."""
+
+    __slots__ = (*_FIELDS, *_DERIVED, "_store", "_start", "_end", "_extra")
+
+    def __init__(self, record: dict[str, Any], store: OracleStore) -> None:
+        self.source: str = sys.intern(record.get("source", ""))
+        self.category: str = sys.intern(record.get("category", ""))
+        self.name: str = record.get("name", "")
+        self.oracle_id: str = record.get("oracle_id", "")
+        self.cursed_version: str = record.get("cursed_version", "")
+        self._store = store
+        self._start, self._end = store.add_rows(record.get("rows", []))
+        self._extra: dict[str, Any] | None = None
+        for key in record:
+            if key not in _FIELDS and key != "rows":
+                self[key] = record[key]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOT_KEYS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if key == "rows":
+            return OracleRows(self._store, self._start, self._end)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Hot path for rolling; skips Mapping.get's try/except round trip.
+        if key in _SLOT_KEYS:
+            return getattr(self, key, default)
+        if key == "rows":
+            return OracleRows(self._store, self._start, self._end)
+        return self._extra.get(key, default) if self._extra is not None else default
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "rows":
+            self._start, self._end = self._store.add_rows(value)
+        elif key in _SLOT_KEYS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _DERIVED and hasattr(self, key):
+            delattr(self, key)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _FIELDS
+        yield "rows"
+        for key in _DERIVED:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"CompactOracle({self.oracle_id!r}, {len(self['rows'])} rows)"
+
+
+def compact_oracles(records: list[dict[str, Any]], store: OracleStore | None = None) -> list[CompactOracle]:
+    """Move *records* (extract_oracles() output) into one shared OracleStore."""
+    store = store if store is not None else OracleStore()
+    compacted = [CompactOracle(record, store) for record in records]
+    store.finish()
+    return compacted
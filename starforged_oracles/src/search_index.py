@@ -0,0 +1,135 @@
+"""search_index.py – Presorted, pre-lowercased search over list records.
+
+Backs the search boxes of the oracles, moves and assets tabs.  Records are
+sorted once and their searchable fields lowercased once.  An inverted index
+maps every 1–3 character substring of those keys to the records containing
+it.  Matching keeps the old "query is a substring of a field" semantics:
+
+* queries of up to three characters are answered straight from the index;
+* longer queries verify only the records under their rarest trigram;
+* a query that extends the previous one (the user typed another character)
+  only re-checks the previous hits.
+
+update() swaps a few records (e.g. a reloaded oracle file) in place: the
+postings of every other record are renumbered, not regenerated.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+_FIELD_SEP = "\n"
+_MAX_GRAM = 3
+
+
+class SearchIndex:
+    """Substring search over *records*, returned in *sort_key* order."""
+
+    def __init__(
+        self,
+        records: Iterable[dict[str, Any]],
+        fields: tuple[str, ...],
+        sort_key: Callable[[dict[str, Any]], Any],
+    ) -> None:
+        self._fields = fields
+        self._sort_key = sort_key
+        self.records: list[dict[str, Any]] = sorted(records, key=sort_key)
+        self._keys = [self._key(record) for record in self.records]
+        self._grams: dict[str, list[int]] = {}
+        for pos, key in enumerate(self._keys):
+            for gram in _key_grams(key):
+                self._grams.setdefault(gram, []).append(pos)
+        self._reset()
+
+    def _key(self, record: dict[str, Any]) -> str:
+        return _FIELD_SEP.join(str(record.get(field, "")).lower() for field in self._fields)
+
+    def _reset(self) -> None:
+        self._all = list(range(len(self.records)))
+        self._last_query = ""
+        self._last_hits = self._all
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def update(self, removed: Iterable[dict[str, Any]], added: Iterable[dict[str, Any]]) -> None:
+        """Drop *removed* records (by identity) and index *added* ones."""
+        gone = {id(record) for record in removed}
+        added = list(added)
+        keep = [pos for pos, record in enumerate(self.records) if id(record) not in gone]
+        # sorted() is stable and the kept records are already in order, so
+        # their relative order (and so each posting list's order) survives.
+        records = sorted([self.records[pos] for pos in keep] + added, key=self._sort_key)
+        new_pos = {id(record): pos for pos, record in enumerate(records)}
+        renumber = [-1] * len(self.records)
+        for pos in keep:
+            renumber[pos] = new_pos[id(self.records[pos])]
+
+        keys = [""] * len(records)
+        for pos in keep:
+            keys[renumber[pos]] = self._keys[pos]
+        grams: dict[str, list[int]] = {}
+        for gram, positions in self._grams.items():
+            moved = [renumber[pos] for pos in positions if renumber[pos] >= 0]
+            if moved:
+                grams[gram] = moved
+        touched: set[str] = set()
+        for record in added:
+            pos = new_pos[id(record)]
+            keys[pos] = key = self._key(record)
+            for gram in _key_grams(key):
+                grams.setdefault(gram, []).append(pos)
+                touched.add(gram)
+        for gram in touched:
+            grams[gram].sort()
+
+        self.records, self._keys, self._grams = records, keys, grams
+        self._reset()
+
+    def positions(self, query: str) -> list[int]:
+        """Ascending positions (into ``records``) of records matching *query*."""
+        query = query.strip().lower()
+        if not query:
+            return self._all
+        if _FIELD_SEP in query:
+            return []
+
+        if self._last_query and self._last_query in query:
+            candidates = self._last_hits
+        elif len(query) <= _MAX_GRAM:
+            candidates = self._grams.get(query, [])
+        else:
+            candidates = min(
+                (self._grams.get(query[i:i + _MAX_GRAM], []) for i in range(len(query) - _MAX_GRAM + 1)),
+                key=len,
+            )
+
+        if len(query) <= _MAX_GRAM and candidates is not self._last_hits:
+            hits = candidates
+        else:
+            keys = self._keys
+            hits = [pos for pos in candidates if query in keys[pos]]
+        self._last_query, self._last_hits = query, hits
+        return hits
+
+    def search(
+        self,
+        query: str,
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Records matching *query* (and *predicate*, if given), in sorted order."""
+        records = self.records
+        matches = [records[pos] for pos in self.positions(query)]
+        if predicate is None:
+            return matches
+        return [record for record in matches if predicate(record)]
+
+
+def _key_grams(key: str) -> set[str]:
+    """Every 1.._MAX_GRAM character substring of *key* within one field."""
+    grams: set[str] = set()
+    for size in range(1, _MAX_GRAM + 1):
+        for start in range(len(key) - size + 1):
+            gram = key[start:start + size]
+            if _FIELD_SEP not in gram:
+                grams.add(gram)
+    return grams
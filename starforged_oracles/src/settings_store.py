@@ -0,0 +1,83 @@
+"""settings_store.py – In-memory user settings with background saves.
+
+Changing a setting used to rewrite user_settings.json on the Tk thread every
+time, so flicking through regions while rolling bundles hitched the UI.
+SettingsStore keeps the settings in memory: set() updates them, tells the
+section's subscribers straight away and wakes the DebouncedWriter thread,
+which saves the file through a temp file and rename once a burst of changes
+has settled.  close() flushes whatever is pending.
+
+Settings are two levels deep ({"regions": {"Starforged": "Terminus"}}), so
+values are addressed by (section, key) and subscriptions are per section.
+"""
+from __future__ import annotations
+
+import copy
+from typing import Any, Callable
+
+from debounced_writer import DebouncedWriter
+from loader import save_settings
+
+Subscriber = Callable[[str, Any], None]
+
+
+class SettingsStore(DebouncedWriter):
+    """Owns the settings dict; call set()/subscribe() from the Tk thread."""
+
+    def __init__(self, settings: dict[str, Any]) -> None:
+        self._settings = settings
+        self._subscribers: dict[str, list[Subscriber]] = {}
+        self._dirty = False
+        super().__init__("settings-store")
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The live settings dict; read it freely, change it only through set()."""
+        return self._settings
+
+    def get(self, section: str, key: str, default: Any = None) -> Any:
+        return self._settings.get(section, {}).get(key, default)
+
+    def set(self, section: str, key: str, value: Any) -> bool:
+        """Change one setting; returns False (and does nothing) if it already had *value*."""
+        with self._cond:
+            values = self._settings.setdefault(section, {})
+            if key in values and values[key] == value:
+                return False
+            values[key] = value
+            self._dirty = True
+            self._cond.notify()
+        for callback in list(self._subscribers.get(section, ())):
+            callback(key, value)
+        return True
+
+    def subscribe(self, section: str, callback: Subscriber) -> Callable[[], None]:
+        """Call ``callback(key, value)`` after every change in *section*; returns an unsubscribe function."""
+        self._subscribers.setdefault(section, []).append(callback)
+
+        def unsubscribe() -> None:
+            callbacks = self._subscribers.get(section, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+        return unsubscribe
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _pending(self) -> bool:
+        return self._dirty
+
+    def _write_pending(self) -> None:
+        with self._cond:
+            if not self._dirty:
+                return
+            self._dirty = False
+            snapshot = copy.deepcopy(self._settings)
+        try:
+            save_settings(snapshot)
+        except OSError:
+            # Keep the change pending; the next change or close() retries it.
+            with self._cond:
+                self._dirty = True
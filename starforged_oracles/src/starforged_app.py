@@ -6,15 +6,36 @@ Data must be downloaded first:
 
 Usage:
     python src/starforged_app.py
+    python src/starforged_app.py --profile-startup   # time imports, data files and tab builds
+    python src/starforged_app.py --check-startup     # exit 1 if the first window misses its budget
 """
 from __future__ import annotations
 
+import sys
+
+from startup_profile import PROFILE
+
+if __name__ == "__main__":
+    # Before the remaining imports so --profile-startup can time them.
+    PROFILE.configure(sys.argv)
+
+import multiprocessing
+import queue
+import threading
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk
-from typing import Any
+from typing import Any, Callable
 
 import widgets  # applies the tk.Text.grid monkey-patch on import
-from loader import load_all_data, save_settings
+from character_store import CharacterStore
+from file_watcher import DirectoryWatcher
+from loader import (
+    CUSTOM_ORACLES_DIR, CUSTOM_ORACLES_SLOT, DATASET_ORDER, GAME_SLOTS, GAMES, build_oracle_index,
+    extract_uncached, load_core_data, load_custom_oracle_file, load_slots,
+)
+from oracle_graph import OracleGraph
+from settings_store import SettingsStore
 from styles import BG, configure_styles
 from tabs.assets import AssetsTabMixin
 from tabs.bundles import BundlesTabMixin
@@ -24,6 +45,21 @@ from tabs.moves import MovesTabMixin
 from tabs.oracles import OraclesTabMixin
 from tabs.settings import SettingsTabMixin
 
+# How often data/custom_oracles/ is checked for edited packs.
+CUSTOM_ORACLE_POLL_MS = 1000
+
+# Tab key -> (data kind, handler) pairs run when that kind of game data is
+# merged.  Handlers only run for built tabs; a tab built later reads whatever
+# has loaded by then.
+_TAB_DATA_HOOKS: dict[str, tuple[tuple[str, str], ...]] = {
+    "character": (("assets", "_on_character_asset_data_loaded"),),
+    "moves": (("moves", "_on_move_data_loaded"),),
+    "oracles": (("oracles", "_on_oracle_data_loaded"),),
+    "bundles": (("oracles", "_on_bundle_oracle_data_loaded"),),
+    "assets": (("assets", "_on_asset_data_loaded"),),
+}
+
+
 class App(
     CharacterTabMixin,
     DiceTabMixin,
@@ -44,52 +80,302 @@ class App(
         configure_styles(self)
         self._load_data()
         self._build_ui()
+        self.after_idle(self._start_background_loading)
+        self.after(CUSTOM_ORACLE_POLL_MS, self._poll_custom_oracles)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        if PROFILE.enabled:
+            self.bind("<Map>", self._on_first_map, add="+")
 
     # ------------------------------------------------------------------
     # Data
     # ------------------------------------------------------------------
 
     def _load_data(self) -> None:
-        data = load_all_data()
-        self._sf_moves: list[dict[str, Any]] = data["sf_moves"]
-        self._si_moves: list[dict[str, Any]] = data["si_moves"]
-        self._sf_oracles: list[dict[str, Any]] = data["sf_oracles"]
-        self._si_oracles: list[dict[str, Any]] = data["si_oracles"]
-        self._is_oracles: list[dict[str, Any]] = data["is_oracles"]
-        self._sf_assets: list[dict[str, Any]] = data["sf_assets"]
-        self._si_assets: list[dict[str, Any]] = data["si_assets"]
-        self._is_assets: list[dict[str, Any]] = data["is_assets"]
-        self._oracle_by_id: dict[str, dict[str, Any]] = data["oracle_by_id"]
+        """Load game-independent data; each game's tables load lazily."""
+        data = load_core_data()
+        self._sf_moves: list[dict[str, Any]] = []
+        self._si_moves: list[dict[str, Any]] = []
+        self._sf_oracles: list[dict[str, Any]] = []
+        self._si_oracles: list[dict[str, Any]] = []
+        self._is_oracles: list[dict[str, Any]] = []
+        self._sf_assets: list[dict[str, Any]] = []
+        self._si_assets: list[dict[str, Any]] = []
+        self._is_assets: list[dict[str, Any]] = []
+        self._oracle_by_id: dict[str, dict[str, Any]] = {}
+        self._oracle_graph = OracleGraph(self._oracle_by_id)
         self._bundles: list[dict[str, Any]] = data["bundles"]
         self._game_regions: dict[str, list[str]] = data["game_regions"]
-        self._settings: dict[str, Any] = data["settings"]
+        self._settings_store = SettingsStore(data["settings"])
+        # Read-only view; changes go through self._settings_store.set().
+        self._settings: dict[str, Any] = self._settings_store.data
         self._characters: list[dict[str, Any]] = data["characters"]
+        self._character_store = CharacterStore(self._characters)
+
+        self._loaded_slots: set[str] = set()
+        self._queued_slots: set[str] = set()
+        self._slot_load_lock = threading.Lock()
+        # (event, slot, records, origins); the loader thread fills its own origins
+        # dict and _drain_slot_loads merges it into _oracle_files on the Tk thread.
+        self._slot_load_queue: queue.Queue[
+            tuple[str, str, list[dict[str, Any]] | None, dict[Path, list[dict[str, Any]]] | None]
+        ] = queue.Queue()
+        self._slot_load_thread: threading.Thread | None = None
+        self._slot_load_total = 0
+        # path -> the records each oracle file contributed (filled by load_slots).
+        self._oracle_files: dict[Path, list[dict[str, Any]]] = {}
+        self._custom_oracle_watcher = DirectoryWatcher(CUSTOM_ORACLES_DIR)
+        self._status_hide_after_id: str | None = None
+
+    def _on_close(self) -> None:
+        if self._character_autosave_after_id is not None:
+            self.after_cancel(self._character_autosave_after_id)
+            self._autosave_character()
+        self._character_store.close()
+        self._settings_store.close()
+        self.destroy()
+
+    def _preferred_game_order(self) -> list[str]:
+        """GAMES with the last-used character's game first."""
+        last_id = self._settings.get("character", {}).get("last_id", "")
+        first = next(
+            (c.get("game") for c in self._characters if c.get("id") == last_id), None
+        )
+        return sorted(GAMES, key=lambda g: g != first)
+
+    def _background_slot_order(self) -> list[str]:
+        """Every game's oracles, then moves, then assets (preferred game first)."""
+        games = self._preferred_game_order()
+        return [
+            slot
+            for kind in DATASET_ORDER
+            for game in games
+            for slot in GAME_SLOTS[game]
+            if slot.endswith(f"_{kind}")
+        ]
+
+    def _start_background_loading(self) -> None:
+        pending = [s for s in self._background_slot_order() if s not in self._loaded_slots]
+        if not pending:
+            self._load_status_label.pack_forget()
+            PROFILE.report()
+            return
+        self._slot_load_total = len(pending)
+        self._slot_load_thread = threading.Thread(
+            target=self._background_load_slots, args=(pending,), daemon=True
+        )
+        self._slot_load_thread.start()
+        self.after(50, self._poll_slot_loads)
+
+    def _background_load_slots(self, slots: list[str]) -> None:
+        # Worker thread: no Tk calls here; results are merged by _poll_slot_loads.
+        # One kind at a time in DATASET_ORDER: the kind's uncached files are parsed
+        # in one worker pool, then each of its slots streams from the cache.  The
+        # lock is held meanwhile, so _ensure_game_loaded waits instead of re-parsing.
+        for kind in DATASET_ORDER:
+            with self._slot_load_lock:
+                group = [
+                    slot for slot in slots
+                    if slot.endswith(f"_{kind}") and slot not in self._loaded_slots and slot not in self._queued_slots
+                ]
+                if not group:
+                    continue
+                self._slot_load_queue.put(("loading", group[0], None, None))
+                extract_uncached(group)
+                for slot in group:
+                    self._slot_load_queue.put(("loading", slot, None, None))
+                    origins: dict[Path, list[dict[str, Any]]] = {}
+                    records = load_slots((slot,), parallel=False, origins=origins)[slot]
+                    self._queued_slots.add(slot)
+                    self._slot_load_queue.put(("loaded", slot, records, origins))
+
+    def _poll_slot_loads(self) -> None:
+        self._drain_slot_loads()
+        thread = self._slot_load_thread
+        if thread is not None and thread.is_alive() or not self._slot_load_queue.empty():
+            self.after(50, self._poll_slot_loads)
+        else:
+            self._load_status_label.pack_forget()
+            PROFILE.report()
+
+    def _drain_slot_loads(self) -> None:
+        while True:
+            try:
+                event, slot, records, origins = self._slot_load_queue.get_nowait()
+            except queue.Empty:
+                return
+            if event == "loading":
+                self._show_load_progress(slot)
+            elif slot not in self._loaded_slots and records is not None:
+                self._oracle_files.update(origins or {})
+                self._merge_slot_data({slot: records})
+
+    def _show_load_progress(self, slot: str) -> None:
+        done = len(self._loaded_slots)
+        total = max(done + 1, self._slot_load_total)
+        game = next(g for g, slots in GAME_SLOTS.items() if slot in slots)
+        self._load_status_var.set(f"Loading {game} {slot.split('_', 1)[1]}…  ({done + 1}/{total})")
+
+    def _ensure_game_loaded(self, game: str) -> None:
+        """Load a game's tables now if the background thread hasn't yet."""
+        missing = [s for s in GAME_SLOTS.get(game, ()) if s not in self._loaded_slots]
+        if not missing:
+            return
+        # Holding the lock waits out an in-flight background load.
+        with self._slot_load_lock:
+            self._drain_slot_loads()
+            missing = [s for s in missing if s not in self._loaded_slots]
+            if not missing:
+                return
+            data = load_slots(missing, origins=self._oracle_files)
+            self._loaded_slots.update(missing)
+        self._merge_slot_data(data)
+
+    def _merge_slot_data(self, data: dict[str, list[dict[str, Any]]]) -> None:
+        for slot, records in data.items():
+            setattr(self, f"_{slot}", records)
+        self._loaded_slots.update(data)
+        kinds = {slot.split("_", 1)[1] for slot in data}
+        if "oracles" in kinds:
+            self._oracle_by_id = build_oracle_index(self._sf_oracles, self._si_oracles, self._is_oracles)
+            self._oracle_graph = OracleGraph(self._oracle_by_id, self._bundles)
+        # Tabs not built yet pick the data up when they are.
+        for key, hooks in _TAB_DATA_HOOKS.items():
+            if key in self._built_tabs:
+                for kind, hook in hooks:
+                    if kind in kinds:
+                        getattr(self, hook)()
+
+    # ------------------------------------------------------------------
+    # Custom oracle hot reload
+    # ------------------------------------------------------------------
+
+    def _poll_custom_oracles(self) -> None:
+        try:
+            changed = self._custom_oracle_watcher.poll()
+            # Until the slot has loaded there is nothing to patch; its load reads the new files.
+            if changed and CUSTOM_ORACLES_SLOT in self._loaded_slots:
+                for path in changed:
+                    try:
+                        self._reload_oracle_file(path)
+                    except ValueError as exc:
+                        self._show_status(f"Custom oracles not reloaded — {exc}")
+        finally:
+            # Keep watching even if a reload failed unexpectedly.
+            self.after(CUSTOM_ORACLE_POLL_MS, self._poll_custom_oracles)
+
+    def _reload_oracle_file(self, path: Path) -> None:
+        """Swap one custom pack's tables for a fresh extraction of *path*."""
+        added = load_custom_oracle_file(path)
+        removed = self._oracle_files.pop(path, [])
+        if added:
+            self._oracle_files[path] = added
+
+        slot = f"_{CUSTOM_ORACLES_SLOT}"
+        records: list[dict[str, Any]] = getattr(self, slot)
+        gone = {id(record) for record in removed}
+        at = next((i for i, record in enumerate(records) if id(record) in gone), None)
+        kept = [record for record in records if id(record) not in gone]
+        if at is None:
+            # A new pack goes before the first pack that sorts after it, as on a restart.
+            later = {id(r) for p, rs in self._oracle_files.items() if p.parent == path.parent and p > path for r in rs}
+            at = next((i for i, record in enumerate(kept) if id(record) in later), len(kept))
+        setattr(self, slot, kept[:at] + added + kept[at:])
+
+        # Re-resolve only the ids this file defined before or after (later games still win).
+        affected = {o["oracle_id"] for o in removed + added if o.get("oracle_id")}
+        for oracle_id in affected:
+            self._oracle_by_id.pop(oracle_id, None)
+        for oracle in self._sf_oracles + self._si_oracles + self._is_oracles:
+            if oracle.get("oracle_id") in affected:
+                self._oracle_by_id[oracle["oracle_id"]] = oracle
+        # Row links point at table objects, so the graph is relinked as a whole.
+        self._oracle_graph = OracleGraph(self._oracle_by_id, self._bundles)
+
+        if "oracles" in self._built_tabs:
+            self._on_oracle_tables_replaced(removed, added)
+        if "bundles" in self._built_tabs:
+            self._on_bundle_oracle_data_loaded()
+        if added:
+            self._show_status(f"Reloaded {path.name} ({len(added)} {'table' if len(added) == 1 else 'tables'})",
+                              hide_after_ms=4000)
+        else:
+            self._show_status(f"Removed {path.name}", hide_after_ms=4000)
+
+    def _show_status(self, text: str, hide_after_ms: int | None = None) -> None:
+        """Show *text* in the status line at the bottom of the window."""
+        if self._status_hide_after_id is not None:
+            self.after_cancel(self._status_hide_after_id)
+            self._status_hide_after_id = None
+        self._load_status_var.set(text)
+        if not self._load_status_label.winfo_ismapped():
+            self._load_status_label.pack(side="bottom", fill="x", padx=8, pady=(0, 4), before=self._notebook)
+        if hide_after_ms is not None:
+            self._status_hide_after_id = self.after(hide_after_ms, self._hide_status)
+
+    def _hide_status(self) -> None:
+        self._status_hide_after_id = None
+        thread = self._slot_load_thread
+        if thread is None or not thread.is_alive():  # else the load progress keeps the line
+            self._load_status_label.pack_forget()
 
     # ------------------------------------------------------------------
     # UI
     # ------------------------------------------------------------------
 
     def _build_ui(self) -> None:
+        self._load_status_var = tk.StringVar(value="Loading game data…")
+        self._load_status_label = ttk.Label(self, textvariable=self._load_status_var, style="Cat.TLabel")
+        self._load_status_label.pack(side="bottom", fill="x", padx=8, pady=(0, 4))
+
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True, padx=6, pady=6)
+        self._notebook = notebook
 
-        for label, builder in (
-            ("  Character  ", self._build_character_tab),
-            ("  Roller  ", self._build_dice_tab),
-            ("  Moves  ",   self._build_moves_tab),
-            ("  Oracles  ", self._build_oracles_tab),
-            ("  Bundles  ", self._build_bundles_tab),
-            ("  Assets  ",  self._build_assets_tab),
-            ("  Settings  ", self._build_settings_tab),
+        # Only the selected tab is built up front; the rest on first selection.
+        self._built_tabs: set[str] = set()
+        self._unbuilt_tabs: dict[str, tuple[str, Callable[[ttk.Frame], None]]] = {}
+        for key, label, builder in (
+            ("character", "  Character  ", self._build_character_tab),
+            ("dice",      "  Roller  ",    self._build_dice_tab),
+            ("moves",     "  Moves  ",     self._build_moves_tab),
+            ("oracles",   "  Oracles  ",   self._build_oracles_tab),
+            ("bundles",   "  Bundles  ",   self._build_bundles_tab),
+            ("assets",    "  Assets  ",    self._build_assets_tab),
+            ("settings",  "  Settings  ",  self._build_settings_tab),
         ):
             tab = ttk.Frame(notebook)
             notebook.add(tab, text=label)
-            builder(tab)
+            self._unbuilt_tabs[str(tab)] = (key, builder)
+        self._build_selected_tab()
+        notebook.bind("<<NotebookTabChanged>>", lambda _e: self._build_selected_tab())
+
+    def _build_selected_tab(self) -> None:
+        name = self._notebook.select()
+        entry = self._unbuilt_tabs.pop(name, None)
+        if entry is None:
+            return
+        key, builder = entry
+        with PROFILE.span("tab", key):
+            builder(self._notebook.nametowidget(name))
+        self._built_tabs.add(key)
+
+    def _on_first_map(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        if event.widget is not self or PROFILE.first_window is not None:
+            return
+        PROFILE.mark_first_window()
+        if PROFILE.check:
+            PROFILE.report()
+            self.after_idle(self._on_close)
 
     # ------------------------------------------------------------------
     # Shared helpers (used by all tab mixins via self)
     # ------------------------------------------------------------------
 
+    def _game_sources(self, slot_suffix: str, records: list[dict[str, Any]]) -> list[str]:
+        """Games offering a kind of data (even if not loaded yet) plus loaded sources."""
+        games = {g for g, slots in GAME_SLOTS.items() if any(s.endswith(slot_suffix) for s in slots)}
+        return sorted(games | {r["source"] for r in records})
+
     @staticmethod
     def _short_source(source: str) -> str:
         return {"Starforged": "SF", "Sundered Isles": "SI", "Ironsworn": "IS"}.get(
@@ -108,26 +394,8 @@ class App(
         regions = self._game_regions.get(game, [])
         if regions and region not in regions:
             return
-
-        current = self._settings.setdefault("regions", {}).get(game)
-        if current != region:
-            self._settings["regions"][game] = region
-            save_settings(self._settings)
-
-        settings_region_vars = getattr(self, "_settings_region_vars", {})
-        settings_var = settings_region_vars.get(game)
-        if settings_var is not None and settings_var.get() != region:
-            settings_var.set(region)
-
-        current_bundle = getattr(self, "_current_bundle", None)
-        bundle_region_var = getattr(self, "_bundle_region_var", None)
-        if (
-            current_bundle
-            and bundle_region_var is not None
-            and current_bundle.get("game") == game
-            and bundle_region_var.get() != region
-        ):
-            bundle_region_var.set(region)
+        # Tabs showing the region follow through their "regions" subscriptions.
+        self._settings_store.set("regions", game, region)
 
     @staticmethod
     def _rebuild_option_menu(
@@ -142,7 +410,11 @@ class App(
 def main() -> None:
     app = App()
     app.mainloop()
+    if PROFILE.check:
+        sys.exit(1 if PROFILE.over_budget else 0)
 
 
 if __name__ == "__main__":
+    # Needed for the loader's worker processes in a PyInstaller build.
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,126 @@
+"""startup_profile.py – Opt-in timing of the app's start-up.
+
+    python src/starforged_app.py --profile-startup   # report to stderr once loading finishes
+    python src/starforged_app.py --check-startup     # close after the first window; exit 1 if over budget
+
+Times are measured from when this module is imported, which starforged_app
+does before anything else (interpreter start-up itself is not included).
+Recorded are each top-level import of the app module, every data file the
+loader reads (and whether the compiled cache served it), each tab build
+(tabs are built on first selection) and the moment the first window is
+mapped.  Nothing is recorded unless profiling was switched on.
+
+The first-window budget defaults to FIRST_WINDOW_BUDGET seconds and can be
+overridden with the STARFORGED_STARTUP_BUDGET environment variable.
+"""
+from __future__ import annotations
+
+import builtins
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+FIRST_WINDOW_BUDGET = 1.0  # seconds from start-up to the mapped main window
+
+_T0 = time.perf_counter()
+
+
+class StartupProfile:
+    """Collects (section, name, seconds, note) records while enabled."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.check = False
+        self.records: list[tuple[str, str, float, str]] = []
+        self.first_window: float | None = None
+        self._reported = False
+        self._real_import = builtins.__import__
+
+    # -- switching on -----------------------------------------------------------
+
+    def configure(self, argv: list[str]) -> None:
+        """Enable profiling if *argv* asks for it; strips the flags it handles."""
+        for flag in ("--profile-startup", "--check-startup"):
+            if flag in argv:
+                argv.remove(flag)
+                self.enabled = True
+                self.check = self.check or flag == "--check-startup"
+        if self.enabled:
+            builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name: str, globals: Any = None, locals: Any = None,
+                      fromlist: Any = (), level: int = 0) -> Any:
+        # Only the app module's own imports, inclusive of everything they pull in.
+        if level or not globals or globals.get("__name__") != "__main__":
+            return self._real_import(name, globals, locals, fromlist, level)
+        start = time.perf_counter()
+        try:
+            return self._real_import(name, globals, locals, fromlist, level)
+        finally:
+            self.record("import", name, time.perf_counter() - start)
+
+    # -- recording --------------------------------------------------------------
+
+    def record(self, section: str, name: str, seconds: float, note: str = "") -> None:
+        if not self.enabled:
+            return
+        self.records.append((section, name, seconds, note))
+        if self._reported:
+            # Late events (e.g. a tab opened after the report) print as they happen.
+            print(f"  {section:<7} {name:<44} {seconds * 1000:8.1f} ms  {note}", file=sys.stderr)
+
+    @contextmanager
+    def span(self, section: str, name: str, note: str = "") -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(section, name, time.perf_counter() - start, note)
+
+    def mark_first_window(self) -> None:
+        if self.enabled and self.first_window is None:
+            builtins.__import__ = self._real_import
+            self.first_window = time.perf_counter() - _T0
+
+    # -- reporting --------------------------------------------------------------
+
+    @property
+    def budget(self) -> float:
+        try:
+            return float(os.environ.get("STARFORGED_STARTUP_BUDGET", FIRST_WINDOW_BUDGET))
+        except ValueError:
+            return FIRST_WINDOW_BUDGET
+
+    @property
+    def over_budget(self) -> bool:
+        return self.first_window is None or self.first_window > self.budget
+
+    def report(self) -> None:
+        """Print every record so far, grouped by section, then the first-window time."""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        out = sys.stderr
+        print("Startup profile", file=out)
+        for section, heading in (("import", "imports"), ("data", "data files"), ("tab", "tab builds")):
+            rows = [r for r in self.records if r[0] == section]
+            if not rows:
+                continue
+            total = sum(seconds for _s, _n, seconds, _note in rows)
+            print(f"  {heading}: {total * 1000:.1f} ms", file=out)
+            for _section, name, seconds, note in sorted(rows, key=lambda r: -r[2]):
+                print(f"    {name:<50} {seconds * 1000:8.1f} ms  {note}", file=out)
+        if self.first_window is None:
+            print("  first window: not shown", file=out)
+        else:
+            verdict = "over budget" if self.over_budget else "within budget"
+            print(f"  first window: {self.first_window * 1000:.0f} ms "
+                  f"(budget {self.budget * 1000:.0f} ms, {verdict})", file=out)
+
+
+PROFILE = StartupProfile()
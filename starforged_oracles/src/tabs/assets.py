@@ -6,9 +6,10 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 from typing import Any, TYPE_CHECKING
 
+from search_index import SearchIndex
 from styles import ACCENT, BG, BORDER, FG, PANEL_BG
 from widgets import (
-    make_listbox_frame, make_option_menu, make_paned, make_search_entry,
+    ListView, make_listbox_frame, make_option_menu, make_paned, make_search_entry,
     make_textbox, rebuild_option_menu, set_text_lines,
 )
 
@@ -34,14 +35,10 @@ class AssetsTabMixin:
         ttk.Label(left, text="Game", style="Cat.TLabel").grid(
             row=0, column=0, sticky="w", padx=8, pady=(8, 2)
         )
-        all_sources = sorted(
-            {a["source"] for a in getattr(self, '_sf_assets', []) + getattr(self, '_si_assets', []) + getattr(self, '_is_assets', [])}
-        )
         self._asset_game_var = tk.StringVar(value="All")
         self._asset_game_var.trace_add("write", lambda *_: self._on_asset_game_change())
-        make_option_menu(left, self._asset_game_var, ["All"] + all_sources).grid(
-            row=1, column=0, sticky="ew", padx=8, pady=(0, 4)
-        )
+        self._asset_game_om = make_option_menu(left, self._asset_game_var, self._asset_game_options())
+        self._asset_game_om.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 4))
 
         ttk.Label(left, text="Category", style="Cat.TLabel").grid(
             row=2, column=0, sticky="w", padx=8, pady=(4, 2)
@@ -67,6 +64,7 @@ class AssetsTabMixin:
         lf, self._asset_listbox = make_listbox_frame(left)
         lf.grid(row=5, column=0, sticky="nsew", padx=4, pady=4)
         self._asset_listbox.bind("<<ListboxSelect>>", self._on_asset_select)
+        self._asset_list_view = ListView(self._asset_listbox, self._asset_list_label)
 
         # --- Right panel ---
         right = ttk.Frame(paned, style="Panel.TFrame")
@@ -92,6 +90,7 @@ class AssetsTabMixin:
         self._asset_text.grid(row=1, column=0, sticky="nsew", padx=6, pady=4)
 
         self._assets_visible: list[dict[str, Any]] = []
+        self._asset_search_index = self._build_asset_search_index()
         self._refresh_asset_category_options()
         self._refresh_asset_list()
 
@@ -99,7 +98,29 @@ class AssetsTabMixin:
     # Filtering
     # ------------------------------------------------------------------
 
+    def _asset_game_options(self) -> list[str]:
+        all_assets = getattr(self, '_sf_assets', []) + getattr(self, '_si_assets', []) + getattr(self, '_is_assets', [])
+        return ["All"] + self._game_sources("_assets", all_assets)
+
+    def _build_asset_search_index(self) -> SearchIndex:
+        all_assets = getattr(self, '_sf_assets', []) + getattr(self, '_si_assets', []) + getattr(self, '_is_assets', [])
+        return SearchIndex(
+            all_assets,
+            ("name", "category"),
+            lambda a: (a["source"], a["category"], a["name"]),
+        )
+
+    def _on_asset_data_loaded(self) -> None:
+        self._asset_search_index = self._build_asset_search_index()
+        self._asset_list_view.forget_labels()
+        rebuild_option_menu(self._asset_game_om, self._asset_game_var, self._asset_game_options())
+        self._refresh_asset_category_options()
+        self._refresh_asset_list()
+
     def _on_asset_game_change(self) -> None:
+        game_filter = self._asset_game_var.get()
+        if game_filter != "All":
+            self._ensure_game_loaded(game_filter)
         self._refresh_asset_category_options()
         self._refresh_asset_list()
 
@@ -123,21 +144,17 @@ class AssetsTabMixin:
     def _refresh_asset_list(self) -> None:
         game_filter = self._asset_game_var.get()
         cat_filter = self._asset_selected_cat
-        query = self._asset_search_var.get().strip().lower()
-        all_assets = getattr(self, '_sf_assets', []) + getattr(self, '_si_assets', []) + getattr(self, '_is_assets', [])
-        filtered = [
-            a for a in all_assets
-            if (game_filter == "All" or a["source"] == game_filter)
-            and (cat_filter == "All" or a["category"] == cat_filter)
-            and (not query or query in a["name"].lower() or query in a["category"].lower())
-        ]
-        filtered.sort(key=lambda a: (a["source"], a["category"], a["name"]))
+        filtered = self._asset_search_index.search(
+            self._asset_search_var.get(),
+            lambda a: (game_filter == "All" or a["source"] == game_filter)
+            and (cat_filter == "All" or a["category"] == cat_filter),
+        )
         self._assets_visible = filtered
-        self._asset_listbox.delete(0, tk.END)
+        self._asset_list_view.set_records(filtered)
+
+    def _asset_list_label(self, a: dict[str, Any], _variant: Any) -> str:
         short_source = getattr(self, '_short_source', lambda s: s)
-        for a in filtered:
-            label = f"[{short_source(a['source'])}]  {a['category']} › {a['name']}"
-            self._asset_listbox.insert(tk.END, label)
+        return f"[{short_source(a['source'])}]  {a['category']} › {a['name']}"
 
     # ------------------------------------------------------------------
     # Selection & display
@@ -1,11 +1,12 @@
 """tabs/bundles.py – Bundles tab mixin."""
 from __future__ import annotations
 
-import random
 import tkinter as tk
 from tkinter import ttk
 from typing import Any, TYPE_CHECKING
 
+from loader import GAME_SLOTS
+from oracle_engine import BundlePlan, compile_bundle, compile_bundles, run_plan
 from styles import ACCENT, BG, BORDER, FG, HIT_MISS, PANEL_BG
 from widgets import (
     make_listbox_frame, make_option_menu, make_paned, make_textbox, rebuild_option_menu,
@@ -18,32 +19,6 @@ if TYPE_CHECKING:
 
 class BundlesTabMixin:
 
-    @staticmethod
-    def _is_roll_twice_result(text: str) -> bool:
-        return text.strip().lower() == "roll twice"
-
-    def _resolve_oracle_roll_text(self, oracle: dict[str, Any], depth: int = 0) -> str:
-        if depth > 4:
-            return "[Roll recursion limit reached]"
-
-        roll = random.randint(1, 100)
-        result_text = next(
-            (
-                row["text"] for row in oracle.get("rows", [])
-                if row.get("min") is not None and row["min"] <= roll <= row["max"]
-            ),
-            "",
-        )
-
-        if self._is_roll_twice_result(result_text):
-            a = self._resolve_oracle_roll_text(oracle, depth + 1)
-            b = self._resolve_oracle_roll_text(oracle, depth + 1)
-            if depth == 0:
-                return f"Roll twice -> {a} + {b}"
-            return f"{a} + {b}"
-
-        return result_text
-
     # ------------------------------------------------------------------
     # Build
     # ------------------------------------------------------------------
@@ -139,7 +114,40 @@ class BundlesTabMixin:
 
         self._current_bundle: dict[str, Any] | None = None
         self._bundles_visible: list[dict[str, Any]] = []
+        self._bundle_plans: dict[str, BundlePlan] = {}
         self._refresh_bundle_list()
+        self._on_bundle_oracle_data_loaded()
+        self._settings_store.subscribe("regions", self._on_bundle_region_setting_changed)
+
+    # ------------------------------------------------------------------
+    # Plans
+    # ------------------------------------------------------------------
+
+    def _on_bundle_oracle_data_loaded(self) -> None:
+        """Recompile the plans of every bundle whose game's oracles are loaded."""
+        ready = [
+            b for b in self._bundles
+            if all(s in self._loaded_slots for s in GAME_SLOTS.get(b.get("game", ""), ()) if s.endswith("_oracles"))
+        ]
+        self._bundle_plans = compile_bundles(ready, self._oracle_by_id)
+        self._mark_bundle_problems()
+        if self._current_bundle is not None and self._bundle_plan_problems(self._current_bundle):
+            self._show_bundle_preview()
+
+    def _bundle_plan(self, bundle: dict[str, Any]) -> BundlePlan:
+        plan = self._bundle_plans.get(bundle.get("id", ""))
+        if plan is None or plan.bundle is not bundle:
+            plan = compile_bundle(bundle, self._oracle_by_id)
+        return plan
+
+    def _bundle_plan_problems(self, bundle: dict[str, Any]) -> list[str]:
+        plan = self._bundle_plans.get(bundle.get("id", ""))
+        return plan.problems if plan is not None else []
+
+    def _mark_bundle_problems(self) -> None:
+        for idx, bundle in enumerate(self._bundles_visible):
+            if self._bundle_plan_problems(bundle):
+                self._bundle_listbox.itemconfig(idx, fg=HIT_MISS, selectforeground=HIT_MISS)
 
     # ------------------------------------------------------------------
     # Curse UI state
@@ -182,6 +190,7 @@ class BundlesTabMixin:
         for b in self._bundles_visible:
             game_tag = f"[{self._short_source(b.get('game', ''))}]  " if b.get("game") else ""
             self._bundle_listbox.insert(tk.END, game_tag + b.get("name", ""))
+        self._mark_bundle_problems()
 
     # ------------------------------------------------------------------
     # Selection & preview
@@ -192,12 +201,17 @@ class BundlesTabMixin:
         if not selection:
             return
         self._current_bundle = self._bundles_visible[selection[0]]
-        bundle = self._current_bundle
-        if bundle is None:
+        if self._current_bundle is None:
             return
         self._update_bundle_curse_ui()
         self._update_bundle_region_ui()
         self._update_bundle_selector_ui()
+        self._show_bundle_preview()
+
+    def _show_bundle_preview(self) -> None:
+        bundle = self._current_bundle
+        if bundle is None:
+            return
         self._bundle_title_var.set(bundle.get("name", ""))
         lines: list[tuple[str, str]] = [
             ("cat", f"{bundle.get('game', '')}  —  {len(bundle.get('rolls', []))} roll steps"),
@@ -216,6 +230,11 @@ class BundlesTabMixin:
             lines.append(("bold", f"  {label}{suffix}"))
             if item.get("note"):
                 lines.append(("cat", f"    ↳ {item['note']}"))
+        problems = self._bundle_plan_problems(bundle)
+        if problems:
+            lines.append(("body", ""))
+            lines.append(("miss", "  Content problems:"))
+            lines += [("miss", f"    {problem}") for problem in problems]
         set_text_lines(self._bundle_text, lines)
 
     # ------------------------------------------------------------------
@@ -250,6 +269,11 @@ class BundlesTabMixin:
             return
         self._set_region_setting(game, region)
 
+    def _on_bundle_region_setting_changed(self, game: str, region: str) -> None:
+        bundle = self._current_bundle
+        if bundle is not None and bundle.get("game") == game and self._bundle_region_var.get() != region:
+            self._bundle_region_var.set(region)
+
     def _update_bundle_selector_ui(self) -> None:
         for w in self._bundle_selector_widgets:
             w.destroy()
@@ -304,6 +328,7 @@ class BundlesTabMixin:
     def _roll_bundle(self) -> None:
         if self._current_bundle is None:
             return
+        self._ensure_game_loaded(self._current_bundle.get("game", ""))
 
         use_cursed = self._bundle_cursed_var.get()
         die_str = self._bundle_cursed_die_var.get()
@@ -313,105 +338,50 @@ class BundlesTabMixin:
             ("cat", self._current_bundle.get("name", "") + "  —  " + self._current_bundle.get("game", "")),
             ("body", ""),
         ]
-        label_results: dict[str, str] = {}
         selector_values = {
             key: var.get() for key, var in self._bundle_selector_vars.items()
         }
+        entries = run_plan(
+            self._bundle_plan(self._current_bundle),
+            region=self._bundle_region_var.get(),
+            selectors=selector_values,
+            cursed_die=die_sides if use_cursed else 0,
+        )
 
-        for item in self._current_bundle.get("rolls", []):
-            label = item.get("label", "?")
-            count = item.get("count", 1)
-            note = item.get("note", "")
-
-            fixed_selector = item.get("fixed_value_from_selector", "")
-            if fixed_selector:
-                selected_value = selector_values.get(fixed_selector, "")
-                if selected_value and selected_value.lower() != "random":
-                    label_results[label] = selected_value
-                    lines.append(("bold", f"  {label}"))
-                    lines.append(("body", f"    {selected_value}"))
-                    if note:
-                        lines.append(("cat", f"    ↳ {note}"))
-                    lines.append(("body", ""))
-                    continue
-
-            # Resolve oracle (region map, direct, or cascade)
-            oracle_id = item.get("oracle_id", "")
-            region_label = ""
-            if item.get("region_map"):
-                region = self._bundle_region_var.get()
-                oracle_id = (item.get("region_map") or {}).get(region, "")
-                region_label = f" ({region})"
-                if not oracle_id:
-                    lines += [
-                        ("bold", f"  {label}"),
-                        ("miss", f"    [No region oracle for {region!r}]"),
-                        ("body", ""),
-                    ]
-                    continue
-            elif item.get("cascade_from"):
-                source_text = label_results.get(item["cascade_from"], "")
-                cascade_map: dict[str, str] = item.get("cascade_map") or {}
-                oracle_id = cascade_map.get(source_text, "")
-                if not oracle_id:
-                    for key, val in cascade_map.items():
-                        if source_text.startswith(key):
-                            oracle_id = val
-                            break
-                if not oracle_id:
-                    lines += [
-                        ("bold", f"  {label}"),
-                        ("miss", f"    [No cascade match for {item['cascade_from']}={source_text!r}]"),
-                        ("body", ""),
-                    ]
-                    continue
-
-            oracle = self._oracle_by_id.get(oracle_id)
-            if oracle is None:
+        for entry in entries:
+            label = entry["label"]
+            note = entry["note"]
+            region_label = f" ({entry['region']})" if entry["region"] else ""
+
+            if entry["fixed"] is not None:
+                lines.append(("bold", f"  {label}"))
+                lines.append(("body", f"    {entry['fixed']}"))
+                if note:
+                    lines.append(("cat", f"    ↳ {note}"))
+                lines.append(("body", ""))
+                continue
+            if entry["error"]:
                 lines += [
                     ("bold", f"  {label}"),
-                    ("miss", f"    [Oracle not found: {oracle_id}]"),
+                    ("miss", f"    [{entry['error']}]"),
                     ("body", ""),
                 ]
                 continue
 
-            cursed_oracle_id = item.get("cursed_oracle_id", "")
-
-            for roll_num in range(count):
-                roll = random.randint(1, 100)
+            count = len(entry["rolls"])
+            for roll_num, result in enumerate(entry["rolls"]):
                 roll_label = label if count == 1 else f"{label} #{roll_num + 1}"
+                result_text = result["result"]
+                if result["cursed_roll"] is not None:
+                    cursed_suffix = f"  ☠{die_str}:{result['cursed_roll']}" + ("→CURSED" if result["cursed"] else "")
+                else:
+                    cursed_suffix = ""
 
-                cursed = False
-                cursed_suffix = ""
-                if use_cursed and cursed_oracle_id:
-                    cursed_roll = random.randint(1, die_sides)
-                    cursed = cursed_roll == die_sides
-                    cursed_suffix = f"  ☠{die_str}:{cursed_roll}" + ("→CURSED" if cursed else "")
-
-                active_oracle = oracle
-                if cursed:
-                    co = self._oracle_by_id.get(cursed_oracle_id)
-                    if co:
-                        active_oracle = co
-
-                result_text = next(
-                    (
-                        row["text"] for row in active_oracle.get("rows", [])
-                        if row.get("min") is not None and row["min"] <= roll <= row["max"]
-                    ),
-                    "",
-                )
-                if self._is_roll_twice_result(result_text):
-                    result_text = self._resolve_oracle_roll_text(active_oracle)
-
-                if roll_num == 0:
-                    label_results[label] = result_text
-
-                if cursed:
-                    lines.append(("miss", f"  {roll_label}{region_label}  [{roll}]{cursed_suffix}"))
+                if result["cursed"]:
+                    lines.append(("miss", f"  {roll_label}{region_label}  [{result['roll']}]{cursed_suffix}"))
                     lines.append(("strong", "      \u2620 " + result_text.replace("\n", "\n        ")))
                 else:
-                    lines.append(("bold", f"  {roll_label}{region_label}  [{roll}]"))
+                    lines.append(("bold", f"  {roll_label}{region_label}  [{result['roll']}]"))
                     lines.append(("body", "    " + result_text.replace("\n", "\n    ")))
 
             if note:
@@ -8,16 +8,207 @@ from tkinter import messagebox, ttk
 from typing import Any, TYPE_CHECKING
 from uuid import uuid4
 
-from loader import save_characters, save_settings
+from loader import GAMES
+from odds import action_odds, action_outcome, format_odds, progress_odds
 from styles import ACCENT2, BORDER, FG, HIT_MISS, PANEL_BG
 
 _MOMENTUM_MAX_COLOR = "#50fa7b"  # vivid green for momentum at +10
-from widgets import make_listbox_frame, make_option_menu
+from widgets import TickTrack, make_listbox_frame, make_option_menu
 
 if TYPE_CHECKING:
+    from character_store import CharacterStore
+    from settings_store import SettingsStore
     from starforged_app import App
 
 
+class _AssetCard:
+    """Widgets for one asset card on the character sheet, reused across renders."""
+
+    ESTIMATED_HEIGHT = 170
+
+    def __init__(self, owner: CharacterTabMixin, parent: tk.Misc) -> None:
+        self.index = 0
+        self._row: int | None = None
+        self._shown: dict[str, Any] = {}
+
+        self.frame = tk.Frame(
+            parent,
+            bg=PANEL_BG,
+            highlightthickness=1,
+            highlightbackground=BORDER,
+            padx=8,
+            pady=8,
+        )
+        self.frame.columnconfigure(0, weight=1)
+
+        self._title = tk.Label(
+            self.frame,
+            bg=PANEL_BG,
+            fg=ACCENT2,
+            anchor="w",
+            font=("Segoe UI", 10, "bold"),
+        )
+        self._title.grid(row=0, column=0, sticky="w", pady=(0, 2))
+
+        src_row = tk.Frame(self.frame, bg=PANEL_BG)
+        src_row.grid(row=1, column=0, sticky="ew", pady=(0, 6))
+        src_row.columnconfigure(0, weight=1)
+        self._source = tk.Label(
+            src_row,
+            bg=PANEL_BG,
+            fg=FG,
+            anchor="w",
+            font=("Segoe UI", 9, "italic"),
+        )
+        self._source.grid(row=0, column=0, sticky="w")
+        ttk.Button(
+            src_row,
+            text="Remove",
+            command=lambda: owner._remove_asset(self.index),
+        ).grid(row=0, column=1, sticky="e", padx=(8, 0))
+
+        self._used_vars: list[tk.BooleanVar] = []
+        self._ability_labels: list[tk.Label] = []
+        for ability_idx in range(3):
+            var = tk.BooleanVar(value=False)
+            ability_row = tk.Frame(self.frame, bg=PANEL_BG)
+            ability_row.grid(row=ability_idx + 2, column=0, sticky="ew", pady=2)
+            ability_row.grid_columnconfigure(2, weight=1)
+
+            tk.Checkbutton(
+                ability_row,
+                variable=var,
+                bg=PANEL_BG,
+                fg=FG,
+                activebackground=PANEL_BG,
+                activeforeground=FG,
+                selectcolor=PANEL_BG,
+                anchor="w",
+                justify="left",
+                command=lambda bidx=ability_idx, v=var: owner._set_asset_ability_used(self.index, bidx, v.get()),
+            ).grid(row=0, column=0, sticky="nw", padx=(0, 4))
+            tk.Label(
+                ability_row,
+                text=f"Ability {ability_idx + 1}",
+                bg=PANEL_BG,
+                fg=ACCENT2,
+                anchor="nw",
+                justify="left",
+                font=("Segoe UI", 9, "bold"),
+            ).grid(row=0, column=1, sticky="nw", padx=(0, 8))
+            text_label = tk.Label(
+                ability_row,
+                bg=PANEL_BG,
+                fg=FG,
+                anchor="nw",
+                justify="left",
+            )
+            text_label.grid(row=0, column=2, sticky="nw")
+            self._used_vars.append(var)
+            self._ability_labels.append(text_label)
+
+    def _configure(self, key: str, widget: tk.Misc, **options: Any) -> None:
+        if self._shown.get(key) != options:
+            widget.configure(**options)
+            self._shown[key] = options
+
+    def show(self, index: int, asset: dict[str, Any], abilities: list[str], wraplength: int) -> None:
+        """Point the card at *asset* (position *index*), touching only what changed."""
+        self.index = index
+        self._configure(
+            "title", self._title,
+            text=f"{asset.get('name', 'Asset')}  -  {asset.get('category', '')}",
+        )
+        self._configure("source", self._source, text=asset.get("source", ""))
+        for ability_idx, var in enumerate(self._used_vars):
+            used = bool(asset["abilities_used"][ability_idx])
+            if var.get() != used:
+                var.set(used)
+            ability_text = abilities[ability_idx] if ability_idx < len(abilities) else "(No ability text)"
+            self._configure(f"ability{ability_idx}", self._ability_labels[ability_idx], text=ability_text)
+        self.set_wraplength(wraplength)
+        if self._row != index:
+            self.frame.grid(row=index, column=0, sticky="ew", padx=2, pady=4)
+            self._row = index
+
+    def set_wraplength(self, wraplength: int) -> None:
+        for ability_idx, label in enumerate(self._ability_labels):
+            self._configure(f"wrap{ability_idx}", label, wraplength=wraplength)
+
+    def hide(self) -> None:
+        if self._row is not None:
+            self.frame.grid_remove()
+            self._row = None
+
+    def height(self) -> int:
+        height = self.frame.winfo_reqheight()
+        return height if height > 1 else self.ESTIMATED_HEIGHT
+
+
+class _ProgressRow:
+    """Widgets for one progress track row, reused when the track list changes."""
+
+    def __init__(self, owner: CharacterTabMixin, parent: tk.Misc) -> None:
+        self.index = 0
+        self._row: int | None = None
+        self._shown: tuple[str, str] | None = None
+
+        self.frame = ttk.Frame(parent, style="Panel.TFrame", padding=(2, 2))
+        self.frame.columnconfigure(0, weight=1)
+
+        header_row = ttk.Frame(self.frame, style="Panel.TFrame")
+        header_row.grid(row=0, column=0, sticky="ew")
+        header_row.columnconfigure(0, weight=1)
+
+        self._title = ttk.Label(header_row, style="Cat.TLabel")
+        self._title.grid(row=0, column=0, sticky="w", padx=(0, 8))
+        ttk.Button(header_row, text="- Milestone", command=lambda: owner._adjust_progress_row_milestone(self.index, -1)).grid(
+            row=0, column=1, padx=1
+        )
+        ttk.Button(header_row, text="+ Milestone", command=lambda: owner._adjust_progress_row_milestone(self.index, 1)).grid(
+            row=0, column=2, padx=1
+        )
+        ttk.Button(header_row, text="Delete", command=lambda: owner._delete_progress_track_row(self.index)).grid(
+            row=0, column=3, padx=1
+        )
+
+        self._ticks_label = tk.Label(
+            self.frame,
+            bg=PANEL_BG,
+            fg=FG,
+            anchor="w",
+            justify="left",
+            font=("Segoe UI", 9),
+        )
+        self._ticks_label.grid(row=1, column=0, sticky="w", padx=(0, 8), pady=(2, 0))
+
+        self.track = TickTrack(self.frame, max_ticks=40)
+        self.track.canvas.grid(row=2, column=0, sticky="ew", padx=(0, 8), pady=(2, 0))
+
+    def show(self, index: int, track: dict[str, Any]) -> None:
+        """Point the row at *track* (position *index*), touching only what changed."""
+        self.index = index
+        name = str(track.get("name", "Unnamed"))
+        difficulty = str(track.get("difficulty", CharacterTabMixin._DIFFICULTIES[0]))
+        ticks = int(track.get("ticks", 0))
+        if self._shown != (name, difficulty):
+            self._title.configure(text=f"{name} [{difficulty}]")
+            self._shown = (name, difficulty)
+        if ticks != self.track.ticks or self._row is None:
+            self._ticks_label.configure(
+                text=f"{ticks} ticks  ·  progress roll: {format_odds(progress_odds(ticks // 4))}"
+            )
+        self.track.set_ticks(ticks)
+        if self._row != index:
+            self.frame.grid(row=index, column=0, sticky="ew", pady=2)
+            self._row = index
+
+    def hide(self) -> None:
+        if self._row is not None:
+            self.frame.grid_remove()
+            self._row = None
+
+
 class CharacterTabMixin:
 
     _DIFFICULTIES = ["Troublesome", "Dangerous", "Formidable", "Extreme", "Epic"]
@@ -31,9 +222,12 @@ class CharacterTabMixin:
 
     if TYPE_CHECKING:
         _characters: list[dict[str, Any]]
+        _character_store: CharacterStore
         _settings: dict[str, Any]
+        _settings_store: SettingsStore
 
         def _short_source(self, source: str) -> str: ...
+        def _ensure_game_loaded(self, game: str) -> None: ...
 
     _TRACK_FONT = ("Consolas", 9)
 
@@ -69,7 +263,7 @@ class CharacterTabMixin:
             "bonds": tk.IntVar(value=0),
             "discoveries": tk.IntVar(value=0),
         }
-        self._xp_track_canvases: dict[str, tk.Canvas] = {}
+        self._xp_tracks: dict[str, TickTrack] = {}
         self._xp_ticks_label_vars = {
             "quests": tk.StringVar(value="0/40 ticks"),
             "bonds": tk.StringVar(value="0/40 ticks"),
@@ -155,11 +349,14 @@ class CharacterTabMixin:
             row=2, column=0, sticky="w", pady=(0, 2)
         )
 
+        self._roll_odds_vars: list[tuple[tk.StringVar, tk.Variable]] = []
         stat_row = 3
         for col, (name, var) in enumerate(self._char_stat_vars.items()):
             ttk.Label(panel, text=name.title()).grid(row=stat_row, column=col, sticky="w")
-            stat_controls = ttk.Frame(panel, style="Panel.TFrame")
-            stat_controls.grid(row=stat_row + 1, column=col, sticky="w", padx=(0, 8), pady=(0, 8))
+            stat_cell = ttk.Frame(panel, style="Panel.TFrame")
+            stat_cell.grid(row=stat_row + 1, column=col, sticky="w", padx=(0, 8), pady=(0, 8))
+            stat_controls = ttk.Frame(stat_cell, style="Panel.TFrame")
+            stat_controls.pack(side="top", anchor="w")
             tk.Spinbox(
                 stat_controls,
                 from_=0,
@@ -173,6 +370,7 @@ class CharacterTabMixin:
                 text="Roll",
                 command=lambda n=name, v=var: self._roll_with_bonus(n.title(), int(v.get())),
             ).pack(side="left", padx=(4, 0))
+            self._add_roll_odds_label(stat_cell, var)
 
         ttk.Label(panel, text="Condition", style="Cat.TLabel").grid(
             row=5, column=0, columnspan=6, sticky="w", pady=(0, 2)
@@ -219,6 +417,7 @@ class CharacterTabMixin:
             row=0, column=1, sticky="e", padx=(8, 0)
         )
         self._char_condition_vars["momentum"].trace_add("write", lambda *_: self._refresh_momentum_display())
+        self._char_condition_vars["momentum"].trace_add("write", lambda *_: self._refresh_roll_odds())
         self._momentum_track_canvas.bind("<Configure>", lambda _e: self._refresh_momentum_display())
         self._refresh_momentum_display()
 
@@ -253,16 +452,29 @@ class CharacterTabMixin:
         self._asset_cards_canvas.grid(row=0, column=0, sticky="nsew")
         scroll = ttk.Scrollbar(cards_wrap, orient="vertical", command=self._asset_cards_canvas.yview)
         scroll.grid(row=0, column=1, sticky="ns")
-        self._asset_cards_canvas.configure(yscrollcommand=scroll.set)
+        self._asset_cards_canvas.configure(
+            yscrollcommand=lambda *args: (scroll.set(*args), self._materialize_asset_cards()),
+        )
 
         self._asset_cards_inner = ttk.Frame(self._asset_cards_canvas, style="Panel.TFrame")
         self._asset_cards_canvas.create_window((0, 0), window=self._asset_cards_inner, anchor="nw")
-        self._asset_cards_inner.bind(
-            "<Configure>",
-            lambda _e: self._asset_cards_canvas.configure(scrollregion=self._asset_cards_canvas.bbox("all")),
-        )
-        self._asset_cards_canvas.bind("<Configure>", lambda _e: self._render_asset_cards())
+        self._asset_cards_inner.bind("<Configure>", lambda _e: self._update_asset_cards_scrollregion())
+        self._asset_cards_canvas.bind("<Configure>", lambda _e: self._on_asset_cards_resize())
         self._asset_cards_canvas.bind("<MouseWheel>", self._on_asset_scroll)
+        self._bind_asset_scroll(self._asset_cards_inner)
+
+        self._asset_cards_empty_label = ttk.Label(
+            self._asset_cards_inner,
+            text="No assets selected. Search and add an asset to create a card.",
+            style="Body.TLabel",
+            wraplength=520,
+            justify="left",
+        )
+        self._asset_cards_empty_label.bind("<MouseWheel>", self._on_asset_scroll)
+        self._asset_card_pool: dict[tuple[str, str, str], _AssetCard] = {}
+        self._asset_card_spares: list[_AssetCard] = []
+        self._asset_cards_shown = 0
+        self._asset_cards_wraplength = 0
 
         self._render_asset_cards()
 
@@ -322,6 +534,13 @@ class CharacterTabMixin:
         self._progress_canvas.configure(yscrollcommand=p_scroll.set)
 
         self._progress_rows = ttk.Frame(self._progress_canvas, style="Panel.TFrame")
+        self._progress_row_widgets: list[_ProgressRow] = []
+        self._progress_empty_label = ttk.Label(
+            self._progress_rows,
+            text="No progress tracks yet. Add one above.",
+            style="Body.TLabel",
+        )
+        self._progress_empty_label.grid(row=0, column=0, sticky="w", padx=2, pady=2)
         self._progress_canvas.create_window((0, 0), window=self._progress_rows, anchor="nw")
         self._progress_rows.bind(
             "<Configure>",
@@ -338,16 +557,9 @@ class CharacterTabMixin:
         row_wrap.grid(row=row, column=1, sticky="ew", pady=2)
         row_wrap.columnconfigure(0, weight=1)
 
-        canvas = tk.Canvas(
-            row_wrap,
-            height=20,
-            bg=PANEL_BG,
-            highlightthickness=0,
-            bd=0,
-        )
-        canvas.grid(row=0, column=0, sticky="ew", padx=(0, 8))
-        canvas.bind("<Configure>", lambda _e, k=key: self._draw_xp_track(k))
-        self._xp_track_canvases[key] = canvas
+        track = TickTrack(row_wrap, max_ticks=40)
+        track.canvas.grid(row=0, column=0, sticky="ew", padx=(0, 8))
+        self._xp_tracks[key] = track
 
         ttk.Label(row_wrap, textvariable=self._xp_ticks_label_vars[key], style="Cat.TLabel").grid(
             row=0, column=1, sticky="w", padx=(0, 8)
@@ -368,8 +580,10 @@ class CharacterTabMixin:
         min_value: int = 0,
     ) -> None:
         ttk.Label(parent, text=label).grid(row=row, column=column, sticky="w")
-        meter_controls = ttk.Frame(parent, style="Panel.TFrame")
-        meter_controls.grid(row=row + 1, column=column, sticky="w", padx=(0, 8), pady=(0, 8))
+        meter_cell = ttk.Frame(parent, style="Panel.TFrame")
+        meter_cell.grid(row=row + 1, column=column, sticky="w", padx=(0, 8), pady=(0, 8))
+        meter_controls = ttk.Frame(meter_cell, style="Panel.TFrame")
+        meter_controls.pack(side="top", anchor="w")
         tk.Spinbox(
             meter_controls,
             from_=min_value,
@@ -383,6 +597,23 @@ class CharacterTabMixin:
             text="Roll",
             command=lambda lbl=label, v=var: self._roll_with_bonus(lbl, int(v.get())),
         ).pack(side="left", padx=(4, 0))
+        self._add_roll_odds_label(meter_cell, var)
+
+    def _add_roll_odds_label(self, parent: ttk.Frame, bonus_var: tk.Variable) -> None:
+        """Live action roll odds for *bonus_var*, including a momentum burn."""
+        text_var = tk.StringVar()
+        tk.Label(
+            parent,
+            textvariable=text_var,
+            bg=PANEL_BG,
+            fg=FG,
+            anchor="w",
+            justify="left",
+            font=("Segoe UI", 8),
+        ).pack(side="top", anchor="w", pady=(2, 0))
+        self._roll_odds_vars.append((text_var, bonus_var))
+        bonus_var.trace_add("write", lambda *_: self._refresh_roll_odds())
+        self._refresh_roll_odds()
 
     def _add_meter_spin(
         self,
@@ -426,6 +657,13 @@ class CharacterTabMixin:
             self._asset_by_key[(payload["source"], payload["category"], payload["name"])] = payload
         return labels
 
+    def _on_character_asset_data_loaded(self) -> None:
+        self._all_asset_labels = self._build_asset_labels()
+        self._asset_filtered_labels = list(self._all_asset_labels)
+        if self._char_assets_selected:
+            # Cards show ability text from the library, which may have just arrived.
+            self._render_asset_cards()
+
     def _refresh_asset_search_list(self, query_text: str = "") -> None:
         query = query_text.strip().lower()
         if not query:
@@ -463,6 +701,8 @@ class CharacterTabMixin:
         self._save_character_from_form(update_title=True)
 
     def _open_asset_library_dialog(self) -> None:
+        for game in GAMES:
+            self._ensure_game_loaded(game)
         dialog = tk.Toplevel(self)
         dialog.title("Add Asset")
         dialog.geometry("620x420")
@@ -556,63 +796,46 @@ class CharacterTabMixin:
         for child in widget.winfo_children():
             self._bind_asset_scroll(child)
 
-    def _render_asset_cards(self) -> None:
-        if not hasattr(self, "_asset_cards_inner"):
-            return
-
-        for child in self._asset_cards_inner.winfo_children():
-            child.destroy()
+    def _asset_cards_wrap(self) -> int:
+        return max(160, self._asset_cards_canvas.winfo_width() - 180)
 
-        if not self._char_assets_selected:
-            ttk.Label(
-                self._asset_cards_inner,
-                text="No assets selected. Search and add an asset to create a card.",
-                style="Body.TLabel",
-                wraplength=520,
-                justify="left",
-            ).grid(row=0, column=0, sticky="w", padx=2, pady=2)
-            return
+    def _asset_cards_past_viewport(self, height_above: int) -> bool:
+        canvas = self._asset_cards_canvas
+        return height_above > canvas.canvasy(0) + canvas.winfo_height()
 
-        for idx, asset in enumerate(self._char_assets_selected):
-            title = f"{asset.get('name', 'Asset')}  -  {asset.get('category', '')}"
-            card = tk.Frame(
-                self._asset_cards_inner,
-                bg=PANEL_BG,
-                highlightthickness=1,
-                highlightbackground=BORDER,
-                padx=8,
-                pady=8,
-            )
-            card.grid(row=idx, column=0, sticky="ew", padx=2, pady=4)
-            card.columnconfigure(0, weight=1)
-
-            tk.Label(
-                card,
-                text=title,
-                bg=PANEL_BG,
-                fg=ACCENT2,
-                anchor="w",
-                font=("Segoe UI", 10, "bold"),
-            ).grid(row=0, column=0, sticky="w", pady=(0, 2))
+    def _render_asset_cards(self) -> None:
+        """Show one card per selected asset, reusing pooled card widgets.
 
-            src_row = tk.Frame(card, bg=PANEL_BG)
-            src_row.grid(row=1, column=0, sticky="ew", pady=(0, 6))
-            src_row.columnconfigure(0, weight=1)
-            tk.Label(
-                src_row,
-                text=asset.get("source", ""),
-                bg=PANEL_BG,
-                fg=FG,
-                anchor="w",
-                font=("Segoe UI", 9, "italic"),
-            ).grid(row=0, column=0, sticky="w")
-            ttk.Button(
-                src_row,
-                text="Remove",
-                command=lambda aidx=idx: self._remove_asset(aidx),
-            ).grid(row=0, column=1, sticky="e", padx=(8, 0))
+        Cards keep their widgets for as long as their asset stays selected, so
+        a re-render only reconfigures what changed.  New cards below the
+        visible area are not built until scrolling reaches them.
+        """
+        if not hasattr(self, "_asset_cards_inner"):
+            return
 
+        assets = self._char_assets_selected
+        if assets:
+            self._asset_cards_empty_label.grid_remove()
+        else:
+            self._asset_cards_empty_label.grid(row=0, column=0, sticky="w", padx=2, pady=2)
+
+        previous = self._asset_card_pool
+        self._asset_card_pool = {}
+        self._asset_cards_wraplength = self._asset_cards_wrap()
+        height_above = 0
+        shown = 0
+        for idx, asset in enumerate(assets):
             key = (asset.get("source", ""), asset.get("category", ""), asset.get("name", ""))
+            card = previous.pop(key, None)
+            if card is None:
+                if self._asset_cards_past_viewport(height_above):
+                    break
+                if self._asset_card_spares:
+                    card = self._asset_card_spares.pop()
+                else:
+                    card = _AssetCard(self, self._asset_cards_inner)
+                    self._bind_asset_scroll(card.frame)
+
             source_asset = getattr(self, "_asset_by_key", {}).get(key, {})
             abilities = list(source_asset.get("abilities", []))[:3]
             current_used = list(asset.get("abilities_used", [False, False, False]))[:3]
@@ -620,48 +843,41 @@ class CharacterTabMixin:
                 current_used.append(False)
             asset["abilities_used"] = current_used
 
-            wraplength = max(160, self._asset_cards_canvas.winfo_width() - 180)
-
-            for ability_idx in range(3):
-                ability_text = abilities[ability_idx] if ability_idx < len(abilities) else "(No ability text)"
-                var = tk.BooleanVar(value=bool(current_used[ability_idx]))
-                ability_row = tk.Frame(card, bg=PANEL_BG)
-                ability_row.grid(row=ability_idx + 2, column=0, sticky="ew", pady=2)
-                ability_row.grid_columnconfigure(2, weight=1)
-
-                cb = tk.Checkbutton(
-                    ability_row,
-                    variable=var,
-                    bg=PANEL_BG,
-                    fg=FG,
-                    activebackground=PANEL_BG,
-                    activeforeground=FG,
-                    selectcolor=PANEL_BG,
-                    anchor="w",
-                    justify="left",
-                    command=lambda aidx=idx, bidx=ability_idx, v=var: self._set_asset_ability_used(aidx, bidx, v.get()),
-                )
-                cb.grid(row=0, column=0, sticky="nw", padx=(0, 4))
-                tk.Label(
-                    ability_row,
-                    text=f"Ability {ability_idx + 1}",
-                    bg=PANEL_BG,
-                    fg=ACCENT2,
-                    anchor="nw",
-                    justify="left",
-                    font=("Segoe UI", 9, "bold"),
-                ).grid(row=0, column=1, sticky="nw", padx=(0, 8))
-                tk.Label(
-                    ability_row,
-                    text=ability_text,
-                    bg=PANEL_BG,
-                    fg=FG,
-                    anchor="nw",
-                    justify="left",
-                    wraplength=wraplength,
-                ).grid(row=0, column=2, sticky="nw")
+            card.show(idx, asset, abilities, self._asset_cards_wraplength)
+            self._asset_card_pool[key] = card
+            height_above += card.height()
+            shown = idx + 1
 
-        self._bind_asset_scroll(self._asset_cards_inner)
+        for card in previous.values():
+            card.hide()
+            self._asset_card_spares.append(card)
+        self._asset_cards_shown = shown
+        self._update_asset_cards_scrollregion()
+
+    def _materialize_asset_cards(self) -> None:
+        # Build deferred cards once the view scrolls (or grows) towards them.
+        if self._asset_cards_shown >= len(self._char_assets_selected):
+            return
+        height_above = sum(card.height() for card in self._asset_card_pool.values())
+        if not self._asset_cards_past_viewport(height_above):
+            self._render_asset_cards()
+
+    def _on_asset_cards_resize(self) -> None:
+        wraplength = self._asset_cards_wrap()
+        if wraplength != self._asset_cards_wraplength:
+            self._asset_cards_wraplength = wraplength
+            for card in self._asset_card_pool.values():
+                card.set_wraplength(wraplength)
+        self._materialize_asset_cards()
+
+    def _update_asset_cards_scrollregion(self) -> None:
+        canvas = self._asset_cards_canvas
+        bbox = canvas.bbox("all") or (0, 0, 0, 0)
+        pending = len(self._char_assets_selected) - self._asset_cards_shown
+        # Reserve room for unbuilt cards so the scrollbar reflects the full list.
+        canvas.configure(
+            scrollregion=(bbox[0], bbox[1], bbox[2], bbox[3] + max(0, pending) * _AssetCard.ESTIMATED_HEIGHT),
+        )
 
     def _set_asset_ability_used(self, asset_idx: int, ability_idx: int, value: bool) -> None:
         if asset_idx >= len(self._char_assets_selected):
@@ -694,51 +910,11 @@ class CharacterTabMixin:
         self._refresh_xp_display()
         self._queue_character_autosave()
 
-    def _draw_tick_track_canvas(self, canvas: tk.Canvas, ticks: int, *, max_ticks: int = 40) -> None:
-        canvas.delete("all")
-        width = max(40, int(canvas.winfo_width()))
-        height = max(16, int(canvas.winfo_height()))
-        boxes = 10
-        gap = 4
-        total_gap = gap * (boxes - 1)
-        box_w = max(8, (width - total_gap) / boxes)
-        box_h = max(10, height - 4)
-        y = (height - box_h) / 2
-
-        clamped = max(0, min(max_ticks, ticks))
-        ticks_per_box = max_ticks // boxes
-
-        for idx in range(boxes):
-            x = idx * (box_w + gap)
-            box_ticks = max(0, min(ticks_per_box, clamped - (idx * ticks_per_box)))
-            frac = box_ticks / ticks_per_box if ticks_per_box else 0
-
-            canvas.create_rectangle(
-                x,
-                y,
-                x + box_w,
-                y + box_h,
-                outline=BORDER,
-                width=1,
-                fill=PANEL_BG,
-            )
-            if frac > 0:
-                fill_w = (box_w - 2) * frac
-                canvas.create_rectangle(
-                    x + 1,
-                    y + 1,
-                    x + 1 + fill_w,
-                    y + box_h - 1,
-                    outline="",
-                    fill=ACCENT2,
-                )
-
     def _draw_xp_track(self, key: str) -> None:
-        canvas = self._xp_track_canvases.get(key)
-        if canvas is None:
+        track = self._xp_tracks.get(key)
+        if track is None:
             return
-        ticks = int(self._char_xp_vars[key].get())
-        self._draw_tick_track_canvas(canvas, ticks, max_ticks=40)
+        track.set_ticks(int(self._char_xp_vars[key].get()))
 
     def _difficulty_milestone_ticks(self, difficulty: str) -> int:
         return self._DIFFICULTY_MILESTONE_TICKS.get(difficulty, 4)
@@ -783,23 +959,31 @@ class CharacterTabMixin:
                 fill=fill,
             )
 
+    def _refresh_roll_odds(self) -> None:
+        try:
+            momentum = int(self._char_condition_vars["momentum"].get())
+        except (tk.TclError, ValueError):
+            momentum = None
+        for text_var, bonus_var in getattr(self, "_roll_odds_vars", []):
+            try:
+                bonus = int(bonus_var.get())
+            except (tk.TclError, ValueError):
+                continue
+            odds = action_odds(bonus)
+            text = format_odds(odds)
+            if momentum is not None:
+                burned = action_odds(bonus, momentum)
+                if burned != odds:
+                    text += "\nburn: " + format_odds(burned)
+            text_var.set(text)
+
     def _roll_action_vs_challenge(self, bonus: int) -> dict[str, Any]:
         action_die = random.randint(1, 6)
         challenge_1 = random.randint(1, 10)
         challenge_2 = random.randint(1, 10)
         score = min(10, action_die + bonus)
-        beats_1 = score > challenge_1
-        beats_2 = score > challenge_2
         is_match = challenge_1 == challenge_2
-
-        if beats_1 and beats_2 and is_match:
-            outcome = "Strong Hit with Match"
-        elif beats_1 and beats_2:
-            outcome = "Strong Hit"
-        elif beats_1 or beats_2:
-            outcome = "Weak Hit"
-        else:
-            outcome = "Miss"
+        outcome = action_outcome(score, challenge_1, challenge_2)
 
         return {
             "action_die": action_die,
@@ -874,18 +1058,11 @@ class CharacterTabMixin:
         self._load_character_by_index(idx)
 
     def _set_last_character_id(self, char_id: str) -> None:
-        character_settings = self._settings.setdefault("character", {})
-        if character_settings.get("last_id") == char_id:
-            return
-        character_settings["last_id"] = char_id
-        save_settings(self._settings)
+        self._settings_store.set("character", "last_id", char_id)
 
     def _clear_last_character_id_if_matches(self, char_id: str) -> None:
-        character_settings = self._settings.setdefault("character", {})
-        if character_settings.get("last_id") != char_id:
-            return
-        character_settings["last_id"] = ""
-        save_settings(self._settings)
+        if self._settings_store.get("character", "last_id") == char_id:
+            self._settings_store.set("character", "last_id", "")
 
     def _load_character_by_index(self, idx: int) -> None:
         if idx < 0 or idx >= len(self._characters):
@@ -1024,7 +1201,7 @@ class CharacterTabMixin:
             self._character_selected_index = len(self._characters) - 1
         else:
             self._characters[self._character_selected_index] = character
-        save_characters(self._characters)
+        self._character_store.put(character)
 
         self._refresh_character_picker()
         idx = self._character_selected_index if self._character_selected_index is not None else 0
@@ -1046,7 +1223,7 @@ class CharacterTabMixin:
 
         char_id = str(character.get("id", ""))
         del self._characters[idx]
-        save_characters(self._characters)
+        self._character_store.delete(char_id)
         if char_id:
             self._clear_last_character_id_if_matches(char_id)
 
@@ -1058,68 +1235,26 @@ class CharacterTabMixin:
             self._new_character()
 
     def _refresh_progress_tracks_rows(self) -> None:
+        """Show the progress tracks, reusing row widgets by position."""
         if not hasattr(self, "_progress_rows"):
             return
-        for child in self._progress_rows.winfo_children():
-            child.destroy()
-
-        if not self._char_progress_tracks:
-            ttk.Label(
-                self._progress_rows,
-                text="No progress tracks yet. Add one above.",
-                style="Body.TLabel",
-            ).grid(row=0, column=0, sticky="w", padx=2, pady=2)
-            return
-
-        for idx, track in enumerate(self._char_progress_tracks):
-            rowf = ttk.Frame(self._progress_rows, style="Panel.TFrame", padding=(2, 2))
-            rowf.grid(row=idx, column=0, sticky="ew", pady=2)
-            rowf.columnconfigure(0, weight=1)
-
-            name = str(track.get("name", "Unnamed"))
-            difficulty = str(track.get("difficulty", self._DIFFICULTIES[0]))
-            ticks = int(track.get("ticks", 0))
-
-            header_row = ttk.Frame(rowf, style="Panel.TFrame")
-            header_row.grid(row=0, column=0, sticky="ew")
-            header_row.columnconfigure(0, weight=1)
-
-            ttk.Label(header_row, text=f"{name} [{difficulty}]", style="Cat.TLabel").grid(
-                row=0, column=0, sticky="w", padx=(0, 8)
-            )
-            ttk.Button(header_row, text="- Milestone", command=lambda i=idx: self._adjust_progress_row_milestone(i, -1)).grid(
-                row=0, column=1, padx=1
-            )
-            ttk.Button(header_row, text="+ Milestone", command=lambda i=idx: self._adjust_progress_row_milestone(i, 1)).grid(
-                row=0, column=2, padx=1
-            )
-            ttk.Button(header_row, text="Delete", command=lambda i=idx: self._delete_progress_track_row(i)).grid(
-                row=0, column=3, padx=1
-            )
-
-            tk.Label(
-                rowf,
-                text=f"{ticks} ticks",
-                bg=PANEL_BG,
-                fg=FG,
-                anchor="w",
-                justify="left",
-                font=("Segoe UI", 9),
-            ).grid(row=1, column=0, sticky="w", padx=(0, 8), pady=(2, 0))
+        tracks = self._char_progress_tracks
+        if tracks:
+            self._progress_empty_label.grid_remove()
+        else:
+            self._progress_empty_label.grid()
+        rows = self._progress_row_widgets
+        while len(rows) < len(tracks):
+            rows.append(_ProgressRow(self, self._progress_rows))
+        for idx, row in enumerate(rows):
+            if idx < len(tracks):
+                row.show(idx, tracks[idx])
+            else:
+                row.hide()
 
-            progress_track_canvas = tk.Canvas(
-                rowf,
-                height=20,
-                bg=PANEL_BG,
-                highlightthickness=0,
-                bd=0,
-            )
-            progress_track_canvas.grid(row=2, column=0, sticky="ew", padx=(0, 8), pady=(2, 0))
-            progress_track_canvas.bind(
-                "<Configure>",
-                lambda _e, canvas=progress_track_canvas, value=ticks: self._draw_tick_track_canvas(canvas, value, max_ticks=40),
-            )
-            self._draw_tick_track_canvas(progress_track_canvas, ticks, max_ticks=40)
+    def _refresh_progress_track_row(self, idx: int) -> None:
+        if 0 <= idx < len(self._progress_row_widgets) and idx < len(self._char_progress_tracks):
+            self._progress_row_widgets[idx].show(idx, self._char_progress_tracks[idx])
 
     def _add_progress_track(self) -> None:
         name = self._char_track_name_var.get().strip()
@@ -1148,7 +1283,7 @@ class CharacterTabMixin:
         milestones = max(0, current // step)
         milestones = max(0, milestones + delta)
         track["ticks"] = milestones * step
-        self._refresh_progress_tracks_rows()
+        self._refresh_progress_track_row(idx)
         self._queue_character_autosave()
 
     def _delete_progress_track_row(self, idx: int) -> None:
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Any
 
+from odds import MISS, STRONG, STRONG_MATCH, WEAK, action_odds, action_outcome, format_odds
 from widgets import make_option_menu, make_textbox, set_text_lines
 
 
@@ -41,6 +42,13 @@ class DiceTabMixin:
             command=self._reset_dice_tab,
         ).grid(row=1, column=2, sticky="w", padx=(0, 8), pady=(0, 8))
 
+        self._dice_odds_var = tk.StringVar()
+        ttk.Label(controls, textvariable=self._dice_odds_var, style="Cat.TLabel").grid(
+            row=0, column=1, columnspan=3, sticky="w", padx=(8, 8), pady=(8, 2)
+        )
+        self._dice_stat_value_var.trace_add("write", lambda *_: self._refresh_dice_odds())
+        self._refresh_dice_odds()
+
         self._dice_summary_var = tk.StringVar(value="Action roll ready")
         ttk.Label(controls, textvariable=self._dice_summary_var, style="Title.TLabel").grid(
             row=1, column=3, columnspan=2, sticky="w", padx=(8, 8), pady=(0, 8)
@@ -62,6 +70,9 @@ class DiceTabMixin:
             ],
         )
 
+    def _refresh_dice_odds(self) -> None:
+        self._dice_odds_var.set("Odds: " + format_odds(action_odds(int(self._dice_stat_value_var.get()))))
+
     def _reset_dice_tab(self) -> None:
         self._dice_summary_var.set("Action roll ready")
         self._show_dice_placeholder()
@@ -71,21 +82,9 @@ class DiceTabMixin:
         challenge_1 = random.randint(1, 10)
         challenge_2 = random.randint(1, 10)
         score = min(10, action_die + stat_value)
-        beats_1 = score > challenge_1
-        beats_2 = score > challenge_2
         is_match = challenge_1 == challenge_2
-        if beats_1 and beats_2 and is_match:
-            outcome = "Strong Hit with Match"
-            outcome_tag = "strong"
-        elif beats_1 and beats_2:
-            outcome = "Strong Hit"
-            outcome_tag = "strong"
-        elif beats_1 or beats_2:
-            outcome = "Weak Hit"
-            outcome_tag = "weak"
-        else:
-            outcome = "Miss"
-            outcome_tag = "miss"
+        outcome = action_outcome(score, challenge_1, challenge_2)
+        outcome_tag = {STRONG_MATCH: "strong", STRONG: "strong", WEAK: "weak", MISS: "miss"}[outcome]
         return {
             "action_die": action_die,
             "stat_value": stat_value,
@@ -115,6 +114,7 @@ class DiceTabMixin:
             ("body", ""),
             ("bold", f"Challenge dice: d10 → {result['challenge_1']} and {result['challenge_2']}"),
             (result.get("outcome_tag", "body"), result["outcome"]),
+            ("body", f"Odds at {stat_value:+d}: {format_odds(action_odds(stat_value))}"),
             ("cat" if result["is_match"] else "body", match_text),
         ]
         set_text_lines(self._dice_text, lines)
@@ -7,9 +7,11 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Any, TYPE_CHECKING
 
+from oracle_index import lookup_roll
+from search_index import SearchIndex
 from styles import ACCENT, ACCENT2, BG, BORDER, FG, HIT_MISS, HIT_STRONG, HIT_WEAK, PANEL_BG
 from widgets import (
-    make_listbox_frame, make_option_menu, make_paned, make_search_entry,
+    ListView, make_listbox_frame, make_option_menu, make_paned, make_search_entry,
     make_textbox, rebuild_option_menu, set_text_lines,
 )
 
@@ -30,6 +32,8 @@ class MovesTabMixin:
         _char_name_var: tk.StringVar
 
         def _short_source(self, source: str) -> str: ...
+        def _game_sources(self, slot_suffix: str, records: list[dict[str, Any]]) -> list[str]: ...
+        def _ensure_game_loaded(self, game: str) -> None: ...
 
 
 
@@ -45,11 +49,10 @@ class MovesTabMixin:
         ttk.Label(left, text="Game", style="Cat.TLabel").grid(
             row=0, column=0, sticky="w", padx=8, pady=(8, 2)
         )
-        all_move_sources = sorted({m["source"] for m in self._sf_moves + self._si_moves})
         self._move_game_var = tk.StringVar(value="All")
         self._move_game_var.trace_add("write", lambda *_: self._on_move_game_change())
-        move_game_om = make_option_menu(left, self._move_game_var, ["All"] + all_move_sources)
-        move_game_om.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 4))
+        self._move_game_om = make_option_menu(left, self._move_game_var, self._move_game_options())
+        self._move_game_om.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 4))
 
         ttk.Label(left, text="Category", style="Cat.TLabel").grid(
             row=2, column=0, sticky="w", padx=8, pady=(4, 2)
@@ -73,6 +76,7 @@ class MovesTabMixin:
         lf, self._move_listbox = make_listbox_frame(left)
         lf.grid(row=5, column=0, sticky="nsew", padx=4, pady=4)
         self._move_listbox.bind("<<ListboxSelect>>", self._on_move_select)
+        self._move_list_view = ListView(self._move_listbox, self._move_list_label)
 
         # --- Right panel ---
         right = ttk.Frame(paned, style="Panel.TFrame")
@@ -122,6 +126,7 @@ class MovesTabMixin:
         self._move_text.grid(row=3, column=0, sticky="nsew", padx=6, pady=4)
 
         self._moves_visible: list[dict[str, Any]] = []
+        self._move_search_index = self._build_move_search_index()
         self._current_move: dict[str, Any] | None = None
         self._refresh_move_list()
 
@@ -129,8 +134,26 @@ class MovesTabMixin:
     # Filtering
     # ------------------------------------------------------------------
 
+    def _move_game_options(self) -> list[str]:
+        return ["All"] + self._game_sources("_moves", self._sf_moves + self._si_moves)
+
+    def _build_move_search_index(self) -> SearchIndex:
+        return SearchIndex(
+            self._sf_moves + self._si_moves,
+            ("name", "category"),
+            lambda m: (m["source"], m["category"], m["name"]),
+        )
+
+    def _on_move_data_loaded(self) -> None:
+        self._move_search_index = self._build_move_search_index()
+        self._move_list_view.forget_labels()
+        rebuild_option_menu(self._move_game_om, self._move_game_var, self._move_game_options())
+        self._on_move_game_change()
+
     def _on_move_game_change(self) -> None:
         game_filter = self._move_game_var.get()
+        if game_filter != "All":
+            self._ensure_game_loaded(game_filter)
         all_moves = self._sf_moves + self._si_moves
         if game_filter == "All":
             cats = sorted({m["category"] for m in all_moves})
@@ -149,23 +172,18 @@ class MovesTabMixin:
     def _refresh_move_list(self) -> None:
         game_filter = self._move_game_var.get()
         cat_filter = self._move_selected_cat
-        query = self._move_search_var.get().strip().lower()
-        all_moves = self._sf_moves + self._si_moves
-        filtered = [
-            m for m in all_moves
-            if (game_filter == "All" or m["source"] == game_filter)
-            and (cat_filter == "All" or m["category"] == cat_filter)
-            and (not query or query in m["name"].lower() or query in m["category"].lower())
-        ]
-        filtered.sort(key=lambda m: (m["source"], m["category"], m["name"]))
+        filtered = self._move_search_index.search(
+            self._move_search_var.get(),
+            lambda m: (game_filter == "All" or m["source"] == game_filter)
+            and (cat_filter == "All" or m["category"] == cat_filter),
+        )
         self._moves_visible = filtered
-        self._move_listbox.delete(0, tk.END)
-        for m in filtered:
-            if game_filter == "All":
-                label = f"[{self._short_source(m['source'])}]  {m['category']} › {m['name']}"
-            else:
-                label = f"{m['category']} › {m['name']}"
-            self._move_listbox.insert(tk.END, label)
+        self._move_list_view.set_records(filtered, variant=game_filter == "All")
+
+    def _move_list_label(self, m: dict[str, Any], with_source: bool) -> str:
+        if with_source:
+            return f"[{self._short_source(m['source'])}]  {m['category']} › {m['name']}"
+        return f"{m['category']} › {m['name']}"
 
     # ------------------------------------------------------------------
     # Selection & display
@@ -245,11 +263,7 @@ class MovesTabMixin:
             return
         tbl = tables[0]
         roll = random.randint(1, 100)
-        matching = next(
-            (row["text"] for row in tbl.get("rows", [])
-             if row.get("min") is not None and row["min"] <= roll <= row["max"]),
-            ""
-        )
+        matching, _roll_twice = lookup_roll(tbl, roll)
         self._move_roll_result_var.set(f"Rolled {roll}  \u2192  {matching}")
         self._display_move(self._current_move, highlight_roll=roll)
 
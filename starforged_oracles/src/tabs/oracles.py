@@ -1,14 +1,15 @@
 """tabs/oracles.py – Oracles tab mixin."""
 from __future__ import annotations
 
-import random
 import tkinter as tk
 from tkinter import ttk
 from typing import Any, TYPE_CHECKING
 
+from oracle_engine import roll_table
+from search_index import SearchIndex
 from styles import ACCENT, BG, BORDER, FG, HIT_MISS, PANEL_BG, SEL_BG
 from widgets import (
-    make_listbox_frame, make_option_menu, make_paned, make_search_entry,
+    ListView, make_listbox_frame, make_option_menu, make_paned, make_search_entry,
     make_textbox, rebuild_option_menu, set_text_lines,
 )
 
@@ -18,32 +19,6 @@ if TYPE_CHECKING:
 
 class OraclesTabMixin:
 
-    @staticmethod
-    def _is_roll_twice_result(text: str) -> bool:
-        return text.strip().lower() == "roll twice"
-
-    def _resolve_oracle_roll_text(self, oracle: dict[str, Any], depth: int = 0) -> str:
-        if depth > 4:
-            return "[Roll recursion limit reached]"
-
-        roll = random.randint(1, 100)
-        result_text = next(
-            (
-                row["text"] for row in oracle.get("rows", [])
-                if row.get("min") is not None and row["min"] <= roll <= row["max"]
-            ),
-            "",
-        )
-
-        if self._is_roll_twice_result(result_text):
-            a = self._resolve_oracle_roll_text(oracle, depth + 1)
-            b = self._resolve_oracle_roll_text(oracle, depth + 1)
-            if depth == 0:
-                return f"Roll twice -> {a} + {b}"
-            return f"{a} + {b}"
-
-        return result_text
-
     # ------------------------------------------------------------------
     # Build
     # ------------------------------------------------------------------
@@ -60,14 +35,10 @@ class OraclesTabMixin:
         ttk.Label(left, text="Game", style="Cat.TLabel").grid(
             row=0, column=0, sticky="w", padx=8, pady=(8, 2)
         )
-        all_sources = sorted(
-            {o["source"] for o in getattr(self, '_sf_oracles', []) + getattr(self, '_si_oracles', []) + getattr(self, '_is_oracles', [])}
-        )
         self._oracle_game_var = tk.StringVar(value="All")
         self._oracle_game_var.trace_add("write", lambda *_: self._on_oracle_game_change())
-        make_option_menu(left, self._oracle_game_var, ["All"] + all_sources).grid(
-            row=1, column=0, sticky="ew", padx=8, pady=(0, 4)
-        )
+        self._oracle_game_om = make_option_menu(left, self._oracle_game_var, self._oracle_game_options())
+        self._oracle_game_om.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 4))
 
         ttk.Label(left, text="Category", style="Cat.TLabel").grid(
             row=2, column=0, sticky="w", padx=8, pady=(4, 2)
@@ -93,6 +64,7 @@ class OraclesTabMixin:
         lf, self._oracle_listbox = make_listbox_frame(left)
         lf.grid(row=5, column=0, sticky="nsew", padx=4, pady=4)
         self._oracle_listbox.bind("<<ListboxSelect>>", self._on_oracle_select)
+        self._oracle_list_view = ListView(self._oracle_listbox, self._oracle_list_label)
 
         # --- Right panel ---
         right = ttk.Frame(paned, style="Panel.TFrame")
@@ -144,14 +116,63 @@ class OraclesTabMixin:
 
         self._oracles_visible: list[dict[str, Any]] = []
         self._current_oracle: dict[str, Any] | None = None
+        # (id(oracle), cursed) -> (oracle, lines, row spans); see _render_oracle().
+        self._oracle_render_cache: dict[
+            tuple[int, bool], tuple[dict[str, Any], list[tuple[str, str]], list[tuple[int, int, int, int]]]
+        ] = {}
+        self._oracle_shown: tuple[int, bool] | None = None
+        self._oracle_highlight: list[tuple[int, int]] = []
+        self._oracle_search_index = self._build_oracle_search_index()
         self._refresh_oracle_list()
 
     # ------------------------------------------------------------------
     # Filtering
     # ------------------------------------------------------------------
 
+    def _oracle_game_options(self) -> list[str]:
+        all_oracles = getattr(self, '_sf_oracles', []) + getattr(self, '_si_oracles', []) + getattr(self, '_is_oracles', [])
+        return ["All"] + self._game_sources("_oracles", all_oracles)
+
+    def _build_oracle_search_index(self) -> SearchIndex:
+        all_oracles = getattr(self, '_sf_oracles', []) + getattr(self, '_si_oracles', []) + getattr(self, '_is_oracles', [])
+        return SearchIndex(
+            all_oracles,
+            ("name", "category", "source"),
+            lambda o: (o["source"], o["category"], o["name"]),
+        )
+
+    def _on_oracle_data_loaded(self) -> None:
+        self._oracle_search_index = self._build_oracle_search_index()
+        self._oracle_list_view.forget_labels()
+        rebuild_option_menu(self._oracle_game_om, self._oracle_game_var, self._oracle_game_options())
+        self._on_oracle_game_change()
+
+    def _on_oracle_tables_replaced(self, removed: list[dict[str, Any]], added: list[dict[str, Any]]) -> None:
+        """Patch the list after one oracle file was reloaded; see App._reload_oracle_file()."""
+        # Cached renders hold their oracle; drop them so replaced tables can be freed.
+        for oracle in removed:
+            self._oracle_render_cache.pop((id(oracle), False), None)
+            self._oracle_render_cache.pop((id(oracle), True), None)
+        self._oracle_search_index.update(removed, added)
+        current = self._current_oracle
+        if current is not None and any(oracle is current for oracle in removed):
+            self._current_oracle = self._oracle_by_id.get(current.get("oracle_id", ""))
+            self._roll_result_var.set("")
+            self._update_curse_ui()
+            if self._current_oracle is not None:
+                self._display_oracle(self._current_oracle)
+            else:
+                self._oracle_title_var.set("Select an oracle →")
+                set_text_lines(self._oracle_text, [])
+                self._oracle_shown = None
+                self._oracle_highlight = []
+        # Categories may have come or gone; this also refreshes the list.
+        self._on_oracle_game_change()
+
     def _on_oracle_game_change(self) -> None:
         game_filter = self._oracle_game_var.get() or "All"
+        if game_filter != "All":
+            self._ensure_game_loaded(game_filter)
         all_oracles = getattr(self, '_sf_oracles', []) + getattr(self, '_si_oracles', []) + getattr(self, '_is_oracles', [])
         if game_filter == "All":
             cats = sorted({o["category"] for o in all_oracles})
@@ -170,24 +191,17 @@ class OraclesTabMixin:
     def _refresh_oracle_list(self) -> None:
         game_filter = self._oracle_game_var.get() or "All"
         cat_filter = self._oracle_selected_cat
-        query = self._oracle_search_var.get().strip().lower()
-        all_oracles = getattr(self, '_sf_oracles', []) + getattr(self, '_si_oracles', []) + getattr(self, '_is_oracles', [])
-        filtered = [
-            o for o in all_oracles
-            if (game_filter == "All" or o["source"] == game_filter)
-            and (cat_filter == "All" or o["category"] == cat_filter)
-            and (not query
-                 or query in o["name"].lower()
-                 or query in o["category"].lower()
-                 or query in o["source"].lower())
-        ]
-        filtered.sort(key=lambda o: (o["source"], o["category"], o["name"]))
+        filtered = self._oracle_search_index.search(
+            self._oracle_search_var.get(),
+            lambda o: (game_filter == "All" or o["source"] == game_filter)
+            and (cat_filter == "All" or o["category"] == cat_filter),
+        )
         self._oracles_visible = filtered
-        self._oracle_listbox.delete(0, tk.END)
+        self._oracle_list_view.set_records(filtered)
+
+    def _oracle_list_label(self, o: dict[str, Any], _variant: Any) -> str:
         short_source = getattr(self, '_short_source', lambda s: s)
-        for o in filtered:
-            label = f"[{short_source(o['source'])}]  {o['category']} › {o['name']}"
-            self._oracle_listbox.insert(tk.END, label)
+        return f"[{short_source(o['source'])}]  {o['category']} › {o['name']}"
 
     # ------------------------------------------------------------------
     # Selection & display
@@ -224,18 +238,21 @@ class OraclesTabMixin:
                 state="disabled", fg=_CURSE_DIM, activeforeground=_CURSE_DIM,
             )
 
-    def _display_oracle(
-        self,
-        oracle: dict[str, Any],
-        highlight_roll: int | None = None,
-        cursed: bool = False,
-    ) -> None:
-        name = ("☠  " + oracle["name"]) if cursed else oracle["name"]
-        self._oracle_title_var.set(f"{name}  —  {oracle['category']}")
+    def _render_oracle(
+        self, oracle: dict[str, Any], cursed: bool
+    ) -> tuple[list[tuple[str, str]], list[tuple[int, int, int, int]]]:
+        """Tagged lines for *oracle*, plus (min, max, first line, last line) per ranged row."""
+        key = (id(oracle), cursed)
+        cached = self._oracle_render_cache.get(key)
+        if cached is not None and cached[0] is oracle:
+            return cached[1], cached[2]
+
         src_label = oracle["source"] + "  ·  " + oracle["category"]
         if cursed:
             src_label += "  [☠ CURSED]"
         lines: list[tuple[str, str]] = [("miss" if cursed else "cat", src_label), ("body", "")]
+        spans: list[tuple[int, int, int, int]] = []
+        line_no = len(lines) + 1
         for row in oracle.get("rows", []):
             rmin, rmax, text = row.get("min"), row.get("max"), row.get("text", "")
             if rmin is None or rmax is None:
@@ -244,38 +261,63 @@ class OraclesTabMixin:
                 range_str = f"{rmin:>3}–{rmax:<3}"
             else:
                 range_str = f"{rmin:>3}      "
-            tag = "body"
-            if highlight_roll is not None and rmin is not None and rmax is not None:
-                if rmin <= highlight_roll <= rmax:
-                    tag = "strong"
             prefix = f"  {range_str}  "
             text_indented = text.replace("\n", "\n" + " " * len(prefix))
-            lines.append((tag, prefix + text_indented))
-        set_text_lines(self._oracle_text, lines)
+            lines.append(("body", prefix + text_indented))
+            row_lines = text.count("\n") + 1
+            if rmin is not None and rmax is not None:
+                spans.append((rmin, rmax, line_no, line_no + row_lines - 1))
+            line_no += row_lines
+        self._oracle_render_cache[key] = (oracle, lines, spans)
+        return lines, spans
+
+    def _display_oracle(
+        self,
+        oracle: dict[str, Any],
+        highlight_roll: int | None = None,
+        cursed: bool = False,
+    ) -> None:
+        """Show *oracle*; the text is only rewritten when the table changes, otherwise
+        just the highlighted rows move."""
+        lines, spans = self._render_oracle(oracle, cursed)
+        txt = self._oracle_text
+        shown = (id(oracle), cursed)
+        if shown != self._oracle_shown:
+            name = ("☠  " + oracle["name"]) if cursed else oracle["name"]
+            self._oracle_title_var.set(f"{name}  —  {oracle['category']}")
+            set_text_lines(txt, lines)
+            self._oracle_shown = shown
+            self._oracle_highlight = []
+
+        for first, last in self._oracle_highlight:
+            txt.tag_remove("strong", f"{first}.0", f"{last + 1}.0")
+            txt.tag_add("body", f"{first}.0", f"{last + 1}.0")
+        self._oracle_highlight = []
+        if highlight_roll is None:
+            return
+        for rmin, rmax, first, last in spans:
+            if rmin <= highlight_roll <= rmax:
+                # "body" is configured after "strong" and would win, so swap the tags.
+                txt.tag_remove("body", f"{first}.0", f"{last + 1}.0")
+                txt.tag_add("strong", f"{first}.0", f"{last + 1}.0")
+                self._oracle_highlight.append((first, last))
+        if self._oracle_highlight:
+            txt.see(f"{self._oracle_highlight[0][0]}.0")
 
     def _roll_oracle(self) -> None:
         if self._current_oracle is None:
             return
-        roll = random.randint(1, 100)
-        cursed = False
-        cursed_roll_str = ""
+        die_str = self._cursed_die_var.get()
+        die_sides = 0
+        cursed_table = None
         if self._cursed_enabled_var.get() and self._current_oracle.get("cursed_version"):
-            die_str = self._cursed_die_var.get()
             die_sides = int(die_str[1:])
-            cursed_roll = random.randint(1, die_sides)
-            cursed = cursed_roll == die_sides
-            cursed_roll_str = f"  |  ☠ {die_str}: {cursed_roll}{'  → CURSED!' if cursed else ''}"
-        display_oracle = self._current_oracle
-        if cursed:
-            co = getattr(self, '_oracle_by_id', {}).get(self._current_oracle["cursed_version"])
-            if co:
-                display_oracle = co
-        matching = next(
-            (row["text"] for row in display_oracle.get("rows", [])
-             if row.get("min") is not None and row["min"] <= roll <= row["max"]),
-            ""
-        )
-        if self._is_roll_twice_result(matching):
-            matching = self._resolve_oracle_roll_text(display_oracle)
-        self._roll_result_var.set(f"Rolled {roll}  →  {matching}{cursed_roll_str}")
+            cursed_table = getattr(self, '_oracle_by_id', {}).get(self._current_oracle["cursed_version"])
+        result, display_oracle = roll_table(self._current_oracle, cursed_table, die_sides)
+        cursed = result["cursed"]
+        cursed_roll_str = ""
+        if result["cursed_roll"] is not None:
+            cursed_roll_str = f"  |  ☠ {die_str}: {result['cursed_roll']}{'  → CURSED!' if cursed else ''}"
+        roll = result["roll"]
+        self._roll_result_var.set(f"Rolled {roll}  →  {result['result']}{cursed_roll_str}")
         self._display_oracle(display_oracle, highlight_roll=roll, cursed=cursed)
@@ -58,4 +58,11 @@ class SettingsTabMixin:
             make_option_menu(panel, var, regions, width=16).grid(
                 row=row, column=1, sticky="w", pady=4
             )
-            row += 1
\ No newline at end of file
+            row += 1
+
+        self._settings_store.subscribe("regions", self._on_region_setting_changed)
+
+    def _on_region_setting_changed(self, game: str, region: str) -> None:
+        var = self._settings_region_vars.get(game)
+        if var is not None and var.get() != region:
+            var.set(region)
\ No newline at end of file
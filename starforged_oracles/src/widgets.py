@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Any
+from typing import Any, Callable, Hashable
 
 from styles import (
     ACCENT, ACCENT2, BG, BORDER, FG, HIT_MISS, HIT_STRONG, HIT_WEAK, PANEL_BG,
@@ -86,6 +86,128 @@ def make_listbox_frame(parent: tk.Widget) -> tuple[ttk.Frame, tk.Listbox]:
     return lf, lb
 
 
+class ListView:
+    """Keep a Listbox showing one label per record with as few Tk calls as possible.
+
+    ``set_records`` diffs the new labels against the rows already shown: the
+    common head and tail are left alone and the changed middle is replaced
+    with one ``delete`` and one batched ``insert``.  Labels are cached per
+    record (and per *variant*, for lists whose label format depends on a
+    filter).
+    """
+
+    def __init__(self, listbox: tk.Listbox, label_for: Callable[[Any, Hashable], str]) -> None:
+        self.listbox = listbox
+        self._label_for = label_for
+        self._labels: list[str] = []
+        self._label_cache: dict[tuple[int, Hashable], tuple[Any, str]] = {}
+
+    def _label(self, record: Any, variant: Hashable) -> str:
+        key = (id(record), variant)
+        cached = self._label_cache.get(key)
+        # Holding the record in the cache keeps its id() from being reused.
+        if cached is None or cached[0] is not record:
+            cached = (record, self._label_for(record, variant))
+            self._label_cache[key] = cached
+        return cached[1]
+
+    def forget_labels(self) -> None:
+        """Drop cached labels, e.g. after the underlying records were reloaded."""
+        self._label_cache.clear()
+
+    def set_records(self, records: list[Any], variant: Hashable = None) -> None:
+        new = [self._label(record, variant) for record in records]
+        old = self._labels
+        if new == old:
+            return
+
+        head = 0
+        limit = min(len(old), len(new))
+        while head < limit and old[head] == new[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+
+        if len(old) - tail > head:
+            self.listbox.delete(head, len(old) - tail - 1)
+        middle = new[head:len(new) - tail]
+        if middle:
+            self.listbox.insert(head, *middle)
+        self._labels = new
+
+
+class TickTrack:
+    """Ten progress boxes on a Canvas that fill by ticks (``max_ticks`` per track).
+
+    The box outlines and fill rectangles are created once.  ``set_ticks``
+    only moves the fills of boxes whose fill changed with ``coords()``, and the
+    boxes are laid out again only when the canvas is resized.
+    """
+
+    BOXES = 10
+    GAP = 4
+
+    def __init__(self, parent: tk.Misc, max_ticks: int = 40, height: int = 20) -> None:
+        self.canvas = tk.Canvas(parent, height=height, bg=PANEL_BG, highlightthickness=0, bd=0)
+        self.max_ticks = max_ticks
+        self.ticks = 0
+        self._size = (0, 0)
+        self._box_x: list[float] = [0.0] * self.BOXES
+        self._box_w = 0.0
+        self._box_y = 0.0
+        self._box_h = 0.0
+        self._fill_fracs: list[float] = [0.0] * self.BOXES
+        self._box_ids = [
+            self.canvas.create_rectangle(0, 0, 0, 0, outline=BORDER, width=1, fill=PANEL_BG)
+            for _ in range(self.BOXES)
+        ]
+        self._fill_ids = [
+            self.canvas.create_rectangle(0, 0, 0, 0, outline="", fill=ACCENT2, state="hidden")
+            for _ in range(self.BOXES)
+        ]
+        self.canvas.bind("<Configure>", lambda _e: self._layout())
+        self._layout()
+
+    def set_ticks(self, ticks: int) -> None:
+        ticks = max(0, min(self.max_ticks, ticks))
+        if ticks != self.ticks:
+            self.ticks = ticks
+            self._place_fills()
+
+    def _layout(self) -> None:
+        width = max(40, int(self.canvas.winfo_width()))
+        height = max(16, int(self.canvas.winfo_height()))
+        if (width, height) == self._size:
+            return
+        self._size = (width, height)
+        gap = self.GAP
+        self._box_w = box_w = max(8, (width - gap * (self.BOXES - 1)) / self.BOXES)
+        self._box_h = box_h = max(10, height - 4)
+        self._box_y = y = (height - box_h) / 2
+        for idx, box_id in enumerate(self._box_ids):
+            x = self._box_x[idx] = idx * (box_w + gap)
+            self.canvas.coords(box_id, x, y, x + box_w, y + box_h)
+        # Every fill depends on the box geometry, so place them all again.
+        self._fill_fracs = [-1.0] * self.BOXES
+        self._place_fills()
+
+    def _place_fills(self) -> None:
+        ticks_per_box = self.max_ticks // self.BOXES
+        for idx, fill_id in enumerate(self._fill_ids):
+            box_ticks = max(0, min(ticks_per_box, self.ticks - idx * ticks_per_box))
+            frac = box_ticks / ticks_per_box if ticks_per_box else 0
+            if frac == self._fill_fracs[idx]:
+                continue
+            self._fill_fracs[idx] = frac
+            if frac <= 0:
+                self.canvas.itemconfigure(fill_id, state="hidden")
+                continue
+            x, y = self._box_x[idx], self._box_y
+            self.canvas.coords(fill_id, x + 1, y + 1, x + 1 + (self._box_w - 2) * frac, y + self._box_h - 1)
+            self.canvas.itemconfigure(fill_id, state="normal")
+
+
 def make_textbox(parent: tk.Widget) -> tk.Text:
     """Create a styled read-only Text widget with a scrollbar; return the Text."""
     frame = ttk.Frame(parent, style="Panel.TFrame")
@@ -121,8 +243,12 @@ def set_text_lines(txt: tk.Text, lines: list[tuple[str, str]]) -> None:
     """Replace the contents of a Text widget with tagged lines."""
     txt.configure(state="normal")
     txt.delete("1.0", tk.END)
-    for tag, text in lines:
-        txt.insert(tk.END, text + "\n", tag)
+    if lines:
+        # One insert call with alternating text/tag arguments instead of one per line.
+        args: list[str] = []
+        for tag, text in lines:
+            args += (text + "\n", tag)
+        txt.insert(tk.END, *args)
     txt.configure(state="disabled")
     txt.see("1.0")
 
@@ -0,0 +1,77 @@
+import pytest
+
+import loader
+import starforged_app
+from file_watcher import DirectoryWatcher
+from loader import CUSTOM_ORACLES_SLOT, load_custom_oracle_file
+
+PACK = """\
+source: Custom
+oracles:
+- category: Test
+  name: Coin
+  id: custom/coin
+  rows:
+  - {min: 1, max: 50, text: Heads}
+  - {min: 51, max: 100, text: Tails}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _private_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(loader, "CACHE_PICKLE", tmp_path / "cache.pickle")
+
+
+def test_watcher_reports_added_changed_and_removed_files(tmp_path) -> None:
+    pack = tmp_path / "pack.yaml"
+    watcher = DirectoryWatcher(tmp_path)
+    assert watcher.poll() == []
+    pack.write_text(PACK, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    assert watcher.poll() == [pack]
+    assert watcher.poll() == []
+    pack.write_text(PACK + "# edited\n", encoding="utf-8")
+    assert watcher.poll() == [pack]
+    pack.unlink()
+    assert watcher.poll() == [pack]
+
+
+def test_valid_pack_loads_its_tables(tmp_path) -> None:
+    pack = tmp_path / "pack.yaml"
+    pack.write_text(PACK, encoding="utf-8")
+    (table,) = load_custom_oracle_file(pack)
+    assert table["oracle_id"] == "custom/coin"
+    assert [row["text"] for row in table["rows"]] == ["Heads", "Tails"]
+    assert load_custom_oracle_file(tmp_path / "gone.yaml") == []
+
+
+@pytest.mark.parametrize("content", [b"- a\n", b"hello\n", b"oracles: 5\n", b"oracles: [\n", b"\xff\xfe\x00bad"])
+def test_bad_pack_raises_value_error(tmp_path, content) -> None:
+    pack = tmp_path / "pack.yaml"
+    pack.write_bytes(content)
+    with pytest.raises(ValueError, match="pack.yaml"):
+        load_custom_oracle_file(pack)
+
+
+def test_polling_continues_after_a_failed_reload(tmp_path) -> None:
+    app = object.__new__(starforged_app.App)
+    app._custom_oracle_watcher = DirectoryWatcher(tmp_path)
+    app._loaded_slots = {CUSTOM_ORACLES_SLOT}
+    statuses, scheduled = [], []
+    app._show_status = lambda text, **_: statuses.append(text)
+    app.after = lambda ms, callback: scheduled.append(callback)
+
+    def reload(path):
+        raise RuntimeError("boom")
+
+    app._reload_oracle_file = reload
+    (tmp_path / "pack.yaml").write_text(PACK, encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        app._poll_custom_oracles()
+    assert scheduled == [app._poll_custom_oracles]
+
+    app._reload_oracle_file = lambda path: load_custom_oracle_file(path)
+    (tmp_path / "pack.yaml").write_text("oracles: 5\n", encoding="utf-8")
+    app._poll_custom_oracles()
+    assert len(scheduled) == 2
+    assert statuses and statuses[-1].startswith("Custom oracles not reloaded — pack.yaml")
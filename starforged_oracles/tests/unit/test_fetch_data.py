@@ -0,0 +1,99 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import fetch_data
+
+
+class _Mirror(BaseHTTPRequestHandler):
+    """Serves "<path>" as every file, with an ETag; paths in ``fail_once`` answer 503 first."""
+
+    requests: list[tuple[str, int]] = []
+    fail_once: set[str] = set()
+
+    def do_GET(self) -> None:
+        body = f"file: {self.path}\n".encode()
+        etag = f'"{len(body)}-{abs(hash(self.path))}"'
+        if self.path in self.fail_once:
+            self.fail_once.discard(self.path)
+            status = 503
+        elif self.headers.get("If-None-Match") == etag:
+            status = 304
+        else:
+            status = 200
+        self.requests.append((self.path, status))
+        self.send_response(status)
+        if status == 200:
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+        else:
+            self.send_header("Content-Length", "0")
+        self.end_headers()
+        if status == 200:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _path(url: str) -> str:
+    """The path part of *url*, e.g. "/a/b" for "http://host:port/a/b"."""
+    return "/" + url.split("/", 3)[3]
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    monkeypatch.setattr(fetch_data, "DATA_DIR", data)
+    for name in ("SF_ORACLES_DIR", "SI_ORACLES_DIR", "IS_ORACLES_DIR", "SF_ASSETS_DIR", "SI_ASSETS_DIR", "IS_ASSETS_DIR"):
+        monkeypatch.setattr(fetch_data, name, data / getattr(fetch_data, name).name)
+    monkeypatch.setattr(fetch_data, "MANIFEST_JSON", data / ".fetch_manifest.json")
+    monkeypatch.setattr(fetch_data, "BACKOFF", 0)
+    _Mirror.requests = []
+    _Mirror.fail_once = set()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Mirror)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/source_data"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fresh_fetch_writes_every_file_and_the_manifest(mirror) -> None:
+    assert fetch_data.fetch_all(mirror, connections=4) == []
+
+    jobs = fetch_data._jobs(mirror)
+    for _section, url, dest in jobs:
+        assert dest.read_text() == f"file: {_path(url)}\n"
+    assert not list(fetch_data.DATA_DIR.rglob("*.part"))
+    manifest = fetch_data._load_manifest()
+    assert len(manifest) == len(jobs)
+    assert all(entry["etag"] for entry in manifest.values())
+
+
+def test_unchanged_refetch_sends_conditional_requests(mirror, capsys) -> None:
+    fetch_data.fetch_all(mirror)
+    _Mirror.requests = []
+    capsys.readouterr()
+
+    assert fetch_data.fetch_all(mirror) == []
+
+    jobs = fetch_data._jobs(mirror)
+    assert sorted(status for _path, status in _Mirror.requests) == [304] * len(jobs)
+    assert f"0 updated, {len(jobs)} unchanged, 0 failed." in capsys.readouterr().out
+
+
+def test_server_error_is_retried(mirror) -> None:
+    _section, url, dest = fetch_data._jobs(mirror)[0]
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    path = _path(url)
+    _Mirror.fail_once = {path}
+
+    status, validators = fetch_data._download(url, dest, None)
+
+    assert status == "updated"
+    assert validators and validators["url"] == url
+    assert dest.read_text() == f"file: {path}\n"
+    assert [status for _path, status in _Mirror.requests] == [503, 200]
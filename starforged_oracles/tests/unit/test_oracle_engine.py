@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from oracle_engine import OracleEngine, compile_bundle, row_span, run_plan
+
+
+def _names(oracle_id, *names):
+    return {"oracle_id": oracle_id, "name": "Sample Names",
+            "rows": [{"min": i, "max": i, "text": name} for i, name in enumerate(names, 1)]}
+
+
+def test_pick_steps_roll_across_short_name_lists() -> None:
+    kind = {"oracle_id": "kind", "name": "Kind", "rows": [{"min": 1, "max": 100, "text": "Ice World"}]}
+    names = _names("ice/name", "Frost", "Rime", "Hoar")
+    bundle = {"id": "planet", "name": "Planet", "rolls": [
+        {"label": "Class", "oracle_id": "kind"},
+        {"label": "Name", "cascade_from": "Class", "cascade_map": {"Ice World": "ice/name"}, "pick": True},
+    ]}
+    plan = compile_bundle(bundle, {"kind": kind, "ice/name": names})
+    assert not plan.problems and row_span(names) == 3
+    rng = random.Random(5)
+    results = {run_plan(plan, rng=rng)[1]["rolls"][0]["result"] for _ in range(200)}
+    assert results == {"Frost", "Rime", "Hoar"}
+
+
+def test_bundle_names_shared_by_games_need_the_id() -> None:
+    bundles = [{"id": "sf_faction", "name": "Faction", "game": "Starforged"},
+               {"id": "si_faction", "name": "Faction", "game": "Sundered Isles"},
+               {"id": "sf_sector", "name": "Sector", "game": "Starforged"}]
+    engine = OracleEngine({"oracle_by_id": {}, "bundles": bundles})
+    assert engine.bundle("si_faction")["game"] == "Sundered Isles"
+    assert engine.bundle("Sector")["id"] == "sf_sector"
+    with pytest.raises(KeyError, match="sf_faction, si_faction"):
+        engine.bundle("Faction")
+    with pytest.raises(KeyError, match="Unknown bundle"):
+        engine.bundle("Outpost")
@@ -0,0 +1,21 @@
+from oracle_index import compile_tables
+from oracle_store import compact_oracles
+
+
+def _table(*rows):
+    return {"source": "Custom", "category": "Test", "name": "Test", "oracle_id": "custom/test",
+            "cursed_version": "", "rows": list(rows)}
+
+
+def test_quoted_bounds_are_coerced() -> None:
+    (table,) = compact_oracles([_table({"min": "1", "max": "50", "text": "low"},
+                                       {"min": "51", "max": "100", "text": "high"})])
+    compile_tables([table])
+    assert table["rows"][0]["min"] == 1 and table["rows"][1]["max"] == 100
+    assert table["roll_index"][50] == 0 and table["roll_index"][51] == 1
+
+
+def test_unusable_bounds_load_as_unranged_rows() -> None:
+    (table,) = compact_oracles([_table({"min": 1, "max": "lots", "text": "odd"},
+                                       {"min": [1], "max": 10 ** 12, "text": "odder"})])
+    assert [(row["min"], row["max"]) for row in table["rows"]] == [(1, None), (None, None)]
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+import character_store
+import debounced_writer
+import settings_store
+from character_store import CharacterStore
+from settings_store import SettingsStore
+
+
+@pytest.fixture(autouse=True)
+def _short_delay(monkeypatch) -> None:
+    monkeypatch.setattr(debounced_writer, "WRITE_DELAY", 0.05)
+
+
+def test_settings_changes_coalesce_into_one_write(monkeypatch) -> None:
+    saved = []
+    monkeypatch.setattr(settings_store, "save_settings", saved.append)
+    store = SettingsStore({})
+    seen = []
+    store.subscribe("regions", lambda key, value: seen.append((key, value)))
+    for region in ("Terminus", "Outlands", "Expanse"):
+        assert store.set("regions", "Starforged", region)
+    assert not store.set("regions", "Starforged", "Expanse")
+    store.close()
+    assert saved == [{"regions": {"Starforged": "Expanse"}}]
+    assert [value for _, value in seen] == ["Terminus", "Outlands", "Expanse"]
+
+
+def test_failed_settings_write_is_retried_on_close(monkeypatch) -> None:
+    saved = []
+
+    def save(settings):
+        if not saved:
+            saved.append(None)
+            raise OSError("disk full")
+        saved.append(settings)
+
+    monkeypatch.setattr(settings_store, "save_settings", save)
+    store = SettingsStore({})
+    store.set("character", "last_id", "a")
+    store._thread.join(0.3)
+    store.close()
+    assert saved == [None, {"character": {"last_id": "a"}}]
+
+
+def test_character_edits_are_journaled_then_compacted_on_close(tmp_path, monkeypatch) -> None:
+    journal = tmp_path / "user_characters.journal"
+    compacted = []
+    monkeypatch.setattr(character_store, "CHARACTERS_JOURNAL", journal)
+
+    def save(characters):
+        compacted.append([c["name"] for c in characters])
+        journal.unlink(missing_ok=True)
+
+    monkeypatch.setattr(character_store, "save_characters", save)
+    store = CharacterStore([{"id": "a", "name": "Kira"}])
+    store.put({"id": "a", "name": "Kira Vale"})
+    store.put({"id": "b", "name": "Orrin"})
+    store.delete("b")
+    store._thread.join(0.3)
+    lines = [json.loads(line) for line in journal.read_text(encoding="utf-8").splitlines()]
+    assert lines == [{"op": "put", "character": {"id": "a", "name": "Kira Vale"}}, {"op": "delete", "id": "b"}]
+    assert compacted == []
+    store.close()
+    assert compacted == [["Kira Vale"]] and not journal.exists()
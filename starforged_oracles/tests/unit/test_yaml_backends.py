@@ -0,0 +1,19 @@
+import pytest
+import yaml
+
+from loader import _EXTRACTORS, _data_files, _parse_yaml, _read_bytes
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(yaml, "CSafeLoader"), reason="PyYAML was built without libyaml"
+)
+
+
+@pytest.mark.parametrize(
+    ("path", "kind", "label"),
+    [pytest.param(path, kind, label, id=path.name) for path, kind, label, _slot in _data_files()],
+)
+def test_libyaml_extracts_the_same_data_as_pure_python(path, kind, label) -> None:
+    raw = _read_bytes(path)
+    pure = _EXTRACTORS[kind](_parse_yaml(raw, yaml.SafeLoader), label)
+    fast = _EXTRACTORS[kind](_parse_yaml(raw, yaml.CSafeLoader), label)
+    assert fast == pure